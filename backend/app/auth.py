@@ -1,7 +1,10 @@
+import asyncio
 import os
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 import bcrypt
 import jwt
@@ -16,6 +19,31 @@ COOKIE_SAMESITE = os.getenv("JIRA_LITE_COOKIE_SAMESITE", "lax").lower()
 
 BCRYPT_ROUNDS = int(os.getenv("JIRA_LITE_BCRYPT_ROUNDS", "12"))
 
+# bcrypt runs on its own small pool (the C extension releases the GIL, so threads scale across cores)
+# instead of the shared request threadpool; callers await it on the event loop, so a waiting login
+# holds no request thread. At most WORKERS + QUEUE hashes may be in flight; beyond that,
+# login/register fail fast with 503.
+BCRYPT_WORKERS = int(os.getenv("JIRA_LITE_BCRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
+BCRYPT_QUEUE = int(os.getenv("JIRA_LITE_BCRYPT_QUEUE", "16"))
+
+_bcrypt_pool = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+_bcrypt_slots = threading.BoundedSemaphore(BCRYPT_WORKERS + BCRYPT_QUEUE)
+
+T = TypeVar("T")
+
+
+async def _run_bcrypt(fn: Callable[..., T], *args: Any) -> T:
+    if not _bcrypt_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return await asyncio.wrap_future(_bcrypt_pool.submit(fn, *args))
+    finally:
+        _bcrypt_slots.release()
+
 
 def _password_bytes_for_bcrypt(password: str) -> bytes:
     """
@@ -29,20 +57,37 @@ def _password_bytes_for_bcrypt(password: str) -> bytes:
     return raw
 
 
-def hash_password(password: str) -> str:
+async def hash_password(password: str) -> str:
     password_bytes = _password_bytes_for_bcrypt(password)
-    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    hashed = await _run_bcrypt(bcrypt.hashpw, password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
     return hashed.decode("utf-8")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     password_bytes = _password_bytes_for_bcrypt(plain_password)
     try:
-        return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+        return await _run_bcrypt(bcrypt.checkpw, password_bytes, hashed_password.encode("utf-8"))
     except ValueError:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when a stored hash was made with a cost other than the configured BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (AttributeError, IndexError, ValueError):
+        return True
+
+
+def is_locked(locked_until: Optional[datetime], now: Optional[datetime] = None) -> bool:
+    """Whether a lockout is still running; SQLite hands `locked_until` back naive (it is stored as UTC)."""
+    if locked_until is None:
+        return False
+    if locked_until.tzinfo is None:
+        locked_until = locked_until.replace(tzinfo=timezone.utc)
+    return locked_until > (now or datetime.now(timezone.utc))
+
+
 def _expiry(delta: timedelta) -> datetime:
     return datetime.now(timezone.utc) + delta
 
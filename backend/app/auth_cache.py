@@ -0,0 +1,117 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, Optional
+
+from .models import User
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("JIRA_LITE_AUTH_CACHE_TTL", "30"))
+AUTH_CACHE_SIZE = int(os.getenv("JIRA_LITE_AUTH_CACHE_SIZE", "1024"))
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache with per-entry expiry and hit/miss counters; safe across worker threads."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING or entry[0] <= now:
+                if entry is not _MISSING:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+# Verified access-token payloads keyed by the raw token, and active-user snapshots keyed by user_id.
+token_cache = TTLCache(AUTH_CACHE_SIZE, AUTH_CACHE_TTL_SECONDS)
+user_cache = TTLCache(AUTH_CACHE_SIZE, AUTH_CACHE_TTL_SECONDS)
+
+_USER_COLUMNS = [column.key for column in User.__table__.columns]
+
+
+def cache_token_payload(token: str, payload: Dict[str, Any]) -> None:
+    exp = payload.get("exp")
+    ttl = None
+    if isinstance(exp, (int, float)):
+        ttl = exp - datetime.now(timezone.utc).timestamp()
+    token_cache.set(token, payload, ttl)
+
+
+def cache_user(user: User) -> None:
+    user_cache.set(user.user_id, {key: getattr(user, key) for key in _USER_COLUMNS})
+
+
+def cached_user(user_id: str) -> Optional[User]:
+    """Return a detached copy of the cached user so callers never share ORM state across requests."""
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    return User(**snapshot)
+
+
+def invalidate_user(user_id: str) -> None:
+    """
+    Drop a user's cached record; call whenever is_active, failed_attempts or locked_until change.
+
+    Other workers drop theirs when the invalidation reaches them through the live-sync broadcast
+    backend (outside the event stream), so running several workers needs
+    `JIRA_LITE_BROADCAST_BACKEND=sqlite` just like live sync.
+    """
+    from .realtime import publish_user_invalidation  # imported here to avoid circulars
+
+    user_cache.invalidate(user_id)
+    publish_user_invalidation(user_id)
+
+
+def cache_stats() -> Dict[str, Any]:
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
@@ -0,0 +1,96 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import Response
+
+from .db import ReadSession
+from .serialization import json_list_response, rows_json
+
+T = TypeVar("T")
+
+READ_COALESCING = os.getenv("JIRA_LITE_READ_COALESCING", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+class SingleFlight:
+    """
+    Run one computation per key at a time; concurrent callers with the same key await that result.
+
+    The shared work runs in its own task, so a caller that disconnects does not cancel it for the
+    others; it must therefore not use anything scoped to one caller's request (see
+    `coalesced_list`). Nothing is cached once the task finishes.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.get_running_loop().create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here so an error nobody awaited is not logged as lost
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": READ_COALESCING,
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# Read routes return the same data to every signed-in user, so one flight can serve all of them.
+read_flights = SingleFlight()
+
+
+def coalescing_stats() -> Dict[str, Any]:
+    return read_flights.stats()
+
+
+async def coalesced_list(
+    response: Response,
+    key: str,
+    db: ReadSession,
+    load: Callable[[ReadSession], Awaitable[Tuple[Sequence[Any], Optional[str]]]],
+    fields: Optional[Sequence[str]] = None,
+) -> Response:
+    """
+    Load and encode a list response once for all concurrent requests with the same `key`.
+
+    `key` must cover the route, its normalized query parameters and the data version: the list
+    ETag does. `load` returns `(rows, next_cursor)` with rows selected through `read_columns`;
+    `fields` limits the encoded keys (see `requested_fields`).
+
+    `load` gets the session to read from. A shared flight opens its own (`db.detached()`), since
+    it outlives the request that started it when that client disconnects, and the request's
+    session is closed with the request. The request's connection (held since the ETag read) is
+    released first, so each request holds at most one pooled connection at a time.
+    """
+
+    async def render() -> Tuple[bytes, Optional[str]]:
+        async with db.detached() as own:
+            rows, next_cursor = await load(own)
+        return rows_json(rows, fields), next_cursor
+
+    if READ_COALESCING:
+        await db.release()
+        body, next_cursor = await read_flights.run(key, render)
+    else:
+        rows, next_cursor = await load(db)
+        body = rows_json(rows, fields)
+    return json_list_response(response, body, next_cursor)
@@ -1,31 +1,336 @@
+import importlib.util
 import os
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, Iterator, Mapping, Optional, Sequence, TypeVar
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, func, inspect, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateColumn, CreateIndex
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
 
 DATABASE_URL = os.getenv("JIRA_LITE_DATABASE_URL", "sqlite:///./db/app.db")
 
+# Named SQLite connection profiles. Every pragma can be overridden individually through
+# `JIRA_LITE_SQLITE_<PRAGMA>` (e.g. `JIRA_LITE_SQLITE_SYNCHRONOUS=FULL`).
+# - performance: WAL so readers never block the writer, NORMAL sync (fsync on checkpoint only).
+# - durable: WAL with a full fsync on every commit.
+# - off: SQLite defaults (rollback journal), no pragmas applied.
+SQLITE_PROFILES: Dict[str, Dict[str, object]] = {
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -65536,  # negative = KiB, i.e. 64 MiB page cache per connection
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -16384,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    "off": {},
+}
+
+_PRAGMA_CHOICES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+_PRAGMA_INTS = {"busy_timeout", "cache_size", "mmap_size"}
+# journal_mode must be set before anything else touches the database file.
+_PRAGMA_ORDER = ["journal_mode", "busy_timeout", "synchronous", "cache_size", "mmap_size", "temp_store"]
+
+
+def sqlite_pragmas(env: Optional[Mapping[str, str]] = None) -> Dict[str, object]:
+    """Resolve the SQLite pragmas for the configured profile plus per-pragma env overrides."""
+    env = os.environ if env is None else env
+    profile = env.get("JIRA_LITE_SQLITE_PROFILE", "performance").strip().lower()
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"invalid JIRA_LITE_SQLITE_PROFILE '{profile}', expected one of: {', '.join(SQLITE_PROFILES)}"
+        )
+    pragmas = dict(SQLITE_PROFILES[profile])
+    for name in _PRAGMA_ORDER:
+        raw = env.get(f"JIRA_LITE_SQLITE_{name.upper()}")
+        if raw is None or raw.strip() == "":
+            continue
+        if name in _PRAGMA_INTS:
+            try:
+                pragmas[name] = int(raw)
+            except ValueError:
+                raise ValueError(f"JIRA_LITE_SQLITE_{name.upper()} must be an integer")
+        else:
+            value = raw.strip().upper()
+            if value not in _PRAGMA_CHOICES[name]:
+                raise ValueError(
+                    f"invalid JIRA_LITE_SQLITE_{name.upper()} '{raw}', expected one of: "
+                    f"{', '.join(sorted(_PRAGMA_CHOICES[name]))}"
+                )
+            pragmas[name] = value
+    return {name: pragmas[name] for name in _PRAGMA_ORDER if name in pragmas}
+
+
+def configure_sqlite_engine(target: Engine, pragmas: Mapping[str, object]) -> None:
+    """Apply `pragmas` to every new DBAPI connection opened by `target`."""
+    if not pragmas:
+        return
+
+    @event.listens_for(target, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def describe_sqlite(target: Engine) -> Dict[str, object]:
+    """Read back the effective pragma values from a live connection (for startup logging)."""
+    with target.connect() as conn:
+        return {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in _PRAGMA_ORDER
+        }
+
+
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+SQLITE_PROFILE = os.getenv("JIRA_LITE_SQLITE_PROFILE", "performance").strip().lower()
+SQLITE_PRAGMAS = sqlite_pragmas() if IS_SQLITE else {}
+
 # `check_same_thread=False` allows usage across threads (FastAPI default).
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+connect_args = {"check_same_thread": False} if IS_SQLITE else {}
 engine = create_engine(DATABASE_URL, connect_args=connect_args)
+configure_sqlite_engine(engine, SQLITE_PRAGMAS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def init_db(run_seed: bool = True) -> None:
-    """Create database tables and optionally run seed routines."""
-    from .models import Base  # imported here to avoid circulars
+def _async_database_url(url: str) -> Optional[str]:
+    if url.startswith("sqlite+aiosqlite"):
+        return url
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return None
+
+
+# Optional async engine (aiosqlite) for read-heavy routes so they do not occupy AnyIO threadpool slots.
+# Enabled by default when aiosqlite is installed; `JIRA_LITE_ASYNC_DB=false` falls back to the threadpool.
+ASYNC_DATABASE_URL = os.getenv("JIRA_LITE_ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+ASYNC_DB_ENABLED = (
+    os.getenv("JIRA_LITE_ASYNC_DB", "true").lower() == "true"
+    and ASYNC_DATABASE_URL is not None
+    and importlib.util.find_spec("aiosqlite") is not None
+    and importlib.util.find_spec("greenlet") is not None
+)
+
+async_engine = None
+AsyncSessionLocal = None
+if ASYNC_DB_ENABLED:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, connect_args=connect_args)
+    configure_sqlite_engine(async_engine.sync_engine, SQLITE_PRAGMAS)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+class ReadSession(ABC):
+    """
+    Read-only session handle for `async def` routes.
+
+    ORM query code is written once against a sync `Session` and executed through `run`, either on the
+    async engine (no threadpool slot) or in the threadpool when the async engine is unavailable.
+    """
+
+    @abstractmethod
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call `fn(session, *args, **kwargs)` with a sync `Session` and return its result."""
+
+    @abstractmethod
+    async def release(self) -> None:
+        """Give the pooled connection back; the session checks one out again if it is used later."""
+
+    @abstractmethod
+    def detached(self) -> AsyncContextManager["ReadSession"]:
+        """
+        A new session of the same kind on the same database, owned by the caller rather than by
+        this request: work shared between requests must not use a session a request will close.
+        """
+
+
+class AsyncReadSession(ReadSession):
+    def __init__(self, session) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self.session.run_sync(fn, *args, **kwargs)
+
+    async def release(self) -> None:
+        await self.session.close()
+
+    @asynccontextmanager
+    async def detached(self) -> AsyncIterator[ReadSession]:
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        async with AsyncSession(self.session.bind, autoflush=False, expire_on_commit=False) as session:
+            yield AsyncReadSession(session)
+
+
+class ThreadedReadSession(ReadSession):
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+    async def release(self) -> None:
+        await run_in_threadpool(self.session.close)
+
+    @asynccontextmanager
+    async def detached(self) -> AsyncIterator[ReadSession]:
+        session = Session(bind=self.session.get_bind(), autoflush=False)
+        try:
+            yield ThreadedReadSession(session)
+        finally:
+            session.close()
+
+
+@contextmanager
+def read_snapshot(bind: Engine) -> Iterator[Session]:
+    """
+    Read-only session whose queries all see one snapshot of the database.
+
+    pysqlite runs SELECTs outside a transaction (each statement sees the latest commit), so the
+    transaction is opened explicitly; WAL keeps it from blocking writers while it is held.
+    """
+    with bind.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            conn.exec_driver_sql("BEGIN")
+        session = Session(bind=conn, autoflush=False)
+        try:
+            yield session
+        finally:
+            session.close()
+            conn.rollback()
+
+
+def ensure_columns(metadata, bind: Engine) -> None:
+    """Add columns declared on models that an existing table does not have yet."""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    with bind.begin() as conn:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                # SQLite can only add columns that are nullable or carry a server default.
+                if column.name in present or (not column.nullable and column.server_default is None):
+                    continue
+                ddl = CreateColumn(column).compile(dialect=bind.dialect)
+                conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN {ddl}')
+
+
+def _index_ddl(index, dialect) -> str:
+    return " ".join(str(CreateIndex(index).compile(dialect=dialect)).split())
+
+
+def ensure_indexes(metadata, bind: Engine, retired: Sequence[str] = ()) -> Dict[str, str]:
+    """
+    Create indexes declared on models that an existing database does not have yet. On SQLite an
+    index whose stored definition differs from the model (new columns, now partial) is dropped
+    and rebuilt under the same name, and `retired` indexes are dropped.
+    Returns `{index name: "created" | "rebuilt" | "dropped"}`.
+    """
+    changed: Dict[str, str] = {}
+    if bind.dialect.name != "sqlite":
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=bind, checkfirst=True)
+        return changed
+    with bind.begin() as conn:
+        stored = dict(
+            conn.exec_driver_sql(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            ).all()
+        )
+        for name in retired:
+            if name in stored:
+                conn.exec_driver_sql(f'DROP INDEX "{name}"')
+                changed[name] = "dropped"
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                current = stored.get(index.name)
+                if current is not None and " ".join(current.split()) == _index_ddl(index, bind.dialect):
+                    continue
+                if current is not None:
+                    conn.exec_driver_sql(f'DROP INDEX "{index.name}"')
+                index.create(bind=conn)
+                changed[index.name] = "rebuilt" if current is not None else "created"
+    return changed
+
+
+def backfill_normalized_columns(bind: Engine) -> None:
+    """Fill `*_norm` shadow columns that were added to a table with existing rows (see models.py)."""
+    from .models import NORMALIZED_COLUMNS, normalize_key  # imported here to avoid circulars
+
+    with bind.begin() as conn:
+        for model, columns in NORMALIZED_COLUMNS.items():
+            key = inspect(model).primary_key[0]
+            for source, shadow in columns.items():
+                source_column, shadow_column = getattr(model, source), getattr(model, shadow)
+                pending = select(key, source_column).where(
+                    shadow_column == "", func.coalesce(source_column, "") != ""
+                )
+                rows = conn.execute(pending).all()
+                for row_id, value in rows:
+                    conn.execute(update(model).where(key == row_id).values({shadow: normalize_key(value)}))
+
+
+def _init_db_once(run_seed: bool) -> None:
+    from .models import RETIRED_INDEXES, Base  # imported here to avoid circulars
 
     Base.metadata.create_all(bind=engine)
+    ensure_columns(Base.metadata, engine)
+    ensure_indexes(Base.metadata, engine, RETIRED_INDEXES)
+    backfill_normalized_columns(engine)
 
     if not run_seed:
         return
 
     from .seed import seed_phases  # imported here to avoid circulars
     from .sample_seed import seed_sample_data
+    from .rollups import ensure_rollups
+    from .search import ensure_search_index
 
     with SessionLocal() as session:
         seed_phases(session)
         seed_sample_data(session)
+        ensure_rollups(session)
+        ensure_search_index(session)
+
+
+def init_db(run_seed: bool = True, attempts: int = 3) -> None:
+    """Create database tables and optionally run seed routines."""
+    for attempt in range(1, attempts + 1):
+        try:
+            _init_db_once(run_seed)
+            return
+        except (OperationalError, IntegrityError):
+            # Another worker (`uvicorn --workers N`) is creating the same schema or seed rows;
+            # every step is idempotent, so retry once it has finished.
+            if attempt == attempts:
+                raise
+            time.sleep(0.5 * attempt)
 
 
 def get_session():
@@ -34,3 +339,23 @@ def get_session():
         yield db
     finally:
         db.close()
+
+
+async def get_read_session() -> AsyncIterator[ReadSession]:
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            yield AsyncReadSession(session)
+        return
+    db = SessionLocal()
+    try:
+        yield ThreadedReadSession(db)
+    finally:
+        db.close()
+
+
+# Registers the before_flush listener that stamps `data_version` on every tracked write.
+from . import versioning  # noqa: E402,F401
+# Registers the after_flush listener that keeps solution/project rollups current.
+from . import rollups  # noqa: E402,F401
+# Registers the FTS5 table and the triggers that keep it in sync (created with the schema).
+from . import search  # noqa: E402,F401
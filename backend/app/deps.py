@@ -1,11 +1,11 @@
-from datetime import datetime, timezone
-from typing import Iterator
+from typing import AsyncIterator, Iterator, Optional
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, WebSocket, status
 from sqlalchemy.orm import Session
 
-from .auth import decode_token
-from .db import get_session
+from .auth import decode_token, is_locked
+from .auth_cache import cache_token_payload, cache_user, cached_user, token_cache
+from .db import ReadSession, get_read_session, get_session
 from .models import User
 
 
@@ -13,25 +13,63 @@ def get_db() -> Iterator[Session]:
     yield from get_session()
 
 
-def require_user(request: Request, session: Session = Depends(get_db)) -> User:
-    token = request.cookies.get("access_token")
+async def get_read_db() -> AsyncIterator[ReadSession]:
+    async for db in get_read_session():
+        yield db
+
+
+def _load_user(session: Session, user_id: str) -> Optional[User]:
+    return session.query(User).filter(User.user_id == user_id).first()
+
+
+async def authenticate(token: Optional[str], db: ReadSession) -> User:
+    """The active, unlocked user of an access token; 401/423 otherwise."""
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
-    payload = decode_token(token, expected_type="access")
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = decode_token(token, expected_type="access")
+        cache_token_payload(token, payload)
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject")
-    user = session.query(User).filter(User.user_id == user_id).first()
+    user = cached_user(user_id)
+    if user is None:
+        user = await db.run(_load_user, user_id)
+        if user and user.is_active:
+            cache_user(user)
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User inactive or missing")
-    if user.locked_until and user.locked_until > datetime.now(timezone.utc):
+    if is_locked(user.locked_until):
         raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="Account locked")
+    return user
+
+
+async def require_user(request: Request, db: ReadSession = Depends(get_read_db)) -> User:
+    """Async so a cache hit costs no threadpool slot; a miss reads through the request's ReadSession."""
+    user = await authenticate(request.cookies.get("access_token"), db)
     request.state.user = user
     return user
 
 
+async def socket_user(ws: WebSocket, db: ReadSession = Depends(get_read_db)) -> Optional[User]:
+    """The signed-in user of a live-sync socket (same checks as `require_user`), or None."""
+    # A socket lives for hours: read on a session of its own so none stays checked out meanwhile.
+    async with db.detached() as own:
+        try:
+            return await authenticate(ws.cookies.get("access_token"), own)
+        except HTTPException:
+            return None
+
+
 def current_user(request: Request) -> User:
     user = getattr(request.state, "user", None)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
     return user
+
+
+def require_admin(user: User = Depends(current_user)) -> User:
+    if getattr(user, "role", None) != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
+    return user
@@ -0,0 +1,62 @@
+import hashlib
+from typing import Iterable, Optional, Sequence
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .versioning import current_versions
+
+# `no-cache` lets browsers keep the body but revalidate with If-None-Match on every fetch.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def request_key(request: Request) -> str:
+    """Path plus sorted query parameters, so equivalent requests share an ETag."""
+    return f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+
+
+def list_etag(session: Session, tables: Sequence[str], key: str) -> str:
+    """ETag for a list response that depends only on `tables` and the request parameters."""
+    versions = current_versions(session, tables)
+    return make_etag(key, *(f"{table}={versions[table]}" for table in tables))
+
+
+def row_etag(session: Session, model, key: str, *criteria) -> Optional[str]:
+    """ETag for a single row from its `updated_at`/`data_version`; None when no row matches."""
+    row = session.execute(select(model.updated_at, model.data_version).where(*criteria)).first()
+    if row is None:
+        return None
+    return make_etag(key, row.updated_at.isoformat() if row.updated_at else "", row.data_version)
+
+
+def _etag_values(header: str) -> Iterable[str]:
+    for value in header.split(","):
+        value = value.strip()
+        if value.startswith("W/"):
+            value = value[2:]
+        if value:
+            yield value
+
+
+def not_modified(request: Request, response: Response, etag: Optional[str]) -> Optional[Response]:
+    """
+    Set validator headers on `response`; return a 304 response when `If-None-Match` already matches.
+    """
+    if etag is None:
+        return None
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    header = request.headers.get("if-none-match")
+    if header and any(value in ("*", etag) for value in _etag_values(header)):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+    return None
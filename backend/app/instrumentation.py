@@ -0,0 +1,163 @@
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+SQL_PROFILING_ENABLED = os.getenv("JIRA_LITE_SQL_PROFILING", "true").lower() == "true"
+N_PLUS_ONE_THRESHOLD = int(os.getenv("JIRA_LITE_N_PLUS_ONE_THRESHOLD", "10"))
+# Ring buffer of recent request profiles; 0 (default) keeps nothing.
+PROFILE_BUFFER_SIZE = int(os.getenv("JIRA_LITE_PROFILE_BUFFER_SIZE", "0"))
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_START_TIMES_KEY = "jira_lite_statement_starts"
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions with different parameters compare equal."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+class RequestProfile:
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.started_at = datetime.now(timezone.utc)
+        self.status_code: Optional[int] = None
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.shapes: Counter = Counter()
+        self._start = time.perf_counter()
+        self.duration = 0.0
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statement_count += 1
+        self.db_time += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> Dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count > threshold}
+
+    def server_timing(self) -> str:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        return (
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.statement_count} queries", '
+            f"app;dur={elapsed_ms:.2f}"
+        )
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self._start
+
+    def to_dict(self) -> dict:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration * 1000, 3),
+            "statement_count": self.statement_count,
+            "db_time_ms": round(self.db_time * 1000, 3),
+            "top_statements": [
+                {"statement": shape, "count": count} for shape, count in self.shapes.most_common(5)
+            ],
+        }
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("jira_lite_request_profile", default=None)
+_recent_lock = threading.Lock()
+_recent: Optional[Deque[dict]] = deque(maxlen=PROFILE_BUFFER_SIZE) if PROFILE_BUFFER_SIZE > 0 else None
+
+
+def set_profile_buffer_size(size: int) -> None:
+    """Resize (or with 0, disable) the recent-profile ring buffer."""
+    global _recent
+    with _recent_lock:
+        if size <= 0:
+            _recent = None
+        else:
+            _recent = deque(_recent or (), maxlen=size)
+
+
+def recent_profiles(limit: Optional[int] = None) -> List[dict]:
+    with _recent_lock:
+        items = list(_recent or ())
+    items.reverse()  # newest first
+    return items[:limit] if limit else items
+
+
+def profile_buffer_capacity() -> int:
+    return _recent.maxlen if _recent is not None else 0
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is None:
+        return
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    starts = conn.info.get(_START_TIMES_KEY)
+    if profile is None or not starts:
+        return
+    profile.record(statement, time.perf_counter() - starts.pop())
+
+
+def _finish_profile(profile: RequestProfile) -> None:
+    profile.finish()
+    for shape, count in profile.repeated_shapes(N_PLUS_ONE_THRESHOLD).items():
+        logger.warning(
+            "Possible N+1 in %s %s: statement ran %d times: %s",
+            profile.method,
+            profile.path,
+            count,
+            shape[:300],
+        )
+    with _recent_lock:
+        if _recent is not None:
+            _recent.append(profile.to_dict())
+
+
+class SQLProfilingMiddleware:
+    """
+    Track statement count and DB time per HTTP request and emit a `Server-Timing` header.
+
+    Pure ASGI (not BaseHTTPMiddleware) so streaming responses are not buffered.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SQL_PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope.get("method", ""), scope.get("path", ""))
+        token = _current_profile.set(profile)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", profile.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            _finish_profile(profile)
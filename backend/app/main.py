@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+import logging
 import os
 import sys
 import asyncio
@@ -8,9 +9,24 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
-from .db import init_db
+from .db import (
+    IS_SQLITE,
+    SQLITE_PRAGMAS,
+    SQLITE_PROFILE,
+    SessionLocal,
+    async_engine,
+    describe_sqlite,
+    engine,
+    init_db,
+)
+from . import realtime
+from .rag_scheduler import AUTO_RAG_SCHEDULER, scheduler as auto_rag_scheduler
+from .instrumentation import SQLProfilingMiddleware
 from .routes import api_router
 
+# Uvicorn only configures its own loggers; log through it so startup details show up in the console.
+logger = logging.getLogger("uvicorn.error")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,7 +61,21 @@ async def lifespan(app: FastAPI):
 
     if not disable_startup and not running_tests:
         init_db()
+        if IS_SQLITE:
+            logger.info(
+                "SQLite profile '%s': requested %s, effective %s",
+                SQLITE_PROFILE,
+                SQLITE_PRAGMAS or "defaults",
+                describe_sqlite(engine),
+            )
+    await realtime.start()
+    if AUTO_RAG_SCHEDULER and not disable_startup and not running_tests:
+        await auto_rag_scheduler.start(SessionLocal)
     yield
+    await auto_rag_scheduler.stop()
+    await realtime.stop()
+    if async_engine is not None:
+        await async_engine.dispose()
     if keepalive_task:
         keepalive_task.cancel()
         with suppress(asyncio.CancelledError):
@@ -53,6 +83,7 @@ async def lifespan(app: FastAPI):
 
 
 app = FastAPI(title="Jira-lite API", version="0.1.0", lifespan=lifespan)
+app.add_middleware(SQLProfilingMiddleware)
 
 # API under /api to avoid collisions with static frontend
 app.include_router(api_router, prefix="/api")
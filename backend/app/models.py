@@ -13,6 +13,8 @@ from sqlalchemy import (
     String,
     UniqueConstraint,
     Index,
+    event,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -24,6 +26,15 @@ class Base(DeclarativeBase):
     pass
 
 
+def _live_index(name: str, *columns: str) -> Index:
+    """
+    Partial index over live rows (`WHERE deleted_at IS NULL`), which every list query filters on;
+    soft-deleted rows cost nothing to store or skip. `db.ensure_indexes` rebuilds ones whose
+    definition changed; `python -m backend.explain_queries` (`query_plans.query_plan_report`) checks the list queries use them.
+    """
+    return Index(name, *columns, sqlite_where=text("deleted_at IS NULL"))
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
@@ -32,8 +43,14 @@ class TimestampMixin:
 
 
 class SoftDeleteMixin:
-    deleted_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, nullable=True, index=True
+    # Not indexed on its own: live-row queries use the partial `_live_index` indexes instead.
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class DataVersionMixin:
+    # Global change version stamped on every write (see versioning.py); drives GET /api/changes.
+    data_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0", index=True
     )
 
 
@@ -77,9 +94,47 @@ class ChangeLog(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
 
-class Project(TimestampMixin, SoftDeleteMixin, Base):
+class SyncVersion(Base):
+    """Monotonic change counters: the `global` row plus the last global version per tracked table."""
+
+    __tablename__ = "sync_versions"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class RealtimeEvent(Base):
+    """Live-sync events shared between worker processes by the `sqlite` broadcast backend."""
+
+    __tablename__ = "realtime_events"
+
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    origin: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class UserCacheInvalidation(Base):
+    """Auth-cache invalidations relayed between worker processes by the `sqlite` broadcast backend."""
+
+    __tablename__ = "user_cache_invalidations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    origin: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class Project(TimestampMixin, SoftDeleteMixin, DataVersionMixin, Base):
     __tablename__ = "projects"
-    __table_args__ = (UniqueConstraint("project_name", name="uix_project_name"),)
+    __table_args__ = (
+        UniqueConstraint("project_name", name="uix_project_name"),
+        # Keyset pagination order for list_projects, unfiltered and per filter column.
+        _live_index("idx_projects_live_created_id", "created_at", "project_id"),
+        _live_index("idx_projects_status_live_created_id", "status", "created_at", "project_id"),
+        # People filters: normalized shadow column (see NORMALIZED_COLUMNS), then the list order.
+        _live_index("idx_projects_sponsor_norm_live_created_id", "sponsor_norm", "created_at", "project_id"),
+    )
 
     project_id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid4())
@@ -92,10 +147,11 @@ class Project(TimestampMixin, SoftDeleteMixin, Base):
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     success_criteria: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     sponsor: Mapped[str] = mapped_column(String, nullable=False, default="")
+    sponsor_norm: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
     user_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
 
 
-class Solution(TimestampMixin, SoftDeleteMixin, Base):
+class Solution(TimestampMixin, SoftDeleteMixin, DataVersionMixin, Base):
     __tablename__ = "solutions"
     __table_args__ = (
         UniqueConstraint(
@@ -104,6 +160,38 @@ class Solution(TimestampMixin, SoftDeleteMixin, Base):
             "version",
             name="uix_solution_project_name_version",
         ),
+        # Keyset pagination order (priority, created_at, pk) for global and per-project lists, and
+        # for the status filter; a priority filter rides on the first index.
+        _live_index("idx_solutions_live_priority_created_id", "priority", "created_at", "solution_id"),
+        _live_index(
+            "idx_solutions_project_live_priority_created_id",
+            "project_id",
+            "priority",
+            "created_at",
+            "solution_id",
+        ),
+        _live_index(
+            "idx_solutions_status_live_priority_created_id",
+            "status",
+            "priority",
+            "created_at",
+            "solution_id",
+        ),
+        # People filters: normalized shadow columns (see NORMALIZED_COLUMNS), then the list order.
+        _live_index(
+            "idx_solutions_owner_norm_live_priority_created_id",
+            "owner_norm",
+            "priority",
+            "created_at",
+            "solution_id",
+        ),
+        _live_index(
+            "idx_solutions_assignee_norm_live_priority_created_id",
+            "assignee_norm",
+            "priority",
+            "created_at",
+            "solution_id",
+        ),
     )
 
     solution_id: Mapped[str] = mapped_column(
@@ -131,6 +219,8 @@ class Solution(TimestampMixin, SoftDeleteMixin, Base):
     success_criteria: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     owner: Mapped[str] = mapped_column(String, nullable=False, default="")
     assignee: Mapped[str] = mapped_column(String, nullable=False, default="", index=True)
+    owner_norm: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
+    assignee_norm: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
     approver: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     key_stakeholder: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     blockers: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -148,7 +238,7 @@ class Phase(TimestampMixin, Base):
     sequence: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
 
 
-class SolutionPhase(TimestampMixin, Base):
+class SolutionPhase(TimestampMixin, DataVersionMixin, Base):
     __tablename__ = "solution_phases"
     __table_args__ = (
         UniqueConstraint("solution_id", "phase_id", name="uix_solution_phase"),
@@ -169,12 +259,49 @@ class SolutionPhase(TimestampMixin, Base):
     )
 
 
-class Subcomponent(TimestampMixin, SoftDeleteMixin, Base):
+class Subcomponent(TimestampMixin, SoftDeleteMixin, DataVersionMixin, Base):
     __tablename__ = "subcomponents"
     __table_args__ = (
         UniqueConstraint(
             "solution_id", "subcomponent_name", name="uix_subcomponent_solution_name"
         ),
+        # Keyset pagination order (priority, created_at, pk) for global, per-solution and
+        # per-project lists and the status filter; these also serve the rollup aggregates.
+        _live_index(
+            "idx_subcomponents_live_priority_created_id",
+            "priority",
+            "created_at",
+            "subcomponent_id",
+        ),
+        _live_index(
+            "idx_subcomponents_solution_live_priority_created_id",
+            "solution_id",
+            "priority",
+            "created_at",
+            "subcomponent_id",
+        ),
+        _live_index(
+            "idx_subcomponents_project_live_priority_created_id",
+            "project_id",
+            "priority",
+            "created_at",
+            "subcomponent_id",
+        ),
+        _live_index(
+            "idx_subcomponents_status_live_priority_created_id",
+            "status",
+            "priority",
+            "created_at",
+            "subcomponent_id",
+        ),
+        # People filters: normalized shadow column (see NORMALIZED_COLUMNS), then the list order.
+        _live_index(
+            "idx_subcomponents_assignee_norm_live_priority_created_id",
+            "assignee_norm",
+            "priority",
+            "created_at",
+            "subcomponent_id",
+        ),
     )
 
     subcomponent_id: Mapped[str] = mapped_column(
@@ -194,4 +321,93 @@ class Subcomponent(TimestampMixin, SoftDeleteMixin, Base):
     due_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     assignee: Mapped[str] = mapped_column(String, nullable=False, default="")
+    assignee_norm: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
     user_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+
+
+class SolutionRollup(Base):
+    """Per-solution subcomponent health, kept current by rollups.py in every write transaction."""
+
+    __tablename__ = "solution_rollups"
+
+    solution_id: Mapped[str] = mapped_column(
+        String, ForeignKey("solutions.solution_id"), primary_key=True
+    )
+    project_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    subcomponent_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    to_do_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    in_progress_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    on_hold_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    complete_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    abandoned_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    overdue_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Earliest due date of an open subcomponent that was not yet overdue on `computed_on`.
+    next_due_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    computed_on: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ProjectRollup(Base):
+    """Per-project worst-of RAG and subcomponent health over live solutions (see rollups.py)."""
+
+    __tablename__ = "project_rollups"
+
+    project_id: Mapped[str] = mapped_column(
+        String, ForeignKey("projects.project_id"), primary_key=True
+    )
+    rag_status: Mapped[Optional[RagStatus]] = mapped_column(Enum(RagStatus), nullable=True, index=True)
+    solution_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    red_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amber_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    green_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    subcomponent_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    overdue_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_due_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    computed_on: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class SearchDoc(Base):
+    """
+    Live rows indexed in the `search_index` FTS5 table (see search.py); `doc_id` is the FTS rowid.
+
+    An INTEGER PRIMARY KEY survives VACUUM, unlike the implicit rowid of the entity tables.
+    """
+
+    __tablename__ = "search_docs"
+    __table_args__ = (UniqueConstraint("kind", "entity_id", name="uix_search_doc_entity"),)
+
+    doc_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    entity_id: Mapped[str] = mapped_column(String, nullable=False)
+    project_id: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+
+
+# Indexes earlier versions created that no model declares any more; `db.ensure_indexes` drops them.
+# The full-table deleted_at indexes made SQLite sort every unfiltered list in a temp B-tree.
+RETIRED_INDEXES = ("ix_projects_deleted_at", "ix_solutions_deleted_at", "ix_subcomponents_deleted_at")
+
+
+def normalize_key(value: Optional[str]) -> str:
+    """Case-folded, trimmed form used by the `*_norm` columns and the filters that query them."""
+    return value.strip().casefold() if isinstance(value, str) else ""
+
+
+# Source column -> indexed `*_norm` shadow, per model. Equality filters on people fields compare
+# the shadow with `normalize_key(value)` instead of wrapping the column in lower(), which no plain
+# index can serve.
+NORMALIZED_COLUMNS = {
+    Project: {"sponsor": "sponsor_norm"},
+    Solution: {"owner": "owner_norm", "assignee": "assignee_norm"},
+    Subcomponent: {"assignee": "assignee_norm"},
+}
+
+
+def _set_normalized_columns(mapper, connection, target) -> None:
+    for source, shadow in NORMALIZED_COLUMNS[mapper.class_].items():
+        setattr(target, shadow, normalize_key(getattr(target, source)))
+
+
+for _model in NORMALIZED_COLUMNS:
+    event.listen(_model, "before_insert", _set_normalized_columns)
+    event.listen(_model, "before_update", _set_normalized_columns)
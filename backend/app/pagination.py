@@ -0,0 +1,78 @@
+import base64
+import json
+import os
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, tuple_
+
+# Default page size when a list route is called without `limit`; `paginate=false` returns everything.
+DEFAULT_PAGE_SIZE = int(os.getenv("JIRA_LITE_PAGE_SIZE", "500"))
+MAX_PAGE_SIZE = int(os.getenv("JIRA_LITE_MAX_PAGE_SIZE", "5000"))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "value"):  # enums
+        return value.value
+    return value
+
+
+def _from_json(value: Any, column) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque, URL-safe cursor for the sort key of the last row on a page."""
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor shape mismatch")
+        return [_from_json(value, column) for value, column in zip(values, columns)]
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset_page(
+    query,
+    order_by: Sequence[Any],
+    limit: Optional[int],
+    cursor: Optional[str],
+    paginate: bool = True,
+) -> Tuple[list, Optional[str]]:
+    """
+    Apply keyset pagination over `order_by` (all ascending; last column must be unique).
+
+    Returns (rows, next_cursor); next_cursor is None on the last page or when `paginate` is False.
+    """
+    query = query.order_by(*[column.asc() for column in order_by])
+    if not paginate:
+        return query.all(), None
+    page_size = limit or DEFAULT_PAGE_SIZE
+    if cursor:
+        after = decode_cursor(cursor, order_by)
+        bound = [literal(value, column.type) for value, column in zip(after, order_by)]
+        query = query.filter(tuple_(*order_by) > tuple_(*bound))
+    rows = query.limit(page_size + 1).all()
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, column.key) for column in order_by])
@@ -0,0 +1,133 @@
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .enums import ProjectStatus, SolutionStatus, SubcomponentStatus
+from .pagination import encode_cursor
+from .routes_projects import _load_projects
+from .routes_solutions import _load_all_solutions
+from .routes_subcomponents import _load_all_subcomponents
+
+# Filter values only need the right type: they are bound parameters, so they do not change the plan.
+_ID = "00000000-0000-0000-0000-000000000000"
+_SOLUTION_CURSOR = encode_cursor([3, datetime(2000, 1, 1), _ID])
+_NO_SOLUTION_FILTERS = dict(
+    project_id=None,
+    status_filter=None,
+    owner=None,
+    assignee=None,
+    phase=None,
+    priority=None,
+    due_before=None,
+    due_after=None,
+)
+_NO_SUBCOMPONENT_FILTERS = dict(
+    status_filter=None,
+    project_id=None,
+    solution_id=None,
+    priority=None,
+    due_before=None,
+    due_after=None,
+    assignee=None,
+)
+
+
+def _projects(**filters) -> Callable[[Session], Any]:
+    values = {"status_filter": None, "sponsor": None, **filters}
+    return lambda session: _load_projects(session, **values, limit=1, cursor=None, paginate=True)
+
+
+def _solutions(cursor: Optional[str] = None, **filters) -> Callable[[Session], Any]:
+    values = {**_NO_SOLUTION_FILTERS, **filters}
+    return lambda session: _load_all_solutions(session, **values, limit=1, cursor=cursor, paginate=True)
+
+
+def _subcomponents(**filters) -> Callable[[Session], Any]:
+    values = {**_NO_SUBCOMPONENT_FILTERS, **filters}
+    return lambda session: _load_all_subcomponents(session, **values, limit=1, cursor=None, paginate=True)
+
+
+# (name, index the query must use, loader run with representative filters). Each loader is the one
+# behind the list route, so the report follows the SQL the routes actually send.
+HOT_QUERIES: Tuple[Tuple[str, str, Callable[[Session], Any]], ...] = (
+    ("projects", "idx_projects_live_created_id", _projects()),
+    ("projects?status", "idx_projects_status_live_created_id", _projects(status_filter=ProjectStatus.active)),
+    ("projects?sponsor", "idx_projects_sponsor_norm_live_created_id", _projects(sponsor="cfo office")),
+    ("solutions", "idx_solutions_live_priority_created_id", _solutions()),
+    ("solutions (next page)", "idx_solutions_live_priority_created_id", _solutions(_SOLUTION_CURSOR)),
+    ("solutions?project_id", "idx_solutions_project_live_priority_created_id", _solutions(project_id=_ID)),
+    (
+        "solutions?status",
+        "idx_solutions_status_live_priority_created_id",
+        _solutions(status_filter=SolutionStatus.active),
+    ),
+    ("solutions?priority", "idx_solutions_live_priority_created_id", _solutions(priority=1)),
+    ("solutions?owner", "idx_solutions_owner_norm_live_priority_created_id", _solutions(owner="ana")),
+    ("solutions?assignee", "idx_solutions_assignee_norm_live_priority_created_id", _solutions(assignee="ana")),
+    ("subcomponents", "idx_subcomponents_live_priority_created_id", _subcomponents()),
+    (
+        "subcomponents?solution_id",
+        "idx_subcomponents_solution_live_priority_created_id",
+        _subcomponents(solution_id=_ID),
+    ),
+    (
+        "subcomponents?project_id",
+        "idx_subcomponents_project_live_priority_created_id",
+        _subcomponents(project_id=_ID),
+    ),
+    (
+        "subcomponents?status",
+        "idx_subcomponents_status_live_priority_created_id",
+        _subcomponents(status_filter=SubcomponentStatus.in_progress),
+    ),
+    (
+        "subcomponents?assignee",
+        "idx_subcomponents_assignee_norm_live_priority_created_id",
+        _subcomponents(assignee="ana"),
+    ),
+)
+
+_USING_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+
+
+def _capture(session: Session, run: Callable[[Session], Any]) -> List[Tuple[str, Any]]:
+    connection = session.connection()
+    statements: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        run(session)
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+    return statements
+
+
+def query_plan_report(session: Session) -> List[Dict[str, Any]]:
+    """
+    EXPLAIN QUERY PLAN for every hot list query: the index SQLite picked, whether it still sorts
+    in a temp B-tree, and `ok` when it walks the expected index in list order. SQLite only.
+    """
+    connection = session.connection()
+    report = []
+    for name, expected, run in HOT_QUERIES:
+        statement, parameters = _capture(session, run)[-1]
+        plan = [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+        used = next((match.group(1) for line in plan for match in [_USING_INDEX.search(line)] if match), None)
+        sorts = any("TEMP B-TREE" in line for line in plan)
+        report.append(
+            {
+                "query": name,
+                "expected_index": expected,
+                "index": used,
+                "sorts": sorts,
+                "ok": used == expected and not sorts,
+                "plan": plan,
+            }
+        )
+    return report
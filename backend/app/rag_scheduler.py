@@ -0,0 +1,272 @@
+import asyncio
+import heapq
+import logging
+import os
+from contextlib import suppress
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from .audit_log import log_changes
+from .enums import RagSource, SolutionStatus
+from .models import Solution
+from .realtime import schedule_broadcast
+from .rollups import refresh_rollups
+from .routes_solutions import compute_auto_rag
+from .versioning import bump_version
+
+logger = logging.getLogger("uvicorn.error")
+
+AUTO_RAG_SCHEDULER = os.getenv("JIRA_LITE_AUTO_RAG_SCHEDULER", "true").strip().lower() not in (
+    "0",
+    "false",
+    "no",
+    "off",
+)
+# change_log.user_id for transitions made by the scheduler rather than a person.
+AUTO_RAG_USER_ID = "auto-rag"
+# Upper bound on one sleep, so clock changes and a missed wake-up cost at most this much delay.
+MAX_SLEEP_SECONDS = 3600.0
+# Pause before retrying a failed transition (e.g. the database was locked).
+RETRY_SECONDS = 60.0
+
+_CLOSED = (SolutionStatus.complete, SolutionStatus.abandoned)
+_DUE_DATES_KEY = "jira_lite_auto_rag_due_dates"
+
+
+def apply_auto_rag(session: Session, today: Optional[date] = None, full: bool = False) -> int:
+    """
+    Bring stored auto-RAG up to date for `today` with set-based UPDATEs; returns rows changed.
+
+    By default only open solutions whose due date has passed are considered (the time-driven
+    amber -> red transition); `full` re-evaluates every live auto-RAG solution for startup and
+    recovery. Changed rows get one data version, change_log rows and fresh rollups in a single
+    transaction, followed by one broadcast.
+    """
+    today = today or date.today()
+    connection = session.connection()
+    # Bumping first takes SQLite's write lock, so the rows read below cannot change before the UPDATE.
+    version = bump_version(connection, ["solutions"])
+    criteria = [Solution.deleted_at.is_(None), Solution.rag_source == RagSource.auto]
+    if not full:
+        criteria += [Solution.due_date < today, Solution.status.not_in(_CLOSED)]
+    rows = connection.execute(
+        select(
+            Solution.solution_id,
+            Solution.project_id,
+            Solution.status,
+            Solution.due_date,
+            Solution.rag_status,
+        ).where(*criteria)
+    ).all()
+    targets: Dict = {}
+    for row in rows:
+        expected = compute_auto_rag(row.status, row.due_date, today)
+        if expected != row.rag_status:
+            targets.setdefault(expected, []).append(row)
+    if not targets:
+        session.rollback()
+        return 0
+
+    now = datetime.now(timezone.utc)
+    for rag_status, group in targets.items():
+        session.execute(
+            update(Solution)
+            .where(Solution.solution_id.in_([row.solution_id for row in group]))
+            .values(rag_status=rag_status, rag_reason=None, updated_at=now, data_version=version)
+            .execution_options(synchronize_session=False)
+        )
+        for row in group:
+            log_changes(
+                session,
+                entity_type="solution",
+                entity_id=row.solution_id,
+                user_id=AUTO_RAG_USER_ID,
+                action="update",
+                changes={"rag_status": (row.rag_status, rag_status)},
+            )
+    changed = [row for group in targets.values() for row in group]
+    refresh_rollups(
+        connection,
+        [row.solution_id for row in changed],
+        {row.project_id for row in changed},
+        today,
+    )
+    session.commit()
+    schedule_broadcast("solutions")
+    return len(changed)
+
+
+def _transition_at(due: date) -> datetime:
+    """Local midnight after `due`: the moment `compute_auto_rag` starts treating it as overdue."""
+    return datetime.combine(due + timedelta(days=1), time.min)
+
+
+class AutoRagScheduler:
+    """
+    Min-heap of upcoming due dates of open auto-RAG solutions; applies `apply_auto_rag` when the
+    earliest one passes. Committed writes push their due dates (see the session hooks below), and
+    stale entries are harmless because the UPDATE re-checks every row.
+    """
+
+    def __init__(self, today: Callable[[], date] = date.today) -> None:
+        self.today = today
+        self.runs = 0
+        self.changed = 0
+        self._sessionmaker: Optional[sessionmaker] = None
+        self._heap: List[date] = []
+        self._queued: Set[date] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self, factory: sessionmaker) -> None:
+        """Recompute every auto-RAG solution, load upcoming due dates and start the timer task."""
+        await self.stop()
+        self._sessionmaker = factory
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        changed = await run_in_threadpool(self.recompute)
+        if changed:
+            logger.info("Auto-RAG recompute updated %d solutions", changed)
+        for due in await run_in_threadpool(self._upcoming_due_dates):
+            self._push(due)
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        self._heap, self._queued = [], set()
+        self._loop = self._wake = None
+
+    def recompute(self) -> int:
+        """Full recompute (startup and recovery)."""
+        with self._sessionmaker() as session:
+            return apply_auto_rag(session, self.today(), full=True)
+
+    def _upcoming_due_dates(self) -> List[date]:
+        with self._sessionmaker() as session:
+            return list(
+                session.execute(
+                    select(Solution.due_date)
+                    .where(
+                        Solution.deleted_at.is_(None),
+                        Solution.rag_source == RagSource.auto,
+                        Solution.status.not_in(_CLOSED),
+                        Solution.due_date >= self.today(),
+                    )
+                    .distinct()
+                ).scalars()
+            )
+
+    def schedule(self, due_dates) -> None:
+        """Queue due dates from any thread; a no-op while the scheduler is not running."""
+        loop = self._loop
+        if loop is None:
+            return
+        for due in due_dates:
+            loop.call_soon_threadsafe(self._push, due)
+
+    def _push(self, due: date) -> None:
+        if due in self._queued or due < self.today():
+            return
+        self._queued.add(due)
+        heapq.heappush(self._heap, due)
+        if self._wake is not None and self._heap[0] == due:
+            self._wake.set()
+
+    async def run_due(self) -> int:
+        """Apply transitions whose due date has passed; returns the number of solutions changed."""
+        today = self.today()
+        passed: List[date] = []
+        while self._heap and self._heap[0] < today:
+            due = heapq.heappop(self._heap)
+            self._queued.discard(due)
+            passed.append(due)
+        if not passed:
+            return 0
+        try:
+            changed = await run_in_threadpool(self._apply, today)
+        except Exception:
+            # Put the dates back (`_push` would drop them as past) so the next pass retries them.
+            for due in passed:
+                if due not in self._queued:
+                    self._queued.add(due)
+                    heapq.heappush(self._heap, due)
+            raise
+        self.runs += 1
+        self.changed += changed
+        return changed
+
+    def _apply(self, today: date) -> int:
+        with self._sessionmaker() as session:
+            return apply_auto_rag(session, today)
+
+    async def _run(self) -> None:
+        while True:
+            delay = MAX_SLEEP_SECONDS
+            if self._heap:
+                delay = min(delay, (_transition_at(self._heap[0]) - datetime.now()).total_seconds())
+            self._wake.clear()
+            if delay > 0:
+                # asyncio.wait rather than wait_for: on 3.11 wait_for can swallow a cancel that
+                # races with the event being set, and stop() would then wait forever.
+                waiter = asyncio.ensure_future(self._wake.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=delay)
+                finally:
+                    waiter.cancel()
+            try:
+                changed = await self.run_due()
+            except Exception:  # keep the timer alive; the dates stay queued for the next pass
+                logger.exception("Auto-RAG transition failed; retrying in %.0f s", RETRY_SECONDS)
+                await asyncio.sleep(RETRY_SECONDS)
+                continue
+            if changed:
+                logger.info("Auto-RAG turned %d overdue solutions red", changed)
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": AUTO_RAG_SCHEDULER,
+            "running": self.running,
+            "queued_dates": len(self._heap),
+            "next_due_date": self._heap[0].isoformat() if self._heap else None,
+            "runs": self.runs,
+            "changed": self.changed,
+        }
+
+
+scheduler = AutoRagScheduler()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_due_dates(session: Session, flush_context) -> None:
+    if not scheduler.running:
+        return
+    for obj in [*session.new, *session.dirty]:
+        if not isinstance(obj, Solution) or obj.rag_source != RagSource.auto or obj.status in _CLOSED:
+            continue
+        if obj.due_date:
+            session.info.setdefault(_DUE_DATES_KEY, set()).add(obj.due_date)
+
+
+@event.listens_for(Session, "after_commit")
+def _schedule_due_dates(session: Session) -> None:
+    due_dates = session.info.pop(_DUE_DATES_KEY, None)
+    if due_dates:
+        scheduler.schedule(due_dates)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_due_dates(session: Session) -> None:
+    session.info.pop(_DUE_DATES_KEY, None)
@@ -1,38 +1,451 @@
 import asyncio
-from typing import Set
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import suppress
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
 
-connections: Set[WebSocket] = set()
+from .auth_cache import user_cache
+from .models import normalize_key
+from .realtime_backends import BroadcastBackend, create_backend
 
+logger = logging.getLogger(__name__)
 
-async def register(ws: WebSocket) -> None:
+# Events scheduled within this window are merged into one message (e.g. every row of a CSV import).
+COALESCE_WINDOW_MS = int(os.getenv("JIRA_LITE_BROADCAST_COALESCE_MS", "50"))
+# Outbound messages buffered per socket before the overflow policy applies.
+SEND_QUEUE_SIZE = int(os.getenv("JIRA_LITE_WS_SEND_QUEUE", "64"))
+# `resync`: drop the backlog and queue one full-refresh message; `close`: disconnect the slow client.
+OVERFLOW_POLICY = os.getenv("JIRA_LITE_WS_OVERFLOW", "resync").strip().lower()
+PING_INTERVAL_SECONDS = float(os.getenv("JIRA_LITE_WS_PING_INTERVAL", "20"))
+IDLE_TIMEOUT_SECONDS = float(os.getenv("JIRA_LITE_WS_IDLE_TIMEOUT", "60"))
+# Row-level changes carried by one event; bigger batches (bulk imports) go out as plain kind refreshes.
+MAX_EVENT_CHANGES = int(os.getenv("JIRA_LITE_WS_MAX_CHANGES", "500"))
+# Recent events kept for clients that reconnect with `{"type": "resume", "last_seq": n}`.
+REPLAY_BUFFER_SIZE = int(os.getenv("JIRA_LITE_WS_REPLAY_BUFFER", "1000"))
+MAX_TOPICS_PER_CLIENT = 200
+
+ALL_TOPIC = "*"
+TOPIC_KINDS = {"projects", "solutions", "subcomponents", "solution_phases", "phases"}
+TOPIC_PREFIXES = {"kind", "project", "solution", "assignee"}
+
+
+class Client:
+    """
+    One live-sync socket with its own bounded send queue, drained by a dedicated writer task.
+
+    `deltas` clients (`/api/ws?format=delta`) get changed rows and tombstones instead of refresh hints.
+    Rows, replay and subscriptions are for signed-in `user`s only; without one a client gets refresh
+    hints at most.
+    """
+
+    def __init__(
+        self, ws: WebSocket, queue_size: Optional[int] = None, deltas: bool = False, user: Any = None
+    ) -> None:
+        self.ws = ws
+        self.deltas = deltas and user is not None
+        self.user = user
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(queue_size or SEND_QUEUE_SIZE, 1))
+        self.topics: Set[str] = set()
+        self.last_seen = time.monotonic()
+        self.dropped = 0
+        self.closed = False
+        self._close_code: Optional[int] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._writer = asyncio.get_running_loop().create_task(self._write())
+
+    def touch(self) -> None:
+        self.last_seen = time.monotonic()
+
+    def idle_for(self) -> float:
+        return time.monotonic() - self.last_seen
+
+    def offer(self, message: Dict[str, Any]) -> None:
+        """Queue `message` without blocking; apply the overflow policy when the client is behind."""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+        self.dropped += 1
+        if OVERFLOW_POLICY == "close":
+            logger.warning("Closing live-sync client that fell %d messages behind", self.queue.qsize())
+            self.close(status.WS_1013_TRY_AGAIN_LATER)
+            return
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait({**refresh_message("all"), "reason": "overflow", "seq": _last_seq})
+
+    def close(self, code: Optional[int] = None) -> None:
+        """Stop the writer; with `code`, also close the socket from the server side."""
+        if self.closed:
+            return
+        self.closed = True
+        self._close_code = code
+        if self._writer is not None:
+            self._writer.cancel()
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                message = await self.queue.get()
+                await self.ws.send_json(message)
+        except asyncio.CancelledError:
+            if self._close_code is not None:
+                with suppress(Exception):
+                    await self.ws.close(code=self._close_code)
+        except Exception:
+            logger.debug("Live-sync send failed; dropping client", exc_info=True)
+        finally:
+            self.closed = True
+            _forget(self)
+
+
+connections: Dict[WebSocket, Client] = {}
+# Topic -> subscribed clients; every client starts on ALL_TOPIC.
+subscriptions: Dict[str, Set[Client]] = defaultdict(set)
+
+# Owned by the server loop; set by `start()` from the app lifespan.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_queue: Optional[asyncio.Queue] = None
+_broadcaster: Optional[asyncio.Task] = None
+_backend: Optional[BroadcastBackend] = None
+# Dispatched events, oldest first, and the newest `seq` seen on this stream.
+_history: Deque[Dict[str, Any]] = deque(maxlen=max(REPLAY_BUFFER_SIZE, 0))
+_last_seq = 0
+
+
+async def register(ws: WebSocket, deltas: bool = False, user: Any = None) -> Client:
+    """Accept an authenticated socket (see routes_sync) and subscribe it to everything."""
     await ws.accept()
-    connections.add(ws)
+    client = Client(ws, deltas=deltas, user=user)
+    connections[ws] = client
+    subscribe(client, [ALL_TOPIC])
+    client.start()
+    return client
+
+
+def _forget(client: Client) -> None:
+    if connections.get(client.ws) is client:
+        del connections[client.ws]
+    unsubscribe(client, list(client.topics))
 
 
 def unregister(ws: WebSocket) -> None:
-    connections.discard(ws)
+    client = connections.get(ws)
+    if client is not None:
+        _forget(client)
+        client.close()
 
 
-async def broadcast_refresh(entity: str = "all") -> None:
-    dead = []
-    for ws in list(connections):
+def normalize_topic(topic: Any, user: Any = None) -> Optional[str]:
+    """
+    Canonical form of a subscription topic, or None when it is not valid.
+
+    `assignee:me` is the only assignee topic: it becomes the topic of `user`'s own display name, so a
+    client cannot follow somebody else's assignments.
+    """
+    if not isinstance(topic, str):
+        return None
+    topic = topic.strip()
+    if topic == ALL_TOPIC:
+        return topic
+    prefix, _, value = topic.partition(":")
+    value = value.strip()
+    if prefix not in TOPIC_PREFIXES or not value:
+        return None
+    if prefix == "kind" and value not in TOPIC_KINDS:
+        return None
+    if prefix == "assignee":
+        if value != "me" or user is None or not normalize_key(getattr(user, "display_name", None)):
+            return None
+        value = normalize_key(user.display_name)
+    return f"{prefix}:{value}"
+
+
+def subscribe(client: Client, topics: Iterable[str]) -> None:
+    for topic in topics:
+        if len(client.topics) >= MAX_TOPICS_PER_CLIENT:
+            break
+        client.topics.add(topic)
+        subscriptions[topic].add(client)
+
+
+def unsubscribe(client: Client, topics: Iterable[str]) -> None:
+    for topic in topics:
+        client.topics.discard(topic)
+        subscribers = subscriptions.get(topic)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del subscriptions[topic]
+
+
+def change_topics(change: Dict[str, Any]) -> List[str]:
+    topics = [f"kind:{change['kind']}"]
+    for prefix, values in change.get("scopes", {}).items():
+        topics.extend(f"{prefix}:{value}" for value in values)
+    return topics
+
+
+def refresh_message(entities: Union[str, Iterable[str]]) -> dict:
+    names = {entities} if isinstance(entities, str) else set(entities)
+    ordered = sorted(names)
+    entity = ordered[0] if len(ordered) == 1 else "all"
+    return {"type": "refresh", "entity": entity, "entities": ordered}
+
+
+def delta_message(changes: List[Dict[str, Any]]) -> dict:
+    """Changed rows (`row`) and deletions (`deleted: true`, no row) in commit order."""
+    items = []
+    for change in changes:
+        item = {"kind": change["kind"], "id": change["id"], "version": change["version"]}
+        if change.get("deleted"):
+            item["deleted"] = True
+        else:
+            item["row"] = change["row"]
+        items.append(item)
+    return {"type": "delta", "entities": sorted({change["kind"] for change in changes}), "changes": items}
+
+
+def broadcast_refresh(entities: Union[str, Iterable[str]] = "all") -> None:
+    message = refresh_message(entities)
+    for client in list(connections.values()):
+        client.offer(message)
+
+
+def handle_client_message(client: Client, message: Any) -> None:
+    """Apply one client->server message (JSON already decoded)."""
+    if not isinstance(message, dict):
+        return
+    kind = message.get("type")
+    if kind == "ping":
+        client.offer({"type": "pong"})
+    elif kind in ("resume", "subscribe", "unsubscribe") and client.user is None:
+        client.offer({"type": "error", "detail": "Not authenticated"})
+    elif kind == "resume":
+        last_seq = message.get("last_seq")
+        if isinstance(last_seq, bool) or not isinstance(last_seq, (int, type(None))):
+            client.offer({"type": "error", "detail": "Invalid last_seq"})
+            return
+        resume(client, message.get("stream"), last_seq)
+    elif kind in ("subscribe", "unsubscribe"):
+        raw = message.get("topics")
+        raw = raw if isinstance(raw, list) else []
+        topics = [normalize_topic(topic, client.user) for topic in raw]
+        invalid = [topic for topic, normalized in zip(raw, topics) if normalized is None]
+        if invalid:
+            client.offer({"type": "error", "detail": f"Invalid topic: {invalid[0]}"})
+            return
+        (subscribe if kind == "subscribe" else unsubscribe)(client, topics)
+        client.offer({"type": "subscribed", "topics": sorted(client.topics)})
+
+
+def _split_event(event: Dict[str, Any]) -> Tuple[Set[str], List[Dict[str, Any]]]:
+    """Kinds changed without row detail, and the row-level changes, of one event."""
+    entities = set(event.get("entities") or ["all"])
+    changes = event.get("changes") or []
+    return entities - {change["kind"] for change in changes}, changes
+
+
+def _matches(client: Client, change: Dict[str, Any]) -> bool:
+    return ALL_TOPIC in client.topics or any(topic in client.topics for topic in change_topics(change))
+
+
+def _event_messages(
+    client: Client, seq: Any, global_kinds: Set[str], changes: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """What `client` is sent for one event, given the changes it matched."""
+    if client.deltas and changes and all(change.get("deleted") or "row" in change for change in changes):
+        messages = [delta_message(changes)]
+        if global_kinds:
+            messages.append(refresh_message(global_kinds))
+    else:
+        messages = [refresh_message(global_kinds | {change["kind"] for change in changes})]
+    return [{**message, "seq": seq} for message in messages]
+
+
+def dispatch(event: Dict[str, Any]) -> None:
+    """
+    Route one published event to this process's sockets and remember it for resuming clients.
+
+    Row-level changes reach clients subscribed to any of their topics (or to `*`); kinds changed
+    without row detail (phases, oversized batches) reach every client as a refresh. Delta clients
+    get the matched rows themselves when every one of them was serialized.
+    """
+    global _last_seq
+    seq = event.get("seq")
+    if seq is not None:
+        _history.append(event)
+        _last_seq = seq
+    global_kinds, changes = _split_event(event)
+    matched: Dict[Client, List[Dict[str, Any]]] = defaultdict(list)
+    if global_kinds:
+        for client in connections.values():
+            matched.setdefault(client, [])
+    everyone = subscriptions.get(ALL_TOPIC, set())
+    for change in changes:
+        recipients = set(everyone)
+        for topic in change_topics(change):
+            recipients.update(subscriptions.get(topic, ()))
+        for client in recipients:
+            matched[client].append(change)
+    for client, client_changes in matched.items():
+        for message in _event_messages(client, seq, global_kinds, client_changes):
+            client.offer(message)
+
+
+def resume(client: Client, stream: Any, last_seq: Optional[int]) -> None:
+    """
+    Replay the events a reconnecting client missed after `last_seq`, filtered by its topics and
+    format, then confirm with `resumed`. A different stream or a gap older than the replay buffer
+    gets `resync` instead: the client must reload (e.g. via GET /api/changes).
+    """
+    current = _backend.stream if _backend is not None else ""
+    latest = _last_seq
+
+    def reply(kind: str, **extra: Any) -> None:
+        client.offer({"type": kind, "stream": current, "seq": latest, **extra})
+
+    if last_seq is None:
+        reply("resumed", replayed=0)
+        return
+    if stream != current or last_seq > latest:
+        reply("resync", reason="stream")
+        return
+    if last_seq < latest and (not _history or _history[0]["seq"] > last_seq + 1):
+        reply("resync", reason="gap")
+        return
+    missed = [event for event in _history if event["seq"] > last_seq]
+    for event in missed:
+        global_kinds, changes = _split_event(event)
+        client_changes = [change for change in changes if _matches(client, change)]
+        if global_kinds or client_changes:
+            for message in _event_messages(client, event["seq"], global_kinds, client_changes):
+                client.offer(message)
+    reply("resumed", replayed=len(missed))
+
+
+def connection_stats() -> Dict[str, Any]:
+    clients = list(connections.values())
+    return {
+        "connections": len(clients),
+        "topics": len(subscriptions),
+        "queued": sum(client.queue.qsize() for client in clients),
+        "dropped": sum(client.dropped for client in clients),
+        "send_queue_size": SEND_QUEUE_SIZE,
+        "overflow_policy": OVERFLOW_POLICY,
+        "backend": _backend.name if _backend is not None else None,
+        "seq": _last_seq,
+        "replay_buffered": len(_history),
+    }
+
+
+class _UserInvalidation(NamedTuple):
+    user_id: str
+
+
+def _build_event(items: List[Any]) -> Dict[str, Any]:
+    entities: Set[str] = set()
+    latest: Dict[tuple, Dict[str, Any]] = {}
+    for item in items:
+        if isinstance(item, str):
+            entities.add(item)
+            continue
+        for change in item:
+            entities.add(change["kind"])
+            key = (change["kind"], change["id"])
+            previous = latest.get(key)
+            if previous is None or previous["version"] <= change["version"]:
+                latest[key] = change
+    if len(latest) > MAX_EVENT_CHANGES:
+        return {"entities": sorted(entities)}
+    return {"entities": sorted(entities), "changes": sorted(latest.values(), key=lambda c: c["version"])}
+
+
+async def _run_broadcaster(queue: asyncio.Queue, window: float, backend: BroadcastBackend) -> None:
+    while True:
+        items = [await queue.get()]
+        if window > 0:
+            await asyncio.sleep(window)
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        # User-cache invalidations travel apart from events: they take no seq and no replay slot.
+        users = sorted({item.user_id for item in items if isinstance(item, _UserInvalidation)})
+        items = [item for item in items if not isinstance(item, _UserInvalidation)]
         try:
-            await ws.send_json({"type": "refresh", "entity": entity})
+            if items:
+                await backend.publish(_build_event(items))
+            if users:
+                await backend.publish_invalidations(users)
         except Exception:
-            dead.append(ws)
-    for ws in dead:
+            logger.exception("Live-sync broadcast failed")
+
+
+async def start(backend: Optional[BroadcastBackend] = None) -> None:
+    """Start the broadcast backend and the single broadcaster task on the running (server) loop."""
+    global _loop, _queue, _broadcaster, _backend, _history, _last_seq
+    await stop()
+    _history = deque(maxlen=max(REPLAY_BUFFER_SIZE, 0))
+    _last_seq = 0
+    _backend = backend or create_backend(backlog=REPLAY_BUFFER_SIZE)
+    await _backend.start(dispatch, user_cache.invalidate)
+    _loop = asyncio.get_running_loop()
+    _queue = asyncio.Queue()
+    _broadcaster = _loop.create_task(_run_broadcaster(_queue, COALESCE_WINDOW_MS / 1000, _backend))
+
+
+async def stop() -> None:
+    global _loop, _queue, _broadcaster, _backend
+    task, backend = _broadcaster, _backend
+    _loop = _queue = _broadcaster = _backend = None
+    for ws in list(connections):
         unregister(ws)
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    if backend is not None:
+        await backend.stop()
 
 
-def schedule_broadcast(entity: str = "all") -> None:
-    """Fire-and-forget broadcast; safe to call from sync contexts."""
+def _enqueue(item: Any) -> None:
+    loop, queue = _loop, _queue
+    if loop is None or queue is None:
+        return  # no broadcaster (CLI scripts, or the app is not serving)
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            loop.create_task(broadcast_refresh(entity))
-        else:
-            asyncio.run(broadcast_refresh(entity))
+        running = asyncio.get_running_loop()
     except RuntimeError:
-        asyncio.run(broadcast_refresh(entity))
+        running = None
+    if running is loop:
+        queue.put_nowait(item)
+        return
+    with suppress(RuntimeError):  # loop already closed during shutdown
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+
+def schedule_broadcast(entity: str = "all") -> None:
+    """Queue a live-sync event; safe to call from worker threads and from the server loop."""
+    _enqueue(entity)
+
+
+def publish_changes(changes: List[Dict[str, Any]]) -> None:
+    """Queue committed row-level changes (see versioning.py); same threading rules as schedule_broadcast."""
+    _enqueue(list(changes))
+
+
+def publish_user_invalidation(user_id: str) -> None:
+    """
+    Have the other workers drop `user_id` from their auth caches; same threading rules as
+    schedule_broadcast. A single-process backend has no other workers, so nothing is sent.
+    """
+    backend = _backend
+    if backend is not None and backend.cross_process:
+        _enqueue(_UserInvalidation(user_id))
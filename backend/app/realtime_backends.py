@@ -0,0 +1,211 @@
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+
+from .models import RealtimeEvent, UserCacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+# `memory`: events stay in this process (single worker). `sqlite`: events go through the
+# `realtime_events` table so every `uvicorn --workers N` process relays them to its own sockets.
+BROADCAST_BACKEND = os.getenv("JIRA_LITE_BROADCAST_BACKEND", "memory").strip().lower()
+POLL_INTERVAL_MS = int(os.getenv("JIRA_LITE_BROADCAST_POLL_MS", "100"))
+# Rows kept in `realtime_events`; older ones are pruned as new events are published.
+EVENT_RETENTION = int(os.getenv("JIRA_LITE_BROADCAST_RETAIN", "10000"))
+
+Deliver = Callable[[Dict[str, Any]], None]
+Invalidate = Callable[[str], None]
+
+
+class BroadcastBackend(ABC):
+    """
+    Carries coalesced events to `deliver` in every process; `deliver` runs on the server loop.
+
+    `stream` names the sequence space of the delivered `seq` numbers: a client may only resume
+    from a `seq` it saw on the same stream. `cross_process` backends also carry user-cache
+    invalidations to the other processes' `invalidate`, outside that sequence.
+    """
+
+    name = "base"
+    stream = ""
+    cross_process = False
+
+    @abstractmethod
+    async def start(self, deliver: Deliver, invalidate: Optional[Invalidate] = None) -> None:
+        ...
+
+    @abstractmethod
+    async def publish(self, event: Dict[str, Any]) -> None:
+        ...
+
+    async def publish_invalidations(self, user_ids: List[str]) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class InProcessBackend(BroadcastBackend):
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._deliver: Optional[Deliver] = None
+        self._seq = 0
+        # Sequence numbers restart with the process, so every process is its own stream.
+        self.stream = uuid4().hex
+
+    async def start(self, deliver: Deliver, invalidate: Optional[Invalidate] = None) -> None:
+        self._deliver = deliver
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        if self._deliver is None:
+            return
+        self._seq += 1
+        self._deliver({**event, "seq": self._seq})
+
+
+class SQLiteEventBackend(BroadcastBackend):
+    """
+    Publish by inserting into `realtime_events`; every process (the publisher included) polls the
+    table and delivers new rows in `seq` order, so all workers see the same events in the same order.
+    The table's `seq` is shared by every worker and survives restarts, so they form one stream.
+    User-cache invalidations go through `user_cache_invalidations` instead, so they never take a seq.
+    """
+
+    name = "sqlite"
+    stream = "sqlite"
+    cross_process = True
+
+    def __init__(
+        self,
+        engine: Engine,
+        poll_interval: float = POLL_INTERVAL_MS / 1000,
+        retention: int = EVENT_RETENTION,
+        backlog: int = 0,
+    ) -> None:
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.backlog = backlog
+        self.origin = uuid4().hex
+        self.last_seq = 0
+        self.last_invalidation = 0
+        self._deliver: Optional[Deliver] = None
+        self._invalidate: Optional[Invalidate] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._poll_lock = asyncio.Lock()
+
+    def _prepare(self) -> Tuple[int, int]:
+        RealtimeEvent.__table__.create(bind=self.engine, checkfirst=True)
+        UserCacheInvalidation.__table__.create(bind=self.engine, checkfirst=True)
+        with self.engine.connect() as conn:
+            return (
+                conn.execute(select(func.coalesce(func.max(RealtimeEvent.seq), 0))).scalar(),
+                conn.execute(select(func.coalesce(func.max(UserCacheInvalidation.id), 0))).scalar(),
+            )
+
+    def _insert(self, payload: str) -> None:
+        with self.engine.begin() as conn:
+            seq = conn.execute(
+                insert(RealtimeEvent).values(origin=self.origin, payload=payload).returning(RealtimeEvent.seq)
+            ).scalar()
+            if self.retention > 0 and seq % 100 == 0:
+                conn.execute(delete(RealtimeEvent).where(RealtimeEvent.seq <= seq - self.retention))
+
+    def _insert_invalidations(self, user_ids: List[str]) -> None:
+        with self.engine.begin() as conn:
+            last = conn.execute(
+                insert(UserCacheInvalidation)
+                .values([{"origin": self.origin, "user_id": user_id} for user_id in user_ids])
+                .returning(UserCacheInvalidation.id)
+            ).scalars().all()[-1]
+            # Prune whenever the batch crossed a multiple of 100, like `_insert` does per event.
+            if self.retention > 0 and (last - len(user_ids)) // 100 != last // 100:
+                conn.execute(delete(UserCacheInvalidation).where(UserCacheInvalidation.id <= last - self.retention))
+
+    def _fetch_invalidations(self, after: int) -> List[Tuple[int, str, str]]:
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(UserCacheInvalidation.id, UserCacheInvalidation.origin, UserCacheInvalidation.user_id)
+                .where(UserCacheInvalidation.id > after)
+                .order_by(UserCacheInvalidation.id.asc())
+                .limit(500)
+            ).all()
+
+    def _fetch(self, after: int) -> List[Tuple[int, str]]:
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(RealtimeEvent.seq, RealtimeEvent.payload)
+                .where(RealtimeEvent.seq > after)
+                .order_by(RealtimeEvent.seq.asc())
+                .limit(500)
+            ).all()
+
+    async def start(self, deliver: Deliver, invalidate: Optional[Invalidate] = None) -> None:
+        self._deliver = deliver
+        self._invalidate = invalidate
+        last_seq, self.last_invalidation = await run_in_threadpool(self._prepare)
+        # Start `backlog` events before the tail so a fresh worker can replay them to clients that
+        # reconnect from a worker that just went away; older events are never delivered.
+        self.last_seq = max(last_seq - self.backlog, 0)
+        self._poller = asyncio.get_running_loop().create_task(self._poll())
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        await run_in_threadpool(self._insert, json.dumps(event, default=str))
+
+    async def publish_invalidations(self, user_ids: List[str]) -> None:
+        await run_in_threadpool(self._insert_invalidations, user_ids)
+
+    async def poll_once(self) -> int:
+        async with self._poll_lock:
+            rows = await run_in_threadpool(self._fetch, self.last_seq)
+            for seq, payload in rows:
+                self.last_seq = seq
+                try:
+                    event = json.loads(payload)
+                except ValueError:
+                    continue
+                if self._deliver is not None:
+                    self._deliver({**event, "seq": seq})
+            invalidations = await run_in_threadpool(self._fetch_invalidations, self.last_invalidation)
+            for row_id, origin, user_id in invalidations:
+                self.last_invalidation = row_id
+                # The publishing worker already dropped its own copy.
+                if origin != self.origin and self._invalidate is not None:
+                    self._invalidate(user_id)
+            return len(rows) + len(invalidations)
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                if await self.poll_once():
+                    continue
+            except Exception:
+                logger.exception("Live-sync event poll failed")
+            await asyncio.sleep(self.poll_interval)
+
+    async def stop(self) -> None:
+        task, self._poller = self._poller, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+def create_backend(name: str = BROADCAST_BACKEND, backlog: int = 0) -> BroadcastBackend:
+    if name == "memory":
+        return InProcessBackend()
+    if name == "sqlite":
+        from .db import engine  # imported here to avoid circulars
+
+        return SQLiteEventBackend(engine, backlog=backlog)
+    raise ValueError(f"invalid JIRA_LITE_BROADCAST_BACKEND '{name}', expected one of: memory, sqlite")
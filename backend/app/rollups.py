@@ -0,0 +1,190 @@
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import delete, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from .enums import RagStatus, SubcomponentStatus
+from .models import Project, ProjectRollup, Solution, SolutionRollup, Subcomponent
+
+_CLOSED = (SubcomponentStatus.complete, SubcomponentStatus.abandoned)
+# Worst first: a project's RAG is the first of these held by any of its live solutions.
+RAG_SEVERITY = (RagStatus.red, RagStatus.amber, RagStatus.green)
+
+
+def _subcomponent_health(connection, criteria: Iterable[Any], today: date) -> Dict[str, Any]:
+    open_ = Subcomponent.status.not_in(_CLOSED)
+    columns = [
+        func.count().label("subcomponent_count"),
+        *(
+            func.count().filter(Subcomponent.status == value).label(f"{value.value}_count")
+            for value in SubcomponentStatus
+        ),
+        func.count().filter(open_ & (Subcomponent.due_date < today)).label("overdue_count"),
+        func.min(Subcomponent.due_date)
+        .filter(open_ & (Subcomponent.due_date >= today))
+        .label("next_due_date"),
+    ]
+    row = connection.execute(
+        select(*columns).where(Subcomponent.deleted_at.is_(None), *criteria)
+    ).one()
+    return dict(row._mapping)
+
+
+def compute_solution_rollup(connection, solution_id: str, today: date) -> Optional[Dict[str, Any]]:
+    """Fresh rollup values for one solution, or None when it does not exist or is deleted."""
+    project_id = connection.execute(
+        select(Solution.project_id).where(Solution.solution_id == solution_id, Solution.deleted_at.is_(None))
+    ).scalar()
+    if project_id is None:
+        return None
+    health = _subcomponent_health(connection, [Subcomponent.solution_id == solution_id], today)
+    return {"solution_id": solution_id, "project_id": project_id, **health, "computed_on": today}
+
+
+def compute_project_rollup(connection, project_id: str, today: date) -> Optional[Dict[str, Any]]:
+    """Fresh rollup values for one project over its live solutions, or None when it is deleted."""
+    live = connection.execute(
+        select(Project.project_id).where(Project.project_id == project_id, Project.deleted_at.is_(None))
+    ).scalar()
+    if live is None:
+        return None
+    rags = dict(
+        connection.execute(
+            select(Solution.rag_status, func.count())
+            .where(Solution.project_id == project_id, Solution.deleted_at.is_(None))
+            .group_by(Solution.rag_status)
+        ).all()
+    )
+    live_solutions = select(Solution.solution_id).where(
+        Solution.project_id == project_id, Solution.deleted_at.is_(None)
+    )
+    health = _subcomponent_health(
+        connection,
+        [Subcomponent.project_id == project_id, Subcomponent.solution_id.in_(live_solutions)],
+        today,
+    )
+    return {
+        "project_id": project_id,
+        "rag_status": next((rag for rag in RAG_SEVERITY if rags.get(rag)), None),
+        "solution_count": sum(rags.values()),
+        **{f"{rag.value}_count": rags.get(rag, 0) for rag in RagStatus},
+        "subcomponent_count": health["subcomponent_count"],
+        "overdue_count": health["overdue_count"],
+        "next_due_date": health["next_due_date"],
+        "computed_on": today,
+    }
+
+
+def _store(connection, model, key, values: Optional[Dict[str, Any]], row_id: str) -> None:
+    connection.execute(delete(model).where(key == row_id))
+    if values is not None:
+        connection.execute(insert(model).values(**values, updated_at=datetime.now(timezone.utc)))
+
+
+def refresh_rollups(
+    connection,
+    solution_ids: Iterable[str] = (),
+    project_ids: Iterable[str] = (),
+    today: Optional[date] = None,
+) -> None:
+    """
+    Recompute the rollup rows of the given solutions and projects inside the caller's transaction.
+
+    ORM writes are covered by the after_flush hook below; set-based UPDATE/DELETE statements on
+    solutions or subcomponents must call this for the rows they touched.
+    """
+    today = today or date.today()
+    for solution_id in sorted(set(solution_ids)):
+        values = compute_solution_rollup(connection, solution_id, today)
+        _store(connection, SolutionRollup, SolutionRollup.solution_id, values, solution_id)
+    for project_id in sorted(set(project_ids)):
+        values = compute_project_rollup(connection, project_id, today)
+        _store(connection, ProjectRollup, ProjectRollup.project_id, values, project_id)
+
+
+def rebuild_rollups(session: Session, today: Optional[date] = None) -> Dict[str, int]:
+    """Recompute every rollup row from scratch (repair, or first start on an existing database)."""
+    connection = session.connection()
+    connection.execute(delete(SolutionRollup))
+    connection.execute(delete(ProjectRollup))
+    solution_ids = list(
+        connection.execute(select(Solution.solution_id).where(Solution.deleted_at.is_(None))).scalars()
+    )
+    project_ids = list(
+        connection.execute(select(Project.project_id).where(Project.deleted_at.is_(None))).scalars()
+    )
+    refresh_rollups(connection, solution_ids, project_ids, today)
+    session.commit()
+    return {"solutions": len(solution_ids), "projects": len(project_ids)}
+
+
+def ensure_rollups(session: Session) -> None:
+    """Build the rollup tables once when live solutions exist but no rollup row does."""
+    has_rollups = session.execute(select(SolutionRollup.solution_id).limit(1)).first() is not None
+    has_solutions = (
+        session.execute(select(Solution.solution_id).where(Solution.deleted_at.is_(None)).limit(1)).first()
+        is not None
+    )
+    if has_solutions and not has_rollups:
+        rebuild_rollups(session)
+
+
+def _is_stale(row: Dict[str, Any], today: date) -> bool:
+    # Counts only change without a write when an open subcomponent's due date passes.
+    return row["computed_on"] < today and row["next_due_date"] is not None and row["next_due_date"] < today
+
+
+def solution_health(session: Session, solution_id: str, today: date) -> Optional[Dict[str, Any]]:
+    """Rollup row of one solution; recomputed (not stored) when a due date passed since it was written."""
+    connection = session.connection()
+    row = connection.execute(select(SolutionRollup).where(SolutionRollup.solution_id == solution_id)).first()
+    if row is not None and not _is_stale(row._mapping, today):
+        return dict(row._mapping)
+    return compute_solution_rollup(connection, solution_id, today)
+
+
+def project_health(session: Session, project_ids: Optional[List[str]], today: date) -> List[Dict[str, Any]]:
+    """Rollup rows of the given projects (all live projects when None), worst RAG first."""
+    connection = session.connection()
+    statement = select(ProjectRollup)
+    if project_ids is not None:
+        statement = statement.where(ProjectRollup.project_id.in_(project_ids))
+    rows = {row.project_id: dict(row._mapping) for row in connection.execute(statement)}
+    if project_ids is None:
+        project_ids = list(
+            connection.execute(select(Project.project_id).where(Project.deleted_at.is_(None))).scalars()
+        )
+    result = []
+    for project_id in project_ids:
+        row = rows.get(project_id)
+        if row is None or _is_stale(row, today):
+            row = compute_project_rollup(connection, project_id, today)
+        if row is not None:
+            result.append(row)
+    rank = {rag: index for index, rag in enumerate(RAG_SEVERITY)}
+    result.sort(key=lambda row: (rank.get(row["rag_status"], len(rank)), row["project_id"]))
+    return result
+
+
+def _values(obj, attr: str) -> Set[str]:
+    history = inspect(obj).attrs[attr].history
+    values = {*history.added, *history.unchanged, *history.deleted} or {getattr(obj, attr, None)}
+    return {value for value in values if value}
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_touched_rollups(session: Session, flush_context) -> None:
+    # Runs in the flush's transaction, so rollups commit or roll back together with the write.
+    solution_ids: Set[str] = set()
+    project_ids: Set[str] = set()
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        if not isinstance(obj, (Project, Solution, Subcomponent)):
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if not isinstance(obj, Project):
+            solution_ids |= _values(obj, "solution_id")
+        project_ids |= _values(obj, "project_id")
+    if solution_ids or project_ids:
+        refresh_rollups(session.connection(), solution_ids, project_ids)
@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends
 
 from .deps import require_user
+from .routes_admin import router as admin_router
 from .routes_audit import router as audit_router
 from .routes_auth import router as auth_router
+from .routes_bootstrap import router as bootstrap_router
+from .routes_calendar import router as calendar_router
+from .routes_changes import router as changes_router
+from .routes_dashboard import router as dashboard_router
 from .routes_projects import router as projects_router
+from .routes_search import router as search_router
 from .routes_phases import router as phases_router
 from .routes_solutions import router as solutions_router
 from .routes_subcomponents import router as subcomponents_router
@@ -18,6 +24,12 @@ protected_router.include_router(solutions_router, tags=["solutions"])
 protected_router.include_router(phases_router, tags=["phases"])
 protected_router.include_router(subcomponents_router, tags=["subcomponents"])
 protected_router.include_router(audit_router, tags=["audit"])
+protected_router.include_router(dashboard_router, tags=["dashboard"])
+protected_router.include_router(calendar_router, tags=["dashboard"])
+protected_router.include_router(search_router, tags=["search"])
+protected_router.include_router(changes_router, tags=["sync"])
+protected_router.include_router(bootstrap_router, tags=["sync"])
+protected_router.include_router(admin_router, prefix="/admin", tags=["admin"])
 
 api_router.include_router(protected_router)
 api_router.include_router(sync_router, tags=["sync"])
@@ -0,0 +1,76 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from .auth_cache import cache_stats
+from .coalescing import coalescing_stats
+from .deps import get_db, require_admin
+from .instrumentation import N_PLUS_ONE_THRESHOLD, profile_buffer_capacity, recent_profiles
+from .query_plans import query_plan_report
+from .rag_scheduler import apply_auto_rag, scheduler as auto_rag_scheduler
+from .realtime import connection_stats
+from .rollups import rebuild_rollups
+from .search import rebuild_search_index
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles")
+def list_request_profiles(limit: Optional[int] = Query(None, ge=1, le=1000)):
+    """Recent per-request SQL profiles (newest first); empty unless JIRA_LITE_PROFILE_BUFFER_SIZE > 0."""
+    return {
+        "capacity": profile_buffer_capacity(),
+        "n_plus_one_threshold": N_PLUS_ONE_THRESHOLD,
+        "profiles": recent_profiles(limit),
+    }
+
+
+@router.get("/auth-cache")
+def auth_cache_stats():
+    """Hit/miss counters for the require_user token and user caches."""
+    return cache_stats()
+
+
+@router.get("/read-coalescing")
+def read_coalescing_stats():
+    """How many list requests joined an identical in-flight request instead of querying."""
+    return coalescing_stats()
+
+
+@router.get("/realtime")
+def realtime_stats():
+    """Live-sync socket count, queued outbound messages and overflow drops."""
+    return connection_stats()
+
+
+@router.post("/rollups/rebuild")
+def rebuild_health_rollups(session: Session = Depends(get_db)):
+    """Recompute every solution/project rollup row from the base tables."""
+    return rebuild_rollups(session)
+
+
+@router.get("/auto-rag")
+def auto_rag_stats():
+    """Auto-RAG scheduler state: queued due dates, the next one, runs and solutions changed."""
+    return auto_rag_scheduler.stats()
+
+
+@router.post("/auto-rag/recompute")
+def recompute_auto_rag(session: Session = Depends(get_db)):
+    """Re-evaluate every auto-RAG solution now (recovery); returns how many changed."""
+    return {"changed": apply_auto_rag(session, full=True)}
+
+
+@router.post("/search/rebuild")
+def rebuild_search(session: Session = Depends(get_db)):
+    """Re-index every live project, solution and subcomponent for GET /api/search."""
+    return rebuild_search_index(session)
+
+
+@router.get("/query-plans")
+def query_plans(session: Session = Depends(get_db)):
+    """EXPLAIN QUERY PLAN of every hot list query and whether it walks its partial index in order."""
+    if session.get_bind().dialect.name != "sqlite":
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Query plans require SQLite")
+    return query_plan_report(session)
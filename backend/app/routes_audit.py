@@ -4,24 +4,24 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from .deps import get_db, require_user
+from .db import ReadSession
+from .deps import get_read_db, require_user
 from .models import ChangeLog
 from .schemas import ChangeLogRead
 
 router = APIRouter(dependencies=[Depends(require_user)])
 
 
-@router.get("/audit", response_model=List[ChangeLogRead])
-def list_audit(
-    entity_type: Optional[str] = None,
-    entity_id: Optional[str] = None,
-    field: Optional[str] = None,
-    user_id: Optional[str] = None,
-    since: Optional[datetime] = None,
-    until: Optional[datetime] = None,
-    limit: int = Query(100, ge=1, le=500),
-    session: Session = Depends(get_db),
-):
+def _load_audit(
+    session: Session,
+    entity_type: Optional[str],
+    entity_id: Optional[str],
+    field: Optional[str],
+    user_id: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    limit: int,
+) -> List[ChangeLog]:
     query = session.query(ChangeLog)
     if entity_type:
         query = query.filter(ChangeLog.entity_type == entity_type)
@@ -35,5 +35,18 @@ def list_audit(
         query = query.filter(ChangeLog.created_at >= since)
     if until:
         query = query.filter(ChangeLog.created_at <= until)
-    rows = query.order_by(ChangeLog.created_at.desc()).limit(limit).all()
-    return rows
+    return query.order_by(ChangeLog.created_at.desc()).limit(limit).all()
+
+
+@router.get("/audit", response_model=List[ChangeLogRead])
+async def list_audit(
+    entity_type: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    field: Optional[str] = None,
+    user_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: ReadSession = Depends(get_read_db),
+):
+    return await db.run(_load_audit, entity_type, entity_id, field, user_id, since, until, limit)
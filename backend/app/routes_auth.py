@@ -3,15 +3,19 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from .auth import (
     clear_auth_cookies,
     create_token,
     decode_token,
     hash_password,
+    is_locked,
+    password_needs_rehash,
     set_auth_cookies,
     verify_password,
 )
+from .auth_cache import invalidate_user
 from .deps import get_db, require_user
 from .models import User
 from .schemas import UserCreate, UserLogin, UserRead
@@ -26,12 +30,21 @@ def _get_user_by_soeid(session: Session, soeid: str) -> Optional[User]:
     return session.query(User).filter(User.soeid == soeid.lower()).first()
 
 
+def _save(session: Session, user: User) -> User:
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+# login/register are `async def` so the bcrypt wait holds no request thread; their DB work still
+# goes through the threadpool.
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register(payload: UserCreate, response: Response, session: Session = Depends(get_db)):
+async def register(payload: UserCreate, response: Response, session: Session = Depends(get_db)):
     soeid_norm = str(payload.soeid).strip().lower()
     if not soeid_norm:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="SOEID is required")
-    existing = _get_user_by_soeid(session, soeid_norm)
+    existing = await run_in_threadpool(_get_user_by_soeid, session, soeid_norm)
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="SOEID already registered")
 
@@ -39,13 +52,11 @@ def register(payload: UserCreate, response: Response, session: Session = Depends
         soeid=soeid_norm,
         email=f"{soeid_norm}@citi.com",
         display_name=payload.display_name,
-        password_hash=hash_password(payload.password),
+        password_hash=await hash_password(payload.password),
         role="user",
         is_active=True,
     )
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    user = await run_in_threadpool(_save, session, user)
 
     access_token = create_token(user.user_id, user.role, "access")
     refresh_token = create_token(user.user_id, user.role, "refresh")
@@ -54,9 +65,9 @@ def register(payload: UserCreate, response: Response, session: Session = Depends
 
 
 @router.post("/login", response_model=UserRead)
-def login(payload: UserLogin, response: Response, session: Session = Depends(get_db)):
+async def login(payload: UserLogin, response: Response, session: Session = Depends(get_db)):
     soeid_norm = str(payload.soeid).strip().lower()
-    user = _get_user_by_soeid(session, soeid_norm)
+    user = await run_in_threadpool(_get_user_by_soeid, session, soeid_norm)
     now = datetime.now(timezone.utc)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
@@ -64,23 +75,31 @@ def login(payload: UserLogin, response: Response, session: Session = Depends(get
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is inactive")
 
-    if user.locked_until and user.locked_until > now:
+    if is_locked(user.locked_until, now):
         raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="Account locked. Try again later.")
 
-    if not verify_password(payload.password, user.password_hash):
+    if not await verify_password(payload.password, user.password_hash):
         user.failed_attempts += 1
         if user.failed_attempts >= MAX_FAILED_ATTEMPTS:
             user.locked_until = now + timedelta(minutes=LOCKOUT_MINUTES)
-        session.add(user)
-        session.commit()
+        await run_in_threadpool(_save, session, user)
+        invalidate_user(user.user_id)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     user.failed_attempts = 0
     user.locked_until = None
     user.last_login_at = now
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    if password_needs_rehash(user.password_hash):
+        # Transparently move to the current JIRA_LITE_BCRYPT_ROUNDS cost while we hold the plaintext.
+        try:
+            user.password_hash = await hash_password(payload.password)
+        except HTTPException as exc:
+            if exc.status_code != status.HTTP_503_SERVICE_UNAVAILABLE:
+                raise
+            # The bcrypt pool is saturated: the password was correct, so keep the old hash (a later
+            # login rehashes it) rather than failing the login.
+    user = await run_in_threadpool(_save, session, user)
+    invalidate_user(user.user_id)
 
     access_token = create_token(user.user_id, user.role, "access")
     refresh_token = create_token(user.user_id, user.role, "refresh")
@@ -0,0 +1,64 @@
+import json
+from typing import Iterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .db import read_snapshot
+from .deps import get_db
+from .models import Phase, Project, Solution, Subcomponent
+from .routes_phases import PHASE_COLUMNS
+from .routes_projects import PROJECT_COLUMNS, PROJECT_ORDER
+from .routes_solutions import SOLUTION_COLUMNS, SOLUTION_ORDER
+from .routes_subcomponents import SUBCOMPONENT_COLUMNS, SUBCOMPONENT_ORDER
+from .serialization import rows_json
+from .versioning import GLOBAL_VERSION, current_versions
+
+router = APIRouter()
+
+# Rows loaded, encoded and sent per chunk; only one chunk is held in memory at a time.
+BOOTSTRAP_BATCH_SIZE = 500
+
+_COLLECTIONS = (
+    ("phases", select(*PHASE_COLUMNS).order_by(Phase.sequence.asc())),
+    ("projects", select(*PROJECT_COLUMNS).where(Project.deleted_at.is_(None)).order_by(*PROJECT_ORDER)),
+    ("solutions", select(*SOLUTION_COLUMNS).where(Solution.deleted_at.is_(None)).order_by(*SOLUTION_ORDER)),
+    (
+        "subcomponents",
+        select(*SUBCOMPONENT_COLUMNS).where(Subcomponent.deleted_at.is_(None)).order_by(*SUBCOMPONENT_ORDER),
+    ),
+)
+
+
+def _rows_json(session: Session, statement) -> Iterator[bytes]:
+    """Comma-separated JSON objects for every row of `statement`, one batch per chunk."""
+    result = session.execute(statement.execution_options(yield_per=BOOTSTRAP_BATCH_SIZE))
+    first = True
+    for batch in result.partitions():
+        body = rows_json(batch)[1:-1]
+        if body:
+            yield body if first else b"," + body
+            first = False
+
+
+def _stream_bootstrap(bind: Engine) -> Iterator[bytes]:
+    with read_snapshot(bind) as session:
+        version = current_versions(session)[GLOBAL_VERSION]
+        yield b'{"version":' + json.dumps(version).encode("ascii")
+        for name, statement in _COLLECTIONS:
+            yield f',"{name}":['.encode("ascii")
+            yield from _rows_json(session, statement)
+            yield b"]"
+        yield b"}"
+
+
+@router.get("/bootstrap")
+def bootstrap(session: Session = Depends(get_db)):
+    """
+    Phases, live projects, solutions and subcomponents plus the data version they reflect, read in
+    one transaction and streamed as `{"version", "phases", "projects", "solutions", "subcomponents"}`.
+    """
+    return StreamingResponse(_stream_bootstrap(session.get_bind()), media_type="application/json")
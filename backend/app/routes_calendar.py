@@ -0,0 +1,250 @@
+import calendar
+import os
+from datetime import date, timedelta
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .db import ReadSession
+from .deps import get_read_db
+from .enums import SolutionStatus, SubcomponentStatus
+from .etags import list_etag, not_modified, request_key
+from .models import Solution, Subcomponent, normalize_key
+from .routes_solutions import filter_solutions
+from .serialization import dumps, json_response
+
+router = APIRouter()
+
+CALENDAR_MAX_DAYS = int(os.getenv("JIRA_LITE_CALENDAR_MAX_DAYS", "400"))
+CALENDAR_DEFAULT_TOP = int(os.getenv("JIRA_LITE_CALENDAR_TOP", "5"))
+CALENDAR_MAX_TOP = 50
+
+_CALENDAR_TABLES = ("solutions", "subcomponents")
+# Columns of each top-N item, then the "top" order within a bucket: most urgent priority first.
+CALENDAR_ITEMS = {
+    "solutions": (
+        (
+            Solution.solution_id,
+            Solution.project_id,
+            Solution.solution_name,
+            Solution.version,
+            Solution.status,
+            Solution.rag_status,
+            Solution.priority,
+            Solution.due_date,
+            Solution.owner,
+            Solution.assignee,
+        ),
+        (Solution.priority, Solution.due_date, Solution.created_at, Solution.solution_id),
+    ),
+    "subcomponents": (
+        (
+            Subcomponent.subcomponent_id,
+            Subcomponent.project_id,
+            Subcomponent.solution_id,
+            Subcomponent.subcomponent_name,
+            Subcomponent.status,
+            Subcomponent.priority,
+            Subcomponent.due_date,
+            Subcomponent.assignee,
+        ),
+        (Subcomponent.priority, Subcomponent.due_date, Subcomponent.created_at, Subcomponent.subcomponent_id),
+    ),
+}
+Granularity = Literal["day", "week", "month"]
+
+
+def _bucket(column, granularity: str):
+    """SQLite expression for the first day of the bucket holding `column` (weeks start on Monday)."""
+    if granularity == "week":
+        # 'weekday 0' moves forward to Sunday (a Sunday stays put); six days back is that week's Monday.
+        return func.date(column, "weekday 0", "-6 days")
+    if granularity == "month":
+        return func.strftime("%Y-%m-01", column)
+    return func.date(column)
+
+
+def _bucket_end(start: date, granularity: str) -> date:
+    if granularity == "week":
+        return start + timedelta(days=6)
+    if granularity == "month":
+        return start.replace(day=calendar.monthrange(start.year, start.month)[1])
+    return start
+
+
+def _calendar_status(raw: Optional[str]) -> Dict[str, Any]:
+    """`status` per kind: solution and subcomponent statuses differ, so a value may match only one."""
+    if raw is None:
+        return {"solutions": None, "subcomponents": None}
+    parsed = {
+        "solutions": next((s for s in SolutionStatus if s.value == raw), False),
+        "subcomponents": next((s for s in SubcomponentStatus if s.value == raw), False),
+    }
+    if not any(parsed.values()):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown status: {raw}")
+    return parsed
+
+
+def _calendar_query(
+    session: Session,
+    kind: str,
+    start: date,
+    end: date,
+    project_id: Optional[str],
+    status_filter: Any,
+    owner: Optional[str],
+    assignee: Optional[str],
+):
+    """Live rows of one kind due in [start, end]; the due_date range is what the index scans."""
+    columns, order = CALENDAR_ITEMS[kind]
+    if kind == "solutions":
+        query = session.query(*columns).filter(Solution.deleted_at.is_(None))
+        if project_id:
+            query = query.filter(Solution.project_id == project_id)
+        return filter_solutions(query, status_filter, owner, assignee, None, None, end, start)
+    query = session.query(*columns).filter(
+        Subcomponent.deleted_at.is_(None), Subcomponent.due_date >= start, Subcomponent.due_date <= end
+    )
+    if project_id:
+        query = query.filter(Subcomponent.project_id == project_id)
+    if status_filter:
+        query = query.filter(Subcomponent.status == status_filter)
+    if owner:
+        # Subcomponents have no owner of their own: match the owner of their solution.
+        owned = select(Solution.solution_id).where(
+            Solution.owner_norm == normalize_key(owner), Solution.deleted_at.is_(None)
+        )
+        query = query.filter(Subcomponent.solution_id.in_(owned))
+    if assignee:
+        query = query.filter(Subcomponent.assignee_norm == normalize_key(assignee))
+    return query
+
+
+def calendar_buckets(
+    session: Session,
+    kind: str,
+    start: date,
+    end: date,
+    granularity: str,
+    top: int,
+    project_id: Optional[str] = None,
+    status_filter: Any = None,
+    owner: Optional[str] = None,
+    assignee: Optional[str] = None,
+) -> Dict[date, Dict[str, Any]]:
+    """
+    `{bucket start: {"count", "items"}}` for one kind in a single query: the window functions count
+    every row of a bucket and rank it by priority, and only the top `top` ranks are returned.
+    """
+    columns, order = CALENDAR_ITEMS[kind]
+    due_date = columns[[column.key for column in columns].index("due_date")]
+    bucket = _bucket(due_date, granularity)
+    ranked = (
+        _calendar_query(session, kind, start, end, project_id, status_filter, owner, assignee)
+        .add_columns(
+            bucket.label("bucket"),
+            func.count().over(partition_by=bucket).label("bucket_count"),
+            func.row_number().over(partition_by=bucket, order_by=order).label("bucket_rank"),
+        )
+        .subquery()
+    )
+    rows = session.execute(
+        select(ranked)
+        # Rank 1 is always selected so buckets still report their count when top=0.
+        .where(ranked.c.bucket_rank <= max(top, 1))
+        .order_by(ranked.c.bucket, ranked.c.bucket_rank)
+    ).all()
+    keys = [column.key for column in columns]
+    buckets: Dict[date, Dict[str, Any]] = {}
+    for row in rows:
+        entry = buckets.setdefault(date.fromisoformat(row.bucket), {"count": row.bucket_count, "items": []})
+        if row.bucket_rank <= top:
+            entry["items"].append({key: row._mapping[key] for key in keys})
+    return buckets
+
+
+def _load_calendar(
+    session: Session,
+    start: date,
+    end: date,
+    granularity: str,
+    top: int,
+    kinds: List[str],
+    project_id: Optional[str],
+    statuses: Dict[str, Any],
+    owner: Optional[str],
+    assignee: Optional[str],
+) -> Dict[str, Any]:
+    empty = {"count": 0, "items": []}
+    per_kind = {}
+    for kind in kinds:
+        if statuses[kind] is False:  # the status only exists for the other kind
+            per_kind[kind] = {}
+            continue
+        per_kind[kind] = calendar_buckets(
+            session, kind, start, end, granularity, top, project_id, statuses[kind], owner, assignee
+        )
+    starts = sorted({bucket for buckets in per_kind.values() for bucket in buckets})
+    return {
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "granularity": granularity,
+        "top": top,
+        "buckets": [
+            {
+                "start": bucket.isoformat(),
+                "end": _bucket_end(bucket, granularity).isoformat(),
+                **{kind: per_kind[kind].get(bucket, empty) for kind in kinds},
+            }
+            for bucket in starts
+        ],
+    }
+
+
+@router.get("/calendar")
+async def get_calendar(
+    request: Request,
+    response: Response,
+    from_: date = Query(..., alias="from"),
+    to: date = Query(...),
+    granularity: Granularity = "day",
+    kind: Optional[Literal["solutions", "subcomponents"]] = None,
+    top: int = Query(CALENDAR_DEFAULT_TOP, ge=0, le=CALENDAR_MAX_TOP),
+    project_id: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    owner: Optional[str] = None,
+    assignee: Optional[str] = None,
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Due dates in `[from, to]` grouped by day, week (Monday first) or month: per bucket the number of
+    solutions and subcomponents due and the `top` most urgent of each. Only non-empty buckets are
+    returned; edge buckets count only dates inside the range.
+    """
+    if to < from_:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' is before 'from'")
+    if (to - from_).days + 1 > CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Calendar range is limited to {CALENDAR_MAX_DAYS} days",
+        )
+    statuses = _calendar_status(status_filter)
+    etag = await db.run(list_etag, _CALENDAR_TABLES, request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    body = await db.run(
+        _load_calendar,
+        from_,
+        to,
+        granularity,
+        top,
+        [kind] if kind else list(CALENDAR_ITEMS),
+        project_id,
+        statuses,
+        owner,
+        assignee,
+    )
+    return json_response(response, dumps(body))
@@ -0,0 +1,73 @@
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from .db import ReadSession
+from .deps import get_read_db
+from .models import Project, Solution, SolutionPhase, Subcomponent
+from .schemas import ChangesRead
+from .versioning import GLOBAL_VERSION, current_versions
+
+router = APIRouter()
+
+# Above this many changed rows the client is told to reload everything instead of applying a delta.
+MAX_CHANGES = int(os.getenv("JIRA_LITE_MAX_CHANGES", "2000"))
+
+
+def _changed(session: Session, model, since: int, version: int, limit: int) -> list:
+    return (
+        session.query(model)
+        .filter(model.data_version > since)
+        .filter(model.data_version <= version)
+        .order_by(model.data_version.asc())
+        .limit(limit + 1)
+        .all()
+    )
+
+
+def _load_changes(session: Session, since: Optional[int], limit: int) -> dict:
+    # The SELECTs below are separate statements (pysqlite/aiosqlite do not open a read transaction),
+    # so later commits can land between them. Bounding every read by `data_version <= version` is
+    # what keeps the delta consistent: rows written after `version` was read are left for the next
+    # delta, which starts from `version`. A row rewritten in the meantime drops out of this delta and
+    # shows up in the next one with its newer state.
+    version = current_versions(session, [])[GLOBAL_VERSION]
+    result = {"version": version, "since": since}
+    if since is None or since == version:
+        return result
+    if since > version:
+        return {**result, "resync_required": True}
+
+    deleted = {}
+    for key, model, id_attr in (
+        ("projects", Project, "project_id"),
+        ("solutions", Solution, "solution_id"),
+        ("subcomponents", Subcomponent, "subcomponent_id"),
+    ):
+        rows = _changed(session, model, since, version, limit)
+        if len(rows) > limit:
+            return {**result, "resync_required": True}
+        result[key] = [row for row in rows if row.deleted_at is None]
+        deleted[key] = [getattr(row, id_attr) for row in rows if row.deleted_at is not None]
+    solution_phases = _changed(session, SolutionPhase, since, version, limit)
+    if len(solution_phases) > limit:
+        return {**result, "resync_required": True}
+    result["solution_phases"] = solution_phases
+    result["deleted"] = deleted
+    return result
+
+
+@router.get("/changes", response_model=ChangesRead)
+async def list_changes(
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(MAX_CHANGES, ge=1, le=MAX_CHANGES),
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Rows written after data version `since`, with ids of soft-deleted rows as tombstones.
+
+    Without `since` only the current version is returned (use it to seed a client after a full load).
+    """
+    return await db.run(_load_changes, since, limit)
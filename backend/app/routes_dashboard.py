@@ -0,0 +1,190 @@
+import os
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .auth_cache import TTLCache
+from .db import ReadSession
+from .deps import get_read_db
+from .enums import SolutionStatus, SubcomponentStatus
+from .etags import list_etag, not_modified, request_key
+from .models import Project, Solution, Subcomponent
+from .rollups import project_health, solution_health
+from .routes_solutions import filter_solutions
+from .schemas import ProjectHealthRead, SolutionHealthRead
+from .serialization import dumps, json_response
+from .versioning import GLOBAL_VERSION, current_versions
+
+router = APIRouter()
+
+# Encoded summaries keyed by ETag (filters + data versions + today's date); the TTL only bounds
+# memory for keys that will never be asked for again.
+DASHBOARD_CACHE_SIZE = int(os.getenv("JIRA_LITE_DASHBOARD_CACHE_SIZE", "256"))
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("JIRA_LITE_DASHBOARD_CACHE_TTL", "3600"))
+summary_cache = TTLCache(DASHBOARD_CACHE_SIZE, DASHBOARD_CACHE_TTL_SECONDS)
+
+_DASHBOARD_TABLES = ("projects", "solutions", "subcomponents")
+_CLOSED_SOLUTION = (SolutionStatus.complete, SolutionStatus.abandoned)
+_CLOSED_SUBCOMPONENT = (SubcomponentStatus.complete, SubcomponentStatus.abandoned)
+
+
+def _value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+def _counts(session: Session, filtered, column) -> List[Dict[str, Any]]:
+    """`[{"value", "count"}]` for one GROUP BY over the filtered rows, largest first."""
+    rows = session.execute(
+        select(column, func.count())
+        .select_from(filtered)
+        .group_by(column)
+        .order_by(func.count().desc(), column.asc())
+    ).all()
+    return [{"value": _value(value), "count": count} for value, count in rows]
+
+
+def _people_counts(session: Session, filtered, column, norm) -> List[Dict[str, Any]]:
+    """`_counts` for a people column, grouped on its `*_norm` shadow so "Ana" and "ana " are one entry."""
+    rows = session.execute(
+        select(func.min(column), func.count())
+        .select_from(filtered)
+        .group_by(norm)
+        .order_by(func.count().desc(), norm.asc())
+    ).all()
+    return [{"value": value, "count": count} for value, count in rows]
+
+
+def _load_summary(
+    session: Session,
+    project_id: Optional[str],
+    status_filter: Optional[SolutionStatus],
+    owner: Optional[str],
+    assignee: Optional[str],
+    phase: Optional[str],
+    priority: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    today: date,
+) -> Dict[str, Any]:
+    query = session.query(Solution).filter(Solution.deleted_at.is_(None))
+    if project_id:
+        query = query.filter(Solution.project_id == project_id)
+    query = filter_solutions(query, status_filter, owner, assignee, phase, priority, due_before, due_after)
+    filtered = query.subquery()
+    overdue = (filtered.c.due_date < today) & filtered.c.status.not_in(_CLOSED_SOLUTION)
+    totals = session.execute(
+        select(
+            func.count(),
+            func.count().filter(overdue),
+            func.count().filter(filtered.c.due_date.is_(None)),
+            func.avg(filtered.c.priority),
+        ).select_from(filtered)
+    ).one()
+
+    # Subcomponents of the filtered solutions, so both sections describe the same slice.
+    tasks = (
+        session.query(Subcomponent)
+        .filter(
+            Subcomponent.deleted_at.is_(None),
+            Subcomponent.solution_id.in_(select(filtered.c.solution_id)),
+        )
+        .subquery()
+    )
+    task_overdue = (tasks.c.due_date < today) & tasks.c.status.not_in(_CLOSED_SUBCOMPONENT)
+    task_totals = session.execute(
+        select(func.count(), func.count().filter(task_overdue)).select_from(tasks)
+    ).one()
+    projects = session.query(func.count(Project.project_id)).filter(Project.deleted_at.is_(None))
+    if project_id:
+        projects = projects.filter(Project.project_id == project_id)
+
+    return {
+        "version": current_versions(session, _DASHBOARD_TABLES)[GLOBAL_VERSION],
+        "as_of": today.isoformat(),
+        "projects": {"total": projects.scalar()},
+        "solutions": {
+            "total": totals[0],
+            "overdue": totals[1],
+            "no_due_date": totals[2],
+            "avg_priority": round(totals[3], 2) if totals[3] is not None else None,
+            "by_status": _counts(session, filtered, filtered.c.status),
+            "by_rag": _counts(session, filtered, filtered.c.rag_status),
+            "by_phase": _counts(session, filtered, filtered.c.current_phase),
+            "by_owner": _people_counts(session, filtered, filtered.c.owner, filtered.c.owner_norm),
+            "by_assignee": _people_counts(session, filtered, filtered.c.assignee, filtered.c.assignee_norm),
+            "by_priority": _counts(session, filtered, filtered.c.priority),
+        },
+        "subcomponents": {
+            "total": task_totals[0],
+            "overdue": task_totals[1],
+            "by_status": _counts(session, tasks, tasks.c.status),
+            "by_assignee": _people_counts(session, tasks, tasks.c.assignee, tasks.c.assignee_norm),
+        },
+    }
+
+
+@router.get("/dashboard/summary")
+async def dashboard_summary(
+    request: Request,
+    response: Response,
+    project_id: Optional[str] = None,
+    status_filter: Optional[SolutionStatus] = Query(None, alias="status"),
+    owner: Optional[str] = None,
+    assignee: Optional[str] = None,
+    phase: Optional[str] = None,
+    priority: Optional[int] = None,
+    due_before: Optional[date] = None,
+    due_after: Optional[date] = None,
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Solution counts by status, RAG, phase, owner, assignee and priority plus overdue totals, for the
+    same filters as `GET /api/solutions`. Cached per data version and day.
+    """
+    today = date.today()
+    etag = await db.run(list_etag, _DASHBOARD_TABLES, f"{request_key(request)}#{today.isoformat()}")
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    body = summary_cache.get(etag)
+    if body is None:
+        summary = await db.run(
+            _load_summary,
+            project_id,
+            status_filter,
+            owner,
+            assignee,
+            phase,
+            priority,
+            due_before,
+            due_after,
+            today,
+        )
+        body = dumps(summary)
+        summary_cache.set(etag, body)
+    return json_response(response, body)
+
+
+@router.get("/dashboard/health", response_model=List[ProjectHealthRead])
+async def portfolio_health(project_id: Optional[str] = None, db: ReadSession = Depends(get_read_db)):
+    """Per-project rollups (worst-of RAG, subcomponent counts), worst RAG first."""
+    return await db.run(project_health, [project_id] if project_id else None, date.today())
+
+
+@router.get("/projects/{project_id}/health", response_model=ProjectHealthRead)
+async def get_project_health(project_id: str, db: ReadSession = Depends(get_read_db)):
+    rows = await db.run(project_health, [project_id], date.today())
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    return rows[0]
+
+
+@router.get("/solutions/{solution_id}/health", response_model=SolutionHealthRead)
+async def get_solution_health(solution_id: str, db: ReadSession = Depends(get_read_db)):
+    row = await db.run(solution_health, solution_id, date.today())
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Solution not found")
+    return row
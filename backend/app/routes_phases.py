@@ -1,30 +1,56 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, BackgroundTasks
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from .deps import get_db, current_user as current_user_dep
+from .coalescing import coalesced_list
+from .db import ReadSession
+from .deps import get_db, get_read_db, current_user as current_user_dep
+from .etags import list_etag, not_modified, request_key
 from .models import Phase, Solution, SolutionPhase, User
 from .schemas import PhaseRead, SolutionPhaseInput, SolutionPhaseRead
+from .serialization import read_columns
 from .realtime import schedule_broadcast
 from .audit_log import log_changes
 
 router = APIRouter()
 
+PHASE_COLUMNS = read_columns(Phase, PhaseRead)
+
+
+def _load_phases(session: Session) -> list:
+    return session.query(*PHASE_COLUMNS).order_by(Phase.sequence.asc()).all()
+
+
+async def _load_phase_page(db: ReadSession) -> Tuple[list, Optional[str]]:
+    return await db.run(_load_phases), None
+
 
 @router.get("/phases", response_model=List[PhaseRead])
-def list_phases(session: Session = Depends(get_db)):
-    phases = session.query(Phase).order_by(Phase.sequence.asc()).all()
-    return phases
+async def list_phases(request: Request, response: Response, db: ReadSession = Depends(get_read_db)):
+    etag = await db.run(list_etag, ("phases",), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    return await coalesced_list(response, etag, db, _load_phase_page)
 
 
 @router.get(
     "/solutions/{solution_id}/phases",
     response_model=List[SolutionPhaseRead],
 )
-def list_solution_phases(solution_id: str, session: Session = Depends(get_db)):
+def list_solution_phases(
+    solution_id: str,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_db),
+):
+    etag = list_etag(session, ("solutions", "solution_phases", "phases"), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     _ensure_solution_exists(session, solution_id)
     return _ordered_solution_phases(session, solution_id)
 
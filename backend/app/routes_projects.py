@@ -1,22 +1,27 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 
 import csv
 from io import StringIO
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status, BackgroundTasks
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from .deps import get_db, current_user as current_user_dep
+from .coalescing import coalesced_list
+from .db import ReadSession
+from .deps import get_db, get_read_db, current_user as current_user_dep
 from .enums import ProjectStatus
-from .models import Project, User
+from .etags import list_etag, not_modified, request_key, row_etag
+from .models import Project, User, normalize_key
+from .pagination import MAX_PAGE_SIZE, keyset_page
 from .schemas import ProjectCreate, ProjectRead, ProjectUpdate
+from .serialization import read_columns, requested_fields, select_columns
 from .utils import derive_abbreviation, normalize_status, normalize_str, read_csv
 from .realtime import schedule_broadcast
 from .audit_log import log_changes
+from .versioning import hold_changes, release_changes
 
 router = APIRouter()
 
@@ -37,21 +42,57 @@ def _get_project_or_404(session: Session, project_id: str) -> Project:
     return project
 
 
+PROJECT_ORDER = (Project.created_at, Project.project_id)
+# List routes select just these columns and encode the rows directly (see serialization.py).
+PROJECT_COLUMNS = read_columns(Project, ProjectRead)
+# `view=summary`: what tables and pickers show; description and success criteria are not loaded.
+PROJECT_SUMMARY_FIELDS = ("project_id", "project_name", "name_abbreviation", "status", "sponsor", "updated_at")
+
+
+def _load_projects(
+    session: Session,
+    status_filter: Optional[ProjectStatus],
+    sponsor: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    paginate: bool,
+    columns=PROJECT_COLUMNS,
+) -> Tuple[list, Optional[str]]:
+    query = _project_query(session).with_entities(*columns)
+    if status_filter:
+        query = query.filter(Project.status == status_filter)
+    if sponsor:
+        query = query.filter(Project.sponsor_norm == normalize_key(sponsor))
+    return keyset_page(query, PROJECT_ORDER, limit, cursor, paginate)
+
+
 @router.get("", response_model=List[ProjectRead])
 @router.get("/", response_model=List[ProjectRead])
-def list_projects(
+async def list_projects(
+    request: Request,
+    response: Response,
     status_filter: Optional[ProjectStatus] = None,
     sponsor: Optional[str] = None,
-    session: Session = Depends(get_db),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    paginate: bool = True,
+    fields: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    db: ReadSession = Depends(get_read_db),
 ):
-    query = _project_query(session)
-    if status_filter:
-        query = query.filter(Project.status == status_filter)
-    if sponsor:
-        sponsor_norm = sponsor.strip().lower()
-        query = query.filter(func.lower(Project.sponsor) == sponsor_norm)
-    projects = query.all()
-    return projects
+    wanted = requested_fields(PROJECT_COLUMNS, fields, view, PROJECT_SUMMARY_FIELDS, "project_id")
+    columns = select_columns(PROJECT_COLUMNS, wanted, PROJECT_ORDER)
+    etag = await db.run(list_etag, ("projects",), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    return await coalesced_list(
+        response,
+        etag,
+        db,
+        lambda flight_db: flight_db.run(_load_projects, status_filter, sponsor, limit, cursor, paginate, columns),
+        wanted,
+    )
 
 
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -121,6 +162,8 @@ def import_projects(
     new_abbrevs = set()
     request_id = str(uuid4())
 
+    # Rows commit one by one; announce the whole import as one live-sync event.
+    hold_changes(session)
     for idx, row in enumerate(rows, start=2):  # header is row 1
         name = normalize_str(row.get("project_name"))
         sponsor = normalize_str(row.get("sponsor"))
@@ -218,6 +261,7 @@ def import_projects(
         except Exception as exc:
             session.rollback()
             errors.append(f"Row {idx}: {exc}")
+    release_changes(session)
     schedule_broadcast("projects")
     return {"created": created, "updated": updated, "errors": errors, "total_rows": len(rows)}
 
@@ -246,7 +290,22 @@ def export_projects(session: Session = Depends(get_db)):
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
-def get_project(project_id: str, session: Session = Depends(get_db)):
+def get_project(
+    project_id: str,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_db),
+):
+    etag = row_etag(
+        session,
+        Project,
+        request_key(request),
+        Project.project_id == project_id,
+        Project.deleted_at.is_(None),
+    )
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     project = _get_project_or_404(session, project_id)
     return project
 
@@ -0,0 +1,45 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from .db import ReadSession
+from .deps import get_read_db
+from .etags import list_etag, not_modified, request_key
+from .pagination import NEXT_CURSOR_HEADER
+from .schemas import SearchResultRead
+from .search import search
+
+router = APIRouter()
+
+_SEARCH_TABLES = ("projects", "solutions", "subcomponents")
+
+
+def _search(session, q, kind, project_id, limit, cursor):
+    if session.get_bind().dialect.name != "sqlite":
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Search requires SQLite FTS5")
+    return search(session, q, kind, project_id, limit, cursor)
+
+
+@router.get("/search", response_model=List[SearchResultRead])
+async def search_entities(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[Literal["projects", "solutions", "subcomponents"]] = None,
+    project_id: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Full-text search over names, descriptions, success criteria, blockers and risks of live
+    projects, solutions and subcomponents. Every word must match as a prefix; best matches first.
+    """
+    etag = await db.run(list_etag, _SEARCH_TABLES, request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    results, next_cursor = await db.run(_search, q, kind, project_id, limit, cursor)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return results
@@ -1,18 +1,29 @@
 import csv
 from datetime import date, datetime, timezone
 from io import StringIO
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status, BackgroundTasks, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, status, BackgroundTasks, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from .deps import get_db, current_user as current_user_dep
+from .coalescing import coalesced_list
+from .db import ReadSession
+from .deps import get_db, get_read_db, current_user as current_user_dep
 from .enums import ProjectStatus, RagSource, RagStatus, SolutionStatus
-from .models import Phase, Project, Solution, SolutionPhase, User
+from .etags import list_etag, not_modified, request_key, row_etag
+from .models import Phase, Project, Solution, SolutionPhase, User, normalize_key
+from .pagination import MAX_PAGE_SIZE, keyset_page
 from .schemas import SolutionCreate, SolutionRead, SolutionUpdate
+from .serialization import (
+    json_list_response,
+    read_columns,
+    requested_fields,
+    rows_json,
+    select_columns,
+)
 from .utils import (
     derive_abbreviation,
     enable_all_phases,
@@ -24,16 +35,17 @@ from .utils import (
 )
 from .realtime import schedule_broadcast
 from .audit_log import log_changes
+from .versioning import hold_changes, release_changes
 
 router = APIRouter()
 
 
-def _compute_auto_rag(status: SolutionStatus, due_date: Optional[date]) -> RagStatus:
+def compute_auto_rag(status: SolutionStatus, due_date: Optional[date], today: Optional[date] = None) -> RagStatus:
     if status == SolutionStatus.complete:
         return RagStatus.green
     if status == SolutionStatus.abandoned:
         return RagStatus.red
-    if due_date and due_date < date.today():
+    if due_date and due_date < (today or date.today()):
         return RagStatus.red
     return RagStatus.amber
 
@@ -69,10 +81,47 @@ def _ensure_project_exists(session: Session, project_id: str) -> None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
 
+SOLUTION_ORDER = (Solution.priority, Solution.created_at, Solution.solution_id)
+# List routes select just these columns and encode the rows directly (see serialization.py).
+SOLUTION_COLUMNS = read_columns(Solution, SolutionRead)
+# `view=summary` leaves out the free-text columns tables and kanban cards do not show.
+SOLUTION_TEXT_FIELDS = ("rag_reason", "description", "success_criteria", "blockers", "risks")
+SOLUTION_SUMMARY_FIELDS = tuple(
+    column.key for column in SOLUTION_COLUMNS if column.key not in SOLUTION_TEXT_FIELDS
+)
+
+
 def _solution_query(session: Session):
     return session.query(Solution).filter(Solution.deleted_at.is_(None))
 
 
+def filter_solutions(
+    query,
+    status_filter: Optional[SolutionStatus],
+    owner: Optional[str],
+    assignee: Optional[str],
+    phase: Optional[str],
+    priority: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+):
+    if status_filter:
+        query = query.filter(Solution.status == status_filter)
+    if owner:
+        query = query.filter(Solution.owner_norm == normalize_key(owner))
+    if assignee:
+        query = query.filter(Solution.assignee_norm == normalize_key(assignee))
+    if phase:
+        query = query.filter(Solution.current_phase == phase)
+    if priority is not None:
+        query = query.filter(Solution.priority == priority)
+    if due_before:
+        query = query.filter(Solution.due_date <= due_before)
+    if due_after:
+        query = query.filter(Solution.due_date >= due_after)
+    return query
+
+
 def _get_solution_or_404(session: Session, solution_id: str) -> Solution:
     solution = (
         session.query(Solution)
@@ -130,11 +179,37 @@ def _validate_current_phase(session: Session, solution_id: str, current_phase: O
         )
 
 
+def _load_all_solutions(
+    session: Session,
+    project_id: Optional[str],
+    status_filter: Optional[SolutionStatus],
+    owner: Optional[str],
+    assignee: Optional[str],
+    phase: Optional[str],
+    priority: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    limit: Optional[int],
+    cursor: Optional[str],
+    paginate: bool,
+    columns=SOLUTION_COLUMNS,
+) -> Tuple[list, Optional[str]]:
+    query = _solution_query(session).with_entities(*columns)
+    if project_id:
+        query = query.filter(Solution.project_id == project_id)
+    query = filter_solutions(
+        query, status_filter, owner, assignee, phase, priority, due_before, due_after
+    )
+    return keyset_page(query, SOLUTION_ORDER, limit, cursor, paginate)
+
+
 @router.get(
     "/solutions",
     response_model=List[SolutionRead],
 )
-def list_all_solutions(
+async def list_all_solutions(
+    request: Request,
+    response: Response,
     project_id: Optional[str] = None,
     status_filter: Optional[SolutionStatus] = Query(None, alias="status"),
     owner: Optional[str] = None,
@@ -143,26 +218,40 @@ def list_all_solutions(
     priority: Optional[int] = None,
     due_before: Optional[date] = None,
     due_after: Optional[date] = None,
-    session: Session = Depends(get_db),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    paginate: bool = True,
+    fields: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    db: ReadSession = Depends(get_read_db),
 ):
-    query = _solution_query(session)
-    if project_id:
-        query = query.filter(Solution.project_id == project_id)
-    if status_filter:
-        query = query.filter(Solution.status == status_filter)
-    if owner:
-        query = query.filter(func.lower(Solution.owner) == owner.strip().lower())
-    if assignee:
-        query = query.filter(func.lower(Solution.assignee) == assignee.strip().lower())
-    if phase:
-        query = query.filter(Solution.current_phase == phase)
-    if priority is not None:
-        query = query.filter(Solution.priority == priority)
-    if due_before:
-        query = query.filter(Solution.due_date <= due_before)
-    if due_after:
-        query = query.filter(Solution.due_date >= due_after)
-    return query.order_by(Solution.priority.asc(), Solution.created_at.asc()).all()
+    wanted = requested_fields(SOLUTION_COLUMNS, fields, view, SOLUTION_SUMMARY_FIELDS, "solution_id")
+    columns = select_columns(SOLUTION_COLUMNS, wanted, SOLUTION_ORDER)
+    etag = await db.run(list_etag, ("solutions",), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    return await coalesced_list(
+        response,
+        etag,
+        db,
+        lambda flight_db: flight_db.run(
+            _load_all_solutions,
+            project_id,
+            status_filter,
+            owner,
+            assignee,
+            phase,
+            priority,
+            due_before,
+            due_after,
+            limit,
+            cursor,
+            paginate,
+            columns,
+        ),
+        wanted,
+    )
 
 
 @router.get(
@@ -171,6 +260,8 @@ def list_all_solutions(
 )
 def list_solutions(
     project_id: str,
+    request: Request,
+    response: Response,
     status_filter: Optional[SolutionStatus] = Query(None, alias="status"),
     owner: Optional[str] = None,
     assignee: Optional[str] = None,
@@ -178,26 +269,29 @@ def list_solutions(
     priority: Optional[int] = None,
     due_before: Optional[date] = None,
     due_after: Optional[date] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    paginate: bool = True,
+    fields: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
     session: Session = Depends(get_db),
 ):
+    wanted = requested_fields(SOLUTION_COLUMNS, fields, view, SOLUTION_SUMMARY_FIELDS, "solution_id")
+    etag = list_etag(session, ("projects", "solutions"), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     _ensure_project_exists(session, project_id)
-    query = _solution_query(session).filter(Solution.project_id == project_id)
-    if status_filter:
-        query = query.filter(Solution.status == status_filter)
-    if owner:
-        query = query.filter(func.lower(Solution.owner) == owner.strip().lower())
-    if assignee:
-        query = query.filter(func.lower(Solution.assignee) == assignee.strip().lower())
-    if phase:
-        query = query.filter(Solution.current_phase == phase)
-    if priority is not None:
-        query = query.filter(Solution.priority == priority)
-    if due_before:
-        query = query.filter(Solution.due_date <= due_before)
-    if due_after:
-        query = query.filter(Solution.due_date >= due_after)
-    solutions = query.all()
-    return solutions
+    query = (
+        _solution_query(session)
+        .with_entities(*select_columns(SOLUTION_COLUMNS, wanted, SOLUTION_ORDER))
+        .filter(Solution.project_id == project_id)
+    )
+    query = filter_solutions(
+        query, status_filter, owner, assignee, phase, priority, due_before, due_after
+    )
+    solutions, next_cursor = keyset_page(query, SOLUTION_ORDER, limit, cursor, paginate)
+    return json_list_response(response, rows_json(solutions, wanted), next_cursor)
 
 
 @router.post(
@@ -256,7 +350,7 @@ def create_solution(
             )
     else:
         rag_source = RagSource.auto
-        rag_status = _compute_auto_rag(payload.status, payload.due_date)
+        rag_status = compute_auto_rag(payload.status, payload.due_date)
         rag_reason = None
 
     solution = Solution(
@@ -340,6 +434,8 @@ def import_solutions(
     abbrevs = {p.name_abbreviation for p in projects_by_name.values()}
     new_abbrevs = set()
 
+    # Rows commit one by one; announce the whole import as one live-sync event.
+    hold_changes(session)
     for idx, row in enumerate(rows, start=2):
         project_name = normalize_str(row.get("project_name"))
         solution_name = normalize_str(row.get("solution_name"))
@@ -395,7 +491,7 @@ def import_solutions(
             rag_status_val = rag_status_raw
             rag_reason_val = rag_reason_raw
         else:
-            rag_status_val = _compute_auto_rag(status_enum, due_date_val)
+            rag_status_val = compute_auto_rag(status_enum, due_date_val)
             rag_reason_val = None
 
         project = projects_by_name.get(project_name.lower())
@@ -574,6 +670,7 @@ def import_solutions(
         except Exception as exc:
             session.rollback()
             errors.append(f"Row {idx}: {exc}")
+    release_changes(session)
     schedule_broadcast("solutions")
     return {
         "created": created,
@@ -644,7 +741,22 @@ def export_solutions(session: Session = Depends(get_db)):
 
 
 @router.get("/solutions/{solution_id}", response_model=SolutionRead)
-def get_solution(solution_id: str, session: Session = Depends(get_db)):
+def get_solution(
+    solution_id: str,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_db),
+):
+    etag = row_etag(
+        session,
+        Solution,
+        request_key(request),
+        Solution.solution_id == solution_id,
+        Solution.deleted_at.is_(None),
+    )
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     solution = _get_solution_or_404(session, solution_id)
     return solution
 
@@ -704,10 +816,10 @@ def update_solution(
         solution.rag_reason = rag_reason_val
     elif rag_source_req == RagSource.auto:
         solution.rag_source = RagSource.auto
-        solution.rag_status = _compute_auto_rag(solution.status, solution.due_date)
+        solution.rag_status = compute_auto_rag(solution.status, solution.due_date)
         solution.rag_reason = None
     elif solution.rag_source == RagSource.auto:
-        solution.rag_status = _compute_auto_rag(solution.status, solution.due_date)
+        solution.rag_status = compute_auto_rag(solution.status, solution.due_date)
         solution.rag_reason = None
 
     if any(k in update_data for k in ("solution_name", "version")):
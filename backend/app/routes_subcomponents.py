@@ -1,22 +1,32 @@
 import csv
 from datetime import datetime, timezone, date
 from io import StringIO
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status, BackgroundTasks
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status, BackgroundTasks
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from .deps import get_db, current_user as current_user_dep
+from .coalescing import coalesced_list
+from .db import ReadSession
+from .deps import get_db, get_read_db, current_user as current_user_dep
 from .enums import ProjectStatus, SolutionStatus, SubcomponentStatus
-from .models import Project, Solution, Subcomponent, User
+from .etags import list_etag, not_modified, request_key, row_etag
+from .models import Project, Solution, Subcomponent, User, normalize_key
+from .pagination import MAX_PAGE_SIZE, keyset_page
 from .schemas import (
     SubcomponentCreate,
     SubcomponentRead,
     SubcomponentUpdate,
 )
+from .serialization import (
+    json_list_response,
+    read_columns,
+    requested_fields,
+    rows_json,
+    select_columns,
+)
 from .utils import (
     derive_abbreviation,
     enable_all_phases,
@@ -28,9 +38,25 @@ from .utils import (
 )
 from .realtime import schedule_broadcast
 from .audit_log import log_changes
+from .versioning import hold_changes, release_changes
 
 router = APIRouter()
 
+SUBCOMPONENT_ORDER = (Subcomponent.priority, Subcomponent.created_at, Subcomponent.subcomponent_id)
+# List routes select just these columns and encode the rows directly (see serialization.py).
+SUBCOMPONENT_COLUMNS = read_columns(Subcomponent, SubcomponentRead)
+# `view=summary`: the fields a kanban card or table row shows.
+SUBCOMPONENT_SUMMARY_FIELDS = (
+    "subcomponent_id",
+    "project_id",
+    "solution_id",
+    "subcomponent_name",
+    "status",
+    "priority",
+    "due_date",
+    "assignee",
+)
+
 
 def _ensure_solution(session: Session, solution_id: str) -> Solution:
     solution = (
@@ -62,16 +88,30 @@ def _get_subcomponent(session: Session, subcomponent_id: str) -> Subcomponent:
 )
 def list_subcomponents(
     solution_id: str,
+    request: Request,
+    response: Response,
     status_filter: Optional[SubcomponentStatus] = Query(None, alias="status"),
     priority: Optional[int] = None,
     due_before: Optional[date] = None,
     due_after: Optional[date] = None,
     assignee: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    paginate: bool = True,
+    fields: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
     session: Session = Depends(get_db),
 ):
+    wanted = requested_fields(
+        SUBCOMPONENT_COLUMNS, fields, view, SUBCOMPONENT_SUMMARY_FIELDS, "subcomponent_id"
+    )
+    etag = list_etag(session, ("solutions", "subcomponents"), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     _ensure_solution(session, solution_id)
     query = (
-        session.query(Subcomponent)
+        session.query(*select_columns(SUBCOMPONENT_COLUMNS, wanted, SUBCOMPONENT_ORDER))
         .filter(Subcomponent.solution_id == solution_id)
         .filter(Subcomponent.deleted_at.is_(None))
     )
@@ -84,23 +124,27 @@ def list_subcomponents(
     if due_after:
         query = query.filter(Subcomponent.due_date >= due_after)
     if assignee:
-        query = query.filter(func.lower(Subcomponent.assignee) == assignee.strip().lower())
+        query = query.filter(Subcomponent.assignee_norm == normalize_key(assignee))
     # optional search could be added later
-    return query.order_by(Subcomponent.priority.asc(), Subcomponent.created_at.asc()).all()
-
-
-@router.get("/subcomponents", response_model=List[SubcomponentRead])
-def list_all_subcomponents(
-    status_filter: Optional[SubcomponentStatus] = Query(None, alias="status"),
-    project_id: Optional[str] = None,
-    solution_id: Optional[str] = None,
-    priority: Optional[int] = None,
-    due_before: Optional[date] = None,
-    due_after: Optional[date] = None,
-    assignee: Optional[str] = None,
-    session: Session = Depends(get_db),
-):
-    query = session.query(Subcomponent).filter(Subcomponent.deleted_at.is_(None))
+    subcomponents, next_cursor = keyset_page(query, SUBCOMPONENT_ORDER, limit, cursor, paginate)
+    return json_list_response(response, rows_json(subcomponents, wanted), next_cursor)
+
+
+def _load_all_subcomponents(
+    session: Session,
+    status_filter: Optional[SubcomponentStatus],
+    project_id: Optional[str],
+    solution_id: Optional[str],
+    priority: Optional[int],
+    due_before: Optional[date],
+    due_after: Optional[date],
+    assignee: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    paginate: bool,
+    columns=SUBCOMPONENT_COLUMNS,
+) -> Tuple[list, Optional[str]]:
+    query = session.query(*columns).filter(Subcomponent.deleted_at.is_(None))
     if status_filter:
         query = query.filter(Subcomponent.status == status_filter)
     if project_id:
@@ -114,8 +158,56 @@ def list_all_subcomponents(
     if due_after:
         query = query.filter(Subcomponent.due_date >= due_after)
     if assignee:
-        query = query.filter(func.lower(Subcomponent.assignee) == assignee.strip().lower())
-    return query.order_by(Subcomponent.priority.asc(), Subcomponent.created_at.asc()).all()
+        query = query.filter(Subcomponent.assignee_norm == normalize_key(assignee))
+    return keyset_page(query, SUBCOMPONENT_ORDER, limit, cursor, paginate)
+
+
+@router.get("/subcomponents", response_model=List[SubcomponentRead])
+async def list_all_subcomponents(
+    request: Request,
+    response: Response,
+    status_filter: Optional[SubcomponentStatus] = Query(None, alias="status"),
+    project_id: Optional[str] = None,
+    solution_id: Optional[str] = None,
+    priority: Optional[int] = None,
+    due_before: Optional[date] = None,
+    due_after: Optional[date] = None,
+    assignee: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    paginate: bool = True,
+    fields: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    db: ReadSession = Depends(get_read_db),
+):
+    wanted = requested_fields(
+        SUBCOMPONENT_COLUMNS, fields, view, SUBCOMPONENT_SUMMARY_FIELDS, "subcomponent_id"
+    )
+    columns = select_columns(SUBCOMPONENT_COLUMNS, wanted, SUBCOMPONENT_ORDER)
+    etag = await db.run(list_etag, ("subcomponents",), request_key(request))
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
+    return await coalesced_list(
+        response,
+        etag,
+        db,
+        lambda flight_db: flight_db.run(
+            _load_all_subcomponents,
+            status_filter,
+            project_id,
+            solution_id,
+            priority,
+            due_before,
+            due_after,
+            assignee,
+            limit,
+            cursor,
+            paginate,
+            columns,
+        ),
+        wanted,
+    )
 
 
 @router.post(
@@ -215,6 +307,8 @@ def import_subcomponents(
         for s in session.query(Solution).filter(Solution.deleted_at.is_(None)).all()
     }
 
+    # Rows commit one by one; announce the whole import as one live-sync event.
+    hold_changes(session)
     for idx, row in enumerate(rows, start=2):
         project_name = normalize_str(row.get("project_name"))
         solution_name = normalize_str(row.get("solution_name"))
@@ -424,6 +518,7 @@ def import_subcomponents(
             session.rollback()
             errors.append(f"Row {idx}: {exc}")
 
+    release_changes(session)
     schedule_broadcast("subcomponents")
     return {
         "created": created,
@@ -481,7 +576,22 @@ def export_subcomponents(session: Session = Depends(get_db)):
 
 
 @router.get("/subcomponents/{subcomponent_id}", response_model=SubcomponentRead)
-def get_subcomponent(subcomponent_id: str, session: Session = Depends(get_db)):
+def get_subcomponent(
+    subcomponent_id: str,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_db),
+):
+    etag = row_etag(
+        session,
+        Subcomponent,
+        request_key(request),
+        Subcomponent.subcomponent_id == subcomponent_id,
+        Subcomponent.deleted_at.is_(None),
+    )
+    unchanged = not_modified(request, response, etag)
+    if unchanged:
+        return unchanged
     return _get_subcomponent(session, subcomponent_id)
 
 
@@ -1,17 +1,49 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import asyncio
+import json
+from typing import Optional
 
-from .realtime import register, unregister
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+
+from . import realtime
+from .deps import socket_user
+from .models import User
+from .realtime import handle_client_message, register, unregister
 
 router = APIRouter()
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(ws: WebSocket):
-    await register(ws)
+async def websocket_endpoint(
+    ws: WebSocket,
+    message_format: str = Query("refresh", alias="format"),
+    user: Optional[User] = Depends(socket_user),
+):
+    # Events carry full rows: only signed-in users may listen (this router is outside protected_router).
+    if user is None:
+        await ws.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    client = await register(ws, deltas=message_format == "delta", user=user)
     try:
-        while True:
-            await ws.receive_text()
+        while not client.closed:
+            try:
+                text = await asyncio.wait_for(ws.receive_text(), timeout=realtime.PING_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                # Silent for too long (no pong): reap the socket instead of waiting for a failed send.
+                if client.idle_for() >= realtime.IDLE_TIMEOUT_SECONDS:
+                    unregister(ws)
+                    await ws.close(code=status.WS_1001_GOING_AWAY)
+                    break
+                client.offer({"type": "ping"})
+                continue
+            client.touch()
+            try:
+                message = json.loads(text)
+            except ValueError:
+                continue
+            handle_client_message(client, message)
     except WebSocketDisconnect:
-        unregister(ws)
+        pass
     except Exception:
+        pass
+    finally:
         unregister(ws)
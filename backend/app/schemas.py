@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, constr
 
@@ -207,3 +207,57 @@ class SubcomponentRead(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+
+
+class DeletedIds(BaseModel):
+    projects: List[str] = []
+    solutions: List[str] = []
+    subcomponents: List[str] = []
+
+
+class ChangesRead(BaseModel):
+    version: int
+    since: Optional[int] = None
+    resync_required: bool = False
+    projects: List[ProjectRead] = []
+    solutions: List[SolutionRead] = []
+    subcomponents: List[SubcomponentRead] = []
+    solution_phases: List[SolutionPhaseRead] = []
+    deleted: DeletedIds = DeletedIds()
+
+
+class SolutionHealthRead(BaseModel):
+    solution_id: str
+    project_id: str
+    subcomponent_count: int
+    to_do_count: int
+    in_progress_count: int
+    on_hold_count: int
+    complete_count: int
+    abandoned_count: int
+    overdue_count: int
+    next_due_date: Optional[date] = None
+    computed_on: date
+
+
+class ProjectHealthRead(BaseModel):
+    project_id: str
+    rag_status: Optional[RagStatus] = None
+    solution_count: int
+    red_count: int
+    amber_count: int
+    green_count: int
+    subcomponent_count: int
+    overdue_count: int
+    next_due_date: Optional[date] = None
+    computed_on: date
+
+
+class SearchResultRead(BaseModel):
+    kind: str
+    id: str
+    project_id: Optional[str] = None
+    solution_id: Optional[str] = None
+    name: str
+    snippet: Optional[str] = None
+    rank: float
@@ -0,0 +1,208 @@
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import DDL, Float, Integer, column, event, null, text
+from sqlalchemy.orm import Session
+
+from .models import Base, Project, Solution, Subcomponent
+from .pagination import decode_cursor, encode_cursor
+
+SEARCH_MAX_TERMS = int(os.getenv("JIRA_LITE_SEARCH_MAX_TERMS", "8"))
+
+# FTS5 columns, in order; bm25() weights below follow the same order (a name hit counts most).
+SEARCH_COLUMNS = ("name", "description", "success_criteria", "blockers", "risks")
+SEARCH_WEIGHTS = (10.0, 4.0, 3.0, 2.0, 2.0)
+
+# kind -> (model, id column, project column, source column per SEARCH_COLUMNS or None)
+SEARCH_SOURCES = {
+    "projects": (
+        Project,
+        "project_id",
+        "project_id",
+        ("project_name", "description", "success_criteria", None, None),
+    ),
+    "solutions": (
+        Solution,
+        "solution_id",
+        "project_id",
+        ("solution_name", "description", "success_criteria", "blockers", "risks"),
+    ),
+    "subcomponents": (
+        Subcomponent,
+        "subcomponent_id",
+        "project_id",
+        ("subcomponent_name", None, None, None, None),
+    ),
+}
+_CURSOR_COLUMNS = (column("rank", Float), column("doc_id", Integer))
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def _index_row(kind: str, row: str) -> str:
+    model, id_column, project_column, sources = SEARCH_SOURCES[kind]
+    values = ", ".join(f"{row}.{source}" if source else "NULL" for source in sources)
+    return (
+        f"INSERT INTO search_docs (kind, entity_id, project_id) "
+        f"SELECT '{kind}', {row}.{id_column}, {row}.{project_column} WHERE {row}.deleted_at IS NULL; "
+        f"INSERT INTO search_index (rowid, {', '.join(SEARCH_COLUMNS)}) "
+        f"SELECT doc_id, {values} FROM search_docs WHERE kind = '{kind}' AND entity_id = {row}.{id_column};"
+    )
+
+
+def _unindex_row(kind: str, row: str) -> str:
+    id_column = SEARCH_SOURCES[kind][1]
+    return (
+        f"DELETE FROM search_index WHERE rowid IN "
+        f"(SELECT doc_id FROM search_docs WHERE kind = '{kind}' AND entity_id = {row}.{id_column}); "
+        f"DELETE FROM search_docs WHERE kind = '{kind}' AND entity_id = {row}.{id_column};"
+    )
+
+
+def _search_ddl() -> List[str]:
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        f"{', '.join(SEARCH_COLUMNS)}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    ]
+    for kind, (model, id_column, project_column, sources) in SEARCH_SOURCES.items():
+        table = model.__tablename__
+        watched = ", ".join([project_column, "deleted_at", *(source for source in sources if source)])
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS search_{table}_insert AFTER INSERT ON {table} "
+            f"BEGIN {_index_row(kind, 'new')} END",
+            # Only writes to indexed columns (or soft deletes) re-index a row.
+            f"CREATE TRIGGER IF NOT EXISTS search_{table}_update AFTER UPDATE OF {watched} ON {table} "
+            f"BEGIN {_unindex_row(kind, 'old')} {_index_row(kind, 'new')} END",
+            f"CREATE TRIGGER IF NOT EXISTS search_{table}_delete AFTER DELETE ON {table} "
+            f"BEGIN {_unindex_row(kind, 'old')} END",
+        ]
+    return statements
+
+
+# Triggers keep the index in step with every write to the entity tables, ORM or set-based, in the
+# writer's transaction. create_all() runs these on every start, so existing databases get them too.
+for _statement in _search_ddl():
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+
+def rebuild_search_index(session: Session) -> Dict[str, int]:
+    """Re-index every live project, solution and subcomponent from scratch (repair)."""
+    session.execute(text("DELETE FROM search_index"))
+    session.execute(text("DELETE FROM search_docs"))
+    counts = {}
+    for kind, (model, id_column, project_column, sources) in SEARCH_SOURCES.items():
+        table = model.__tablename__
+        values = ", ".join(f"t.{source}" if source else "NULL" for source in sources)
+        counts[kind] = session.execute(
+            text(
+                f"INSERT INTO search_docs (kind, entity_id, project_id) "
+                f"SELECT '{kind}', {id_column}, {project_column} FROM {table} WHERE deleted_at IS NULL"
+            )
+        ).rowcount
+        session.execute(
+            text(
+                f"INSERT INTO search_index (rowid, {', '.join(SEARCH_COLUMNS)}) "
+                f"SELECT d.doc_id, {values} FROM search_docs d JOIN {table} t ON t.{id_column} = d.entity_id "
+                f"WHERE d.kind = '{kind}'"
+            )
+        )
+    session.execute(text("INSERT INTO search_index (search_index) VALUES ('optimize')"))
+    session.commit()
+    return counts
+
+
+def ensure_search_index(session: Session) -> None:
+    """Index existing rows once when the search tables were just added to a populated database."""
+    if session.get_bind().dialect.name != "sqlite":
+        return
+    indexed = session.execute(text("SELECT 1 FROM search_docs LIMIT 1")).first() is not None
+    live = any(
+        session.execute(text(f"SELECT 1 FROM {model.__tablename__} WHERE deleted_at IS NULL LIMIT 1")).first()
+        for model, *_ in SEARCH_SOURCES.values()
+    )
+    if live and not indexed:
+        rebuild_search_index(session)
+
+
+def match_expression(query: str) -> str:
+    """FTS5 query for free text: every word must match, each as a prefix; FTS syntax is not passed through."""
+    terms = _TERM.findall(query)[:SEARCH_MAX_TERMS]
+    if not terms:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Search query has no words")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+_RANKED = f"""
+    SELECT d.doc_id AS doc_id, d.kind AS kind, d.entity_id AS entity_id,
+           bm25(search_index, {', '.join(str(weight) for weight in SEARCH_WEIGHTS)}) AS rank,
+           snippet(search_index, -1, '[', ']', '…', 12) AS snippet
+    FROM search_index JOIN search_docs d ON d.doc_id = search_index.rowid
+    WHERE search_index MATCH :match {{filters}}
+"""
+
+
+def search(
+    session: Session,
+    query: str,
+    kind: Optional[str],
+    project_id: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Ranked matches (best first) with the entity's name and ids, plus the next-page cursor."""
+    params: Dict[str, Any] = {"match": match_expression(query), "limit": limit + 1}
+    filters = ""
+    if kind:
+        filters += " AND d.kind = :kind"
+        params["kind"] = kind
+    if project_id:
+        filters += " AND d.project_id = :project_id"
+        params["project_id"] = project_id
+    where = ""
+    if cursor:
+        params["after_rank"], params["after_doc"] = decode_cursor(cursor, _CURSOR_COLUMNS)
+        where = "WHERE rank > :after_rank OR (rank = :after_rank AND doc_id > :after_doc)"
+    rows = session.execute(
+        text(f"SELECT * FROM ({_RANKED.format(filters=filters)}) {where} ORDER BY rank, doc_id LIMIT :limit"),
+        params,
+    ).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1].rank, rows[-1].doc_id])
+    return _with_entities(session, rows), next_cursor
+
+
+def _with_entities(session: Session, rows) -> List[Dict[str, Any]]:
+    ids: Dict[str, List[str]] = {}
+    for row in rows:
+        ids.setdefault(row.kind, []).append(row.entity_id)
+    entities = {}
+    for kind, entity_ids in ids.items():
+        model, id_column, _, sources = SEARCH_SOURCES[kind]
+        key = getattr(model, id_column)
+        solution_id = getattr(model, "solution_id", null())
+        found = session.query(key, model.project_id, solution_id, getattr(model, sources[0])).filter(
+            key.in_(entity_ids), model.deleted_at.is_(None)
+        )
+        for entity in found:
+            entities[(kind, entity[0])] = entity
+    results = []
+    for row in rows:
+        entity = entities.get((row.kind, row.entity_id))
+        if entity is None:  # deleted since it was indexed; the triggers normally prevent this
+            continue
+        results.append(
+            {
+                "kind": row.kind,
+                "id": row.entity_id,
+                "project_id": entity[1],
+                "solution_id": entity[2],
+                "name": entity[3],
+                "snippet": row.snippet,
+                "rank": row.rank,
+            }
+        )
+    return results
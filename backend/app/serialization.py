@@ -0,0 +1,103 @@
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+
+from .pagination import NEXT_CURSOR_HEADER
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder produces the same JSON, only slower
+    orjson = None
+
+
+def read_columns(model, schema: type[BaseModel]) -> Tuple[Any, ...]:
+    """Columns of `model` behind every field of a `*Read` schema, in the schema's field order."""
+    return tuple(getattr(model, name) for name in schema.model_fields)
+
+
+def requested_fields(
+    columns: Sequence[Any],
+    fields: Optional[str],
+    view: str,
+    summary: Sequence[str],
+    key: str,
+) -> Optional[List[str]]:
+    """
+    Output fields for a list request, in schema order; None means the full representation.
+
+    `fields` (comma-separated) wins over `view`; `view=summary` uses `summary`. The row id `key`
+    is always included so clients can match rows.
+    """
+    available = [column.key for column in columns]
+    if fields is not None:
+        names = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(names - set(available))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field(s): {', '.join(unknown)}",
+            )
+    elif view == "summary":
+        names = set(summary)
+    else:
+        return None
+    names.add(key)
+    return [name for name in available if name in names]
+
+
+def select_columns(
+    columns: Sequence[Any], wanted: Optional[Sequence[str]], order_by: Sequence[Any]
+) -> Tuple[Any, ...]:
+    """Columns to SELECT for `wanted` fields; pagination keys are always loaded for the cursor."""
+    if wanted is None:
+        return tuple(columns)
+    keys = set(wanted) | {column.key for column in order_by}
+    return tuple(column for column in columns if column.key in keys)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def rows_json(rows: Iterable[Any], fields: Optional[Sequence[str]] = None) -> bytes:
+    """
+    JSON array for column rows selected with `read_columns`, without ORM objects or schema
+    validation; the output matches dumping the rows through the `*Read` schema. With `fields`,
+    only those keys are written (pagination columns loaded for the cursor are left out).
+    """
+    rows = list(rows)
+    if not rows:
+        return b"[]"
+    keys = rows[0]._fields
+    if fields is None:
+        return dumps([dict(zip(keys, row)) for row in rows])
+    picks = [(name, keys.index(name)) for name in fields]
+    return dumps([{name: row[index] for name, index in picks} for row in rows])
+
+
+def json_response(response: Response, body: bytes) -> Response:
+    """Return an already-encoded JSON body, keeping headers set on the route's `response`."""
+    encoded = Response(content=body, media_type="application/json")
+    encoded.headers.update(response.headers)
+    return encoded
+
+
+def json_list_response(response: Response, body: bytes, next_cursor: Optional[str] = None) -> Response:
+    """`json_response` for an encoded list page, with the `X-Next-Cursor` header when more follow."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return json_response(response, body)
@@ -0,0 +1,175 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event, inspect, insert, select, update
+from sqlalchemy.orm import Session
+
+from . import realtime
+from .models import Phase, Project, Solution, SolutionPhase, Subcomponent, SyncVersion
+from .schemas import PhaseRead, ProjectRead, SolutionPhaseRead, SolutionRead, SubcomponentRead
+
+GLOBAL_VERSION = "global"
+
+_TOUCHED_KEY = "jira_lite_touched"
+_CHANGES_KEY = "jira_lite_changes"
+_HELD_KEY = "jira_lite_held_changes"
+
+# Mapped classes whose writes advance the data version, keyed to the counter row they bump.
+TRACKED_TABLES = {
+    Project: "projects",
+    Solution: "solutions",
+    Subcomponent: "subcomponents",
+    SolutionPhase: "solution_phases",
+    Phase: "phases",
+}
+
+# Read schemas used to serialize changed rows into live-sync delta messages.
+CHANGE_SCHEMAS = {
+    "projects": ProjectRead,
+    "solutions": SolutionRead,
+    "subcomponents": SubcomponentRead,
+    "solution_phases": SolutionPhaseRead,
+    "phases": PhaseRead,
+}
+
+# Live-sync scopes per kind: topic prefix -> attribute. Old and new values both count, so a row that
+# moves (e.g. is reassigned) reaches subscribers of where it was and where it is now.
+CHANGE_SCOPES = {
+    "projects": {"project": "project_id"},
+    "solutions": {"project": "project_id", "solution": "solution_id", "assignee": "assignee"},
+    "subcomponents": {"project": "project_id", "solution": "solution_id", "assignee": "assignee"},
+    "solution_phases": {"solution": "solution_id"},
+    "phases": {},
+}
+
+
+def bump_version(connection, tables: Iterable[str]) -> int:
+    """
+    Advance the global version by one and mark `tables` as changed at the new version.
+
+    Runs inside the caller's transaction; SQLite serializes writers, so versions follow commit order.
+    """
+    names = [GLOBAL_VERSION, *sorted(set(tables))]
+    result = connection.execute(
+        update(SyncVersion)
+        .where(SyncVersion.name == GLOBAL_VERSION)
+        .values(value=SyncVersion.value + 1)
+        .returning(SyncVersion.value)
+    ).scalar()
+    if result is None:
+        connection.execute(insert(SyncVersion).values(name=GLOBAL_VERSION, value=1))
+        result = 1
+    existing = set(
+        connection.execute(select(SyncVersion.name).where(SyncVersion.name.in_(names[1:]))).scalars()
+    )
+    if existing:
+        connection.execute(
+            update(SyncVersion).where(SyncVersion.name.in_(existing)).values(value=result)
+        )
+    missing = [name for name in names[1:] if name not in existing]
+    if missing:
+        connection.execute(insert(SyncVersion), [{"name": name, "value": result} for name in missing])
+    return result
+
+
+def current_versions(session: Session, tables: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Return {name: version} for `global` plus the requested tables (0 when never written)."""
+    names = [GLOBAL_VERSION, *(tables or TRACKED_TABLES.values())]
+    rows = dict(
+        session.execute(select(SyncVersion.name, SyncVersion.value).where(SyncVersion.name.in_(names))).all()
+    )
+    return {name: rows.get(name, 0) for name in names}
+
+
+@event.listens_for(Session, "before_flush")
+def _stamp_data_versions(session: Session, flush_context, instances) -> None:
+    touched = []
+    tables = set()
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        table = TRACKED_TABLES.get(type(obj))
+        if table is None:
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        tables.add(table)
+        touched.append(obj)
+    if not touched:
+        return
+    version = bump_version(session.connection(), tables)
+    for obj in touched:
+        if hasattr(obj, "data_version"):
+            obj.data_version = version
+    session.info[_TOUCHED_KEY] = [(obj, TRACKED_TABLES[type(obj)], version) for obj in touched]
+
+
+def _scope_values(obj, attr: str) -> List[str]:
+    history = inspect(obj).attrs[attr].history
+    values = {*history.added, *history.unchanged, *history.deleted}
+    if not values:
+        values = {getattr(obj, attr, None)}
+    return sorted(str(value) for value in values if value)
+
+
+def describe_change(obj, kind: str, version: int, include_row: bool = True) -> Dict[str, Any]:
+    """Identity, version, live-sync scopes and (unless deleted) the serialized row of one write."""
+    scopes = {}
+    for prefix, attr in CHANGE_SCOPES[kind].items():
+        values = _scope_values(obj, attr)
+        if prefix == "assignee":
+            values = sorted({value.strip().casefold() for value in values if value.strip()})
+        scopes[prefix] = values
+    change = {
+        "kind": kind,
+        "id": inspect(obj).mapper.primary_key_from_instance(obj)[0],
+        "version": version,
+        "deleted": getattr(obj, "deleted_at", None) is not None,
+        "scopes": scopes,
+    }
+    if include_row and not change["deleted"]:
+        change["row"] = CHANGE_SCHEMAS[kind].model_validate(obj).model_dump(mode="json")
+    return change
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    # Primary keys are assigned by now, and attribute history still shows the pre-flush values.
+    touched = session.info.pop(_TOUCHED_KEY, None)
+    if not touched:
+        return
+    changes = session.info.setdefault(_CHANGES_KEY, [])
+    held = session.info.get(_HELD_KEY) or []
+    # Bulk writes are announced as kind refreshes anyway; skip serializing their rows.
+    include_rows = len(held) + len(changes) + len(touched) <= realtime.MAX_EVENT_CHANGES
+    changes.extend(describe_change(obj, kind, version, include_rows) for obj, kind, version in touched)
+
+
+def hold_changes(session: Session) -> None:
+    """
+    Keep the changes of every commit on `session` until `release_changes` instead of publishing
+    each commit: row-by-row imports then announce themselves as one live-sync event.
+    """
+    session.info.setdefault(_HELD_KEY, [])
+
+
+def release_changes(session: Session) -> None:
+    """Publish everything committed since `hold_changes` in one go."""
+    held = session.info.pop(_HELD_KEY, None)
+    if held:
+        realtime.publish_changes(held)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session: Session) -> None:
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if not changes:
+        return
+    held = session.info.get(_HELD_KEY)
+    if held is not None:
+        held.extend(changes)
+    else:
+        realtime.publish_changes(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_TOUCHED_KEY, None)
+    session.info.pop(_CHANGES_KEY, None)
@@ -0,0 +1,119 @@
+import argparse
+import json
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from backend.app.enums import RagSource, RagStatus, SolutionStatus
+from backend.app.models import Base, Project, Solution
+from backend.app.routes_solutions import SOLUTION_COLUMNS, SOLUTION_ORDER
+from backend.app.schemas import SolutionRead
+from backend.app.serialization import orjson, rows_json
+
+
+def _seed(session: Session, rows: int) -> None:
+    project_id = str(uuid4())
+    now = datetime.utcnow()
+    session.execute(
+        insert(Project).values(
+            project_id=project_id,
+            project_name="Benchmark",
+            name_abbreviation="BNCH",
+            status="active",
+            sponsor="Bench",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    statuses = list(SolutionStatus)
+    batch = []
+    for i in range(rows):
+        batch.append(
+            {
+                "solution_id": str(uuid4()),
+                "project_id": project_id,
+                "solution_name": f"Solution {i}",
+                "version": "1.0",
+                "status": statuses[i % len(statuses)],
+                "rag_status": RagStatus.amber,
+                "rag_source": RagSource.auto,
+                "priority": i % 5,
+                "due_date": date(2025, 1, 1) + timedelta(days=i % 365),
+                "description": "Lorem ipsum dolor sit amet " * 8,
+                "success_criteria": "Ships on time",
+                "owner": f"Owner {i % 40}",
+                "assignee": f"Assignee {i % 60}",
+                "created_at": now + timedelta(microseconds=i),
+                "updated_at": now,
+            }
+        )
+        if len(batch) == 5000:
+            session.execute(insert(Solution), batch)
+            batch = []
+    if batch:
+        session.execute(insert(Solution), batch)
+    session.commit()
+
+
+def _orm_and_schema(session: Session) -> bytes:
+    rows = session.query(Solution).filter(Solution.deleted_at.is_(None)).order_by(*SOLUTION_ORDER).all()
+    adapter = TypeAdapter(List[SolutionRead])
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    session.expunge_all()
+    return body
+
+
+def _columns_and_encoder(session: Session) -> bytes:
+    rows = (
+        session.query(*SOLUTION_COLUMNS)
+        .filter(Solution.deleted_at.is_(None))
+        .order_by(*SOLUTION_ORDER)
+        .all()
+    )
+    return rows_json(rows)
+
+
+def _best_of(repeats: int, fn: Callable[[], bytes]) -> tuple:
+    best, body = None, b""
+    for _ in range(repeats):
+        started = time.perf_counter()
+        body = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def main() -> None:
+    """Time the unpaginated solution list: ORM + SolutionRead vs. column rows + direct encoding."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            _seed(session, args.rows)
+            slow, slow_body = _best_of(args.repeats, lambda: _orm_and_schema(session))
+            fast, fast_body = _best_of(args.repeats, lambda: _columns_and_encoder(session))
+        engine.dispose()
+
+    if json.loads(slow_body) != json.loads(fast_body):
+        raise SystemExit("fast path output differs from the schema output")
+    encoder = "orjson" if orjson is not None else "json (stdlib)"
+    print(f"{args.rows} solutions, best of {args.repeats}, encoder {encoder}")
+    print(f"  ORM + SolutionRead:        {slow * 1000:8.1f} ms")
+    print(f"  column rows + encoder:     {fast * 1000:8.1f} ms")
+    print(f"  speedup:                   {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import sys
+
+from backend.app.db import SessionLocal, init_db
+from backend.app.query_plans import query_plan_report
+
+
+def main() -> None:
+    """Print the SQLite query plan of every hot list query; exits 1 if one misses its index."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--verbose", action="store_true", help="print the full EXPLAIN QUERY PLAN rows")
+    args = parser.parse_args()
+    init_db(run_seed=False)
+    with SessionLocal() as session:
+        report = query_plan_report(session)
+    width = max(len(row["query"]) for row in report)
+    for row in report:
+        verdict = "ok" if row["ok"] else "MISS"
+        note = " + temp b-tree sort" if row["sorts"] else ""
+        print(f"{verdict:4}  {row['query']:{width}}  {row['index'] or 'full scan'}{note}")
+        if args.verbose or not row["ok"]:
+            for line in row["plan"]:
+                print(f"{'':6}{line}")
+            if not row["ok"]:
+                print(f"{'':6}expected {row['expected_index']}")
+    sys.exit(0 if all(row["ok"] for row in report) else 1)
+
+
+if __name__ == "__main__":
+    main()
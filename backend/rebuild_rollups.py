@@ -0,0 +1,18 @@
+import argparse
+
+from backend.app.db import SessionLocal, init_db
+from backend.app.rollups import rebuild_rollups
+
+
+def main() -> None:
+    """Recompute the solution and project rollup tables from the base tables (repair)."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.parse_args()
+    init_db(run_seed=False)
+    with SessionLocal() as session:
+        counts = rebuild_rollups(session)
+    print(f"rebuilt rollups for {counts['solutions']} solutions and {counts['projects']} projects")
+
+
+if __name__ == "__main__":
+    main()
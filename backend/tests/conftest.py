@@ -8,13 +8,14 @@ import httpx
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from backend.app.deps import current_user, get_db, require_user
+from backend.app.db import AsyncReadSession, ThreadedReadSession
+from backend.app.deps import current_user, get_db, get_read_db, require_user, socket_user
 from backend.app.main import app as fastapi_app
 from backend.app.models import Base
 
@@ -25,30 +26,66 @@ def anyio_backend():
 
 
 @pytest.fixture
-def db_sessionmaker():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+def read_session(request):
+    """How `get_read_db` reads: "threaded" (default) or "async" (aiosqlite), via indirect parametrize."""
+    return getattr(request, "param", "threaded")
+
+
+@pytest.fixture
+def db_sessionmaker(read_session, tmp_path):
+    if read_session == "async":
+        # aiosqlite needs its own connections, so both engines share a database file.
+        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
     Base.metadata.create_all(bind=engine)
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture
+def get_test_read_db(read_session, db_sessionmaker):
+    if read_session == "threaded":
+
+        async def get_threaded_read_db():
+            with db_sessionmaker() as session:
+                yield ThreadedReadSession(session)
+
+        return get_threaded_read_db
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    # NullPool: no aiosqlite connection outlives the request that opened it.
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_sessionmaker.kw['bind'].url.database}", poolclass=NullPool
+    )
+
+    async def get_async_read_db():
+        async with AsyncSession(async_engine, autoflush=False, expire_on_commit=False) as session:
+            yield AsyncReadSession(session)
+
+    return get_async_read_db
+
+
 @pytest.fixture
 def test_user():
     return SimpleNamespace(user_id="test-user")
 
 
 @pytest.fixture
-def override_dependencies(db_sessionmaker, test_user):
+def override_dependencies(db_sessionmaker, get_test_read_db, test_user):
     def get_test_db():
         with db_sessionmaker() as session:
             yield session
 
     fastapi_app.dependency_overrides[get_db] = get_test_db
+    fastapi_app.dependency_overrides[get_read_db] = get_test_read_db
     fastapi_app.dependency_overrides[require_user] = lambda: test_user
     fastapi_app.dependency_overrides[current_user] = lambda: test_user
+    fastapi_app.dependency_overrides[socket_user] = lambda: test_user
     try:
         yield
     finally:
@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+
+from backend.app import auth
+from backend.app.auth_cache import token_cache, user_cache
+from backend.app.deps import current_user, require_user
+from backend.app.main import app as fastapi_app
+from backend.app.models import User
+
+
+@pytest.fixture
+def real_auth(client, monkeypatch):
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 4)
+    fastapi_app.dependency_overrides.pop(require_user, None)
+    fastapi_app.dependency_overrides.pop(current_user, None)
+    token_cache.clear()
+    user_cache.clear()
+    yield client
+    token_cache.clear()
+    user_cache.clear()
+
+
+async def create_user(SessionLocal, soeid="ab12345", password="correct-horse"):
+    password_hash = await auth.hash_password(password)
+    with SessionLocal() as session:
+        user = User(
+            soeid=soeid,
+            email=f"{soeid}@citi.com",
+            display_name="Test User",
+            password_hash=password_hash,
+        )
+        session.add(user)
+        session.commit()
+        return user.user_id
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
+async def test_require_user_caches_user_and_invalidates_on_login(real_auth, db_sessionmaker):
+    client = real_auth
+    await create_user(db_sessionmaker)
+    login = await client.post("/api/auth/login", json={"soeid": "ab12345", "password": "correct-horse"})
+    assert login.status_code == 200, login.text
+    client.cookies.set("access_token", login.cookies["access_token"])
+
+    first = await client.get("/api/auth/me")
+    assert first.status_code == 200
+    assert first.json()["soeid"] == "ab12345"
+    second = await client.get("/api/auth/me")
+    assert second.status_code == 200
+    assert second.headers["Server-Timing"].count('"0 queries"') == 1
+    assert user_cache.hits == 1
+    assert token_cache.hits == 1
+
+    failed = await client.post("/api/auth/login", json={"soeid": "ab12345", "password": "wrong-password"})
+    assert failed.status_code == 401
+    misses_before = user_cache.misses
+    third = await client.get("/api/auth/me")
+    assert third.status_code == 200
+    assert user_cache.misses == misses_before + 1
+
+
+@pytest.mark.anyio
+async def test_login_rehashes_password_when_rounds_change(real_auth, db_sessionmaker, monkeypatch):
+    client = real_auth
+    user_id = await create_user(db_sessionmaker)
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 5)
+
+    resp = await client.post("/api/auth/login", json={"soeid": "ab12345", "password": "correct-horse"})
+    assert resp.status_code == 200, resp.text
+    with db_sessionmaker() as session:
+        stored = session.get(User, user_id).password_hash
+    assert stored.startswith("$2b$05$")
+    assert await auth.verify_password("correct-horse", stored)
+
+
+@pytest.mark.anyio
+async def test_login_rejected_fast_when_bcrypt_pool_saturated(real_auth, db_sessionmaker, monkeypatch):
+    client = real_auth
+    await create_user(db_sessionmaker)
+    monkeypatch.setattr(auth, "_bcrypt_slots", threading.BoundedSemaphore(1))
+    auth._bcrypt_slots.acquire()
+
+    resp = await client.post("/api/auth/login", json={"soeid": "ab12345", "password": "correct-horse"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+
+
+@pytest.mark.anyio
+async def test_login_succeeds_with_old_hash_when_rehash_is_rejected(real_auth, db_sessionmaker, monkeypatch):
+    client = real_auth
+    user_id = await create_user(db_sessionmaker)
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 5)
+    # One slot: verify takes and returns it, then the rehash is turned away.
+    monkeypatch.setattr(auth, "_bcrypt_slots", threading.BoundedSemaphore(1))
+    original = auth._run_bcrypt
+    calls = []
+
+    async def verify_then_busy(fn, *args):
+        calls.append(fn)
+        if len(calls) > 1:
+            auth._bcrypt_slots.acquire()
+        return await original(fn, *args)
+
+    monkeypatch.setattr(auth, "_run_bcrypt", verify_then_busy)
+    resp = await client.post("/api/auth/login", json={"soeid": "ab12345", "password": "correct-horse"})
+    assert resp.status_code == 200, resp.text
+    assert len(calls) == 2
+    with db_sessionmaker() as session:
+        assert session.get(User, user_id).password_hash.startswith("$2b$04$")
+
+
+@pytest.mark.anyio
+async def test_logins_waiting_on_bcrypt_hold_no_request_threads(real_auth, db_sessionmaker, monkeypatch):
+    import asyncio
+
+    import anyio.to_thread
+
+    client = real_auth
+    await create_user(db_sessionmaker)
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    release = threading.Event()
+    original = auth._run_bcrypt
+    peak = []
+
+    async def slow(fn, *args):
+        peak.append(limiter.borrowed_tokens)
+        await asyncio.get_running_loop().run_in_executor(None, release.wait)
+        return await original(fn, *args)
+
+    monkeypatch.setattr(auth, "_run_bcrypt", slow)
+    logins = [
+        asyncio.ensure_future(client.post("/api/auth/login", json={"soeid": "ab12345", "password": "correct-horse"}))
+        for _ in range(5)
+    ]
+    while len(peak) < 5:
+        await asyncio.sleep(0.01)
+    # All five are parked on bcrypt, and none of them is holding an AnyIO threadpool thread.
+    assert limiter.borrowed_tokens == 0
+    release.set()
+    assert {resp.status_code for resp in await asyncio.gather(*logins)} == {200}
@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import event
+
+
+async def create_project(client):
+    resp = await client.post(
+        "/api/projects/",
+        json={
+            "project_name": "Data Platform",
+            "name_abbreviation": "DPLT",
+            "description": "Modernize data stack",
+            "sponsor": "CFO Office",
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.anyio
+async def test_calendar_buckets_due_dates_with_counts_and_top_items(client, db_sessionmaker):
+    project = await create_project(client)
+    base = f"/api/projects/{project['project_id']}/solutions"
+    ids = {}
+    # 2030-06-03 is a Monday; the 09th closes that week and the 10th opens the next.
+    for name, due, priority, owner in (
+        ("Billing", "2030-06-03", 3, "Ana"),
+        ("Ledger", "2030-06-09", 1, "Ana"),
+        ("Payroll", "2030-06-10", 2, "Raj"),
+        ("Archive", "2030-06-04", 0, "Raj"),
+        ("Later", "2030-08-01", 3, "Raj"),
+    ):
+        resp = await client.post(
+            base,
+            json={"solution_name": name, "version": "1.0", "owner": owner, "due_date": due, "priority": priority},
+        )
+        assert resp.status_code == 201, resp.text
+        ids[name] = resp.json()["solution_id"]
+    await client.delete(f"/api/solutions/{ids['Archive']}")
+    resp = await client.post(
+        f"/api/solutions/{ids['Billing']}/subcomponents",
+        json={"subcomponent_name": "Invoices", "assignee": "Kim", "due_date": "2030-06-05", "status": "in_progress"},
+    )
+    assert resp.status_code == 201, resp.text
+
+    engine = db_sessionmaker.kw["bind"]
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "bucket_rank" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        resp = await client.get(
+            "/api/calendar", params={"from": "2030-06-01", "to": "2030-06-30", "granularity": "week", "top": 1}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert resp.status_code == 200, resp.text
+    buckets = resp.json()["buckets"]
+    assert [(b["start"], b["end"]) for b in buckets] == [("2030-06-03", "2030-06-09"), ("2030-06-10", "2030-06-16")]
+    first = buckets[0]
+    # The soft-deleted priority-0 solution is neither counted nor listed; top=1 keeps the most urgent.
+    assert first["solutions"]["count"] == 2
+    assert [item["solution_name"] for item in first["solutions"]["items"]] == ["Ledger"]
+    assert first["subcomponents"]["count"] == 1
+    assert first["subcomponents"]["items"][0]["subcomponent_name"] == "Invoices"
+    assert buckets[1]["subcomponents"] == {"count": 0, "items": []}
+
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+            assert "_due_date (due_date>? AND due_date<?)" in plan, plan
+
+    month = (
+        await client.get("/api/calendar", params={"from": "2030-06-01", "to": "2030-08-31", "granularity": "month"})
+    ).json()
+    assert [(b["start"], b["end"], b["solutions"]["count"]) for b in month["buckets"]] == [
+        ("2030-06-01", "2030-06-30", 3),
+        ("2030-08-01", "2030-08-31", 1),
+    ]
+
+    # `status` applies to whichever kind has that value; `owner` reaches subcomponents via their solution.
+    active = (
+        await client.get("/api/calendar", params={"from": "2030-06-01", "to": "2030-06-30", "status": "in_progress"})
+    ).json()
+    assert [(b["start"], b["solutions"]["count"], b["subcomponents"]["count"]) for b in active["buckets"]] == [
+        ("2030-06-05", 0, 1)
+    ]
+    raj = (
+        await client.get(
+            "/api/calendar", params={"from": "2030-06-01", "to": "2030-06-30", "owner": "raj", "kind": "subcomponents"}
+        )
+    ).json()
+    assert raj["buckets"] == []
+
+    etag = resp.headers["etag"]
+    again = await client.get(
+        "/api/calendar",
+        params={"from": "2030-06-01", "to": "2030-06-30", "granularity": "week", "top": 1},
+        headers={"If-None-Match": etag},
+    )
+    assert again.status_code == 304
+    bad_range = await client.get("/api/calendar", params={"from": "2030-06-30", "to": "2030-06-01"})
+    assert bad_range.status_code == 400
+    bad_status = await client.get("/api/calendar", params={"from": "2030-06-01", "to": "2030-06-30", "status": "x"})
+    assert bad_status.status_code == 400
@@ -0,0 +1,80 @@
+import pytest
+
+
+async def create_project(client, name="Data Platform", abbreviation="DPLT"):
+    resp = await client.post(
+        "/api/projects/",
+        json={"project_name": name, "name_abbreviation": abbreviation, "sponsor": "CFO Office"},
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+@pytest.mark.anyio
+async def test_changes_returns_rows_and_tombstones_since_version(client):
+    resp = await client.get("/api/changes")
+    assert resp.status_code == 200
+    assert resp.json()["version"] == 0
+
+    project = await create_project(client)
+    solution = (
+        await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={"solution_name": "Access Controls", "version": "0.1.0", "owner": "Owner"},
+        )
+    ).json()
+    baseline = (await client.get("/api/changes")).json()["version"]
+    assert baseline >= 2
+
+    other = await create_project(client, "Billing", "BILL")
+    resp = await client.delete(f"/api/solutions/{solution['solution_id']}")
+    assert resp.status_code == 204
+
+    data = (await client.get("/api/changes", params={"since": baseline})).json()
+    assert data["version"] == baseline + 2
+    assert data["resync_required"] is False
+    assert [p["project_id"] for p in data["projects"]] == [other["project_id"]]
+    assert data["solutions"] == []
+    assert data["deleted"]["solutions"] == [solution["solution_id"]]
+
+    data = (await client.get("/api/changes", params={"since": data["version"]})).json()
+    assert data["projects"] == [] and data["deleted"]["solutions"] == []
+
+
+@pytest.mark.anyio
+async def test_changes_requests_resync_when_too_many_or_unknown(client):
+    await create_project(client, "One", "ONEP")
+    await create_project(client, "Two", "TWOP")
+
+    data = (await client.get("/api/changes", params={"since": 0, "limit": 1})).json()
+    assert data["resync_required"] is True
+
+    data = (await client.get("/api/changes", params={"since": 99})).json()
+    assert data["resync_required"] is True
+
+
+@pytest.mark.anyio
+async def test_bootstrap_streams_every_collection_with_the_version(client):
+    project = await create_project(client)
+    solution = (
+        await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={"solution_name": "Access Controls", "version": "0.1.0", "owner": "Owner"},
+        )
+    ).json()
+    await client.post(
+        f"/api/solutions/{solution['solution_id']}/subcomponents",
+        json={"subcomponent_name": "Roles", "assignee": "Ana"},
+    )
+    gone = await create_project(client, "Billing", "BILL")
+    await client.delete(f"/api/projects/{gone['project_id']}")
+
+    resp = await client.get("/api/bootstrap")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert list(data) == ["version", "phases", "projects", "solutions", "subcomponents"]
+    assert data["version"] == (await client.get("/api/changes")).json()["version"]
+    for name in ("phases", "projects", "solutions", "subcomponents"):
+        assert data[name] == (await client.get(f"/api/{name}", params={"paginate": False})).json()
+    assert [p["project_id"] for p in data["projects"]] == [project["project_id"]]
+    assert len(data["subcomponents"]) == 1
@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from backend.app import coalescing, routes_solutions
+from backend.app.coalescing import SingleFlight
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_one_call_between_concurrent_callers():
+    flights = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    waiters = [asyncio.ensure_future(flights.run("key", load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [1, 1, 1]
+    assert (flights.hits, flights.misses) == (2, 1)
+    # Finished flights are not cached: the next caller runs the load again.
+    assert await flights.run("key", load) == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
+async def test_concurrent_list_requests_share_one_query(client, monkeypatch):
+    project = (
+        await client.post(
+            "/api/projects/",
+            json={"project_name": "Billing", "name_abbreviation": "BILL", "sponsor": "CFO Office"},
+        )
+    ).json()
+    await client.post(
+        f"/api/projects/{project['project_id']}/solutions",
+        json={"solution_name": "Invoices", "version": "1.0", "owner": "Ana", "assignee": "Ana"},
+    )
+    original = routes_solutions._load_all_solutions
+    loads = 0
+
+    def slow_load(*args):
+        nonlocal loads
+        loads += 1
+        time.sleep(0.2)
+        return original(*args)
+
+    monkeypatch.setattr(routes_solutions, "_load_all_solutions", slow_load)
+    monkeypatch.setattr(coalescing, "read_flights", SingleFlight())
+
+    responses = await asyncio.gather(*(client.get("/api/solutions") for _ in range(4)))
+
+    assert loads == 1
+    assert {resp.status_code for resp in responses} == {200}
+    assert len({resp.content for resp in responses}) == 1
+    assert responses[0].json()[0]["solution_name"] == "Invoices"
+    assert responses[0].headers["ETag"]
+    assert coalescing.coalescing_stats()["hits"] == 3
+
+
+@pytest.mark.anyio
+async def test_shared_flight_reads_on_its_own_session_when_first_caller_disconnects(db_sessionmaker, monkeypatch):
+    from fastapi import Response
+
+    from backend.app.db import ThreadedReadSession
+    from backend.app.models import Phase
+    from backend.app.routes_phases import _load_phase_page
+
+    with db_sessionmaker() as session:
+        session.add(Phase(phase_id="build", phase_group="Delivery", phase_name="Build", sequence=1))
+        session.commit()
+    monkeypatch.setattr(coalescing, "read_flights", SingleFlight())
+    first, second = ThreadedReadSession(db_sessionmaker()), ThreadedReadSession(db_sessionmaker())
+    started, release = asyncio.Event(), asyncio.Event()
+    used = []
+
+    async def load(flight_db):
+        used.append(flight_db)
+        started.set()
+        await release.wait()
+        return await _load_phase_page(flight_db)
+
+    leader = asyncio.ensure_future(coalescing.coalesced_list(Response(), "phases", first, load))
+    await started.wait()
+    follower = asyncio.ensure_future(coalescing.coalesced_list(Response(), "phases", second, load))
+    await asyncio.sleep(0)
+
+    # The first client disconnects and its request teardown closes its session.
+    leader.cancel()
+    first.session.close()
+    release.set()
+    resp = await follower
+
+    assert leader.cancelled()
+    assert len(used) == 1 and used[0].session not in (first.session, second.session)
+    assert b'"phase_id":"build"' in resp.body
+    assert coalescing.coalescing_stats()["hits"] == 1
+    second.session.close()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["async"], indirect=True)
+@pytest.mark.parametrize("pooled", ["threaded", "async"])
+async def test_distinct_list_requests_beyond_the_pool_size_all_succeed(
+    client, db_sessionmaker, monkeypatch, pooled
+):
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from backend.app.db import AsyncReadSession, ThreadedReadSession
+    from backend.app.deps import get_read_db
+    from backend.app.main import app as fastapi_app
+
+    # Two pooled connections, no overflow: a request that kept its ETag connection while its flight
+    # waited for a second one would starve every other request.
+    path = db_sessionmaker.kw["bind"].url.database
+    pool = dict(pool_size=2, max_overflow=0, pool_timeout=5)
+    if pooled == "threaded":
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False}, **pool)
+
+        async def get_pooled_read_db():
+            with Session(bind=engine, autoflush=False) as session:
+                yield ThreadedReadSession(session)
+
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", **pool)
+
+        async def get_pooled_read_db():
+            async with AsyncSession(engine, autoflush=False, expire_on_commit=False) as session:
+                yield AsyncReadSession(session)
+
+    fastapi_app.dependency_overrides[get_read_db] = get_pooled_read_db
+    original = routes_solutions._load_all_solutions
+
+    def slow_load(*args, **kwargs):
+        time.sleep(0.02)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(routes_solutions, "_load_all_solutions", slow_load)
+    monkeypatch.setattr(coalescing, "read_flights", SingleFlight())
+    try:
+        responses = await asyncio.gather(
+            *(client.get("/api/solutions", params={"priority": i}) for i in range(12))
+        )
+    finally:
+        if pooled == "threaded":
+            engine.dispose()
+        else:
+            await engine.dispose()
+
+    assert [resp.status_code for resp in responses] == [200] * 12
+    assert coalescing.coalescing_stats()["misses"] == 12
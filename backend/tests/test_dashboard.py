@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import pytest
+
+from backend.app.routes_dashboard import summary_cache
+
+
+async def create_project(client):
+    resp = await client.post(
+        "/api/projects/",
+        json={
+            "project_name": "Data Platform",
+            "name_abbreviation": "DPLT",
+            "description": "Modernize data stack",
+            "sponsor": "CFO Office",
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.anyio
+async def test_dashboard_summary_groups_filters_and_caches_per_version(client):
+    summary_cache.clear()
+    project = await create_project(client)
+    past = (date.today() - timedelta(days=3)).isoformat()
+    solutions = {}
+    for name, status, owner, due in (
+        ("Billing", "active", "Ana", past),
+        ("Ledger", "active", " ana ", None),
+        ("Payroll", "complete", "Raj", past),
+    ):
+        payload = {"solution_name": name, "version": "1.0", "status": status, "owner": owner}
+        if due:
+            payload["due_date"] = due
+        resp = await client.post(f"/api/projects/{project['project_id']}/solutions", json=payload)
+        assert resp.status_code == 201, resp.text
+        solutions[name] = resp.json()["solution_id"]
+    for solution, task, assignee in (
+        ("Billing", "Invoices", "Ana"),
+        ("Billing", "Refunds", "ANA"),
+        ("Payroll", "Taxes", "Raj"),
+    ):
+        resp = await client.post(
+            f"/api/solutions/{solutions[solution]}/subcomponents",
+            json={"subcomponent_name": task, "assignee": assignee, "due_date": past},
+        )
+        assert resp.status_code == 201, resp.text
+
+    resp = await client.get("/api/dashboard/summary")
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "application/json"
+    summary = resp.json()["solutions"]
+    assert summary["total"] == 3
+    assert summary["overdue"] == 1  # the complete one is past due but closed
+    assert summary["no_due_date"] == 1
+    assert summary["by_status"] == [{"value": "active", "count": 2}, {"value": "complete", "count": 1}]
+    # "Ana" and " ana " are one owner; one of the spellings is shown.
+    [ana, raj] = summary["by_owner"]
+    assert ana["count"] == 2 and ana["value"].strip().casefold() == "ana"
+    assert raj == {"value": "Raj", "count": 1}
+    tasks = resp.json()["subcomponents"]
+    assert tasks["total"] == 3
+    assert [entry["count"] for entry in tasks["by_assignee"]] == [2, 1]
+    assert resp.json()["projects"]["total"] == 1
+
+    # Subcomponent totals cover the same solutions as the solution totals.
+    filtered = (await client.get("/api/dashboard/summary", params={"owner": "Raj"})).json()
+    assert filtered["solutions"]["total"] == 1
+    assert filtered["solutions"]["by_status"] == [{"value": "complete", "count": 1}]
+    assert filtered["subcomponents"]["total"] == 1
+    assert filtered["subcomponents"]["overdue"] == 1
+    assert filtered["subcomponents"]["by_assignee"] == [{"value": "Raj", "count": 1}]
+    by_status = (await client.get("/api/dashboard/summary", params={"status": "active"})).json()
+    assert by_status["subcomponents"]["total"] == 2
+
+    hits = summary_cache.hits
+    again = await client.get("/api/dashboard/summary")
+    assert again.json() == resp.json()
+    assert summary_cache.hits == hits + 1
+    etag = resp.headers["etag"]
+    assert (await client.get("/api/dashboard/summary", headers={"If-None-Match": etag})).status_code == 304
+
+    await client.post(
+        f"/api/projects/{project['project_id']}/solutions",
+        json={"solution_name": "Audit", "version": "1.0", "owner": "Raj"},
+    )
+    fresh = await client.get("/api/dashboard/summary", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["solutions"]["total"] == 4
@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from backend.app.db import (
+    AsyncReadSession,
+    configure_sqlite_engine,
+    describe_sqlite,
+    ensure_indexes,
+    read_snapshot,
+    sqlite_pragmas,
+)
+from backend.app.models import RETIRED_INDEXES, Base, Phase
+from backend.app.query_plans import query_plan_report
+from backend.app.routes_phases import _load_phases
+
+
+def test_sqlite_pragmas_profiles_and_overrides():
+    defaults = sqlite_pragmas({})
+    assert defaults["journal_mode"] == "WAL"
+    assert defaults["synchronous"] == "NORMAL"
+    assert list(defaults)[0] == "journal_mode"
+
+    assert sqlite_pragmas({"JIRA_LITE_SQLITE_PROFILE": "off"}) == {}
+
+    durable = sqlite_pragmas(
+        {"JIRA_LITE_SQLITE_PROFILE": "durable", "JIRA_LITE_SQLITE_BUSY_TIMEOUT": "250"}
+    )
+    assert durable["synchronous"] == "FULL"
+    assert durable["busy_timeout"] == 250
+
+    with pytest.raises(ValueError):
+        sqlite_pragmas({"JIRA_LITE_SQLITE_SYNCHRONOUS": "sometimes"})
+    with pytest.raises(ValueError):
+        sqlite_pragmas({"JIRA_LITE_SQLITE_PROFILE": "turbo"})
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    configure_sqlite_engine(engine, sqlite_pragmas({"JIRA_LITE_SQLITE_BUSY_TIMEOUT": "1234"}))
+    effective = describe_sqlite(engine)
+    assert str(effective["journal_mode"]).lower() == "wal"
+    assert effective["busy_timeout"] == 1234
+    assert effective["synchronous"] == 1  # NORMAL
+    assert effective["temp_store"] == 2  # MEMORY
+    engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_async_read_session_runs_orm_queries(tmp_path):
+    path = tmp_path / "app.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=sync_engine)
+    with Session(sync_engine) as session:
+        session.add_all(
+            [
+                Phase(phase_id="requirements", phase_group="Planning", phase_name="Requirements", sequence=2),
+                Phase(phase_id="backlog", phase_group="Backlog", phase_name="Backlog", sequence=1),
+            ]
+        )
+        session.commit()
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with AsyncSession(async_engine) as session:
+            phases = await AsyncReadSession(session).run(_load_phases)
+        assert [p.phase_id for p in phases] == ["backlog", "requirements"]
+    finally:
+        await async_engine.dispose()
+
+
+def test_read_snapshot_ignores_commits_made_while_it_is_open(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    configure_sqlite_engine(engine, sqlite_pragmas({}))
+    Base.metadata.create_all(bind=engine)
+
+    def add_phase(phase_id, sequence):
+        with Session(engine) as session:
+            session.add(Phase(phase_id=phase_id, phase_group="build", phase_name=phase_id, sequence=sequence))
+            session.commit()
+
+    add_phase("design", 1)
+    with read_snapshot(engine) as snapshot:
+        assert snapshot.query(Phase).count() == 1
+        add_phase("build", 2)
+        assert snapshot.query(Phase).count() == 1
+    with read_snapshot(engine) as snapshot:
+        assert snapshot.query(Phase).count() == 2
+    engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_partial_indexes_migrate_and_serve_every_hot_list_query(client, db_sessionmaker, test_user):
+    # A database from before the partial indexes: full-table index on deleted_at, old key order,
+    # no index for the status filter.
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX idx_solutions_live_priority_created_id")
+        conn.exec_driver_sql(
+            "CREATE INDEX idx_solutions_live_priority_created_id "
+            "ON solutions (deleted_at, priority, created_at, solution_id)"
+        )
+        conn.exec_driver_sql("CREATE INDEX ix_solutions_deleted_at ON solutions (deleted_at)")
+        conn.exec_driver_sql("DROP INDEX idx_solutions_status_live_priority_created_id")
+    with Session(engine) as session:
+        before = {row["query"]: row for row in query_plan_report(session)}
+    # Without its index the status filter walks every live row of the list index.
+    assert before["solutions?status"]["index"] == "idx_solutions_live_priority_created_id"
+    assert not before["solutions?status"]["ok"]
+
+    changed = ensure_indexes(Base.metadata, engine, RETIRED_INDEXES)
+    assert changed == {
+        "ix_solutions_deleted_at": "dropped",
+        "idx_solutions_live_priority_created_id": "rebuilt",
+        "idx_solutions_status_live_priority_created_id": "created",
+    }
+    assert ensure_indexes(Base.metadata, engine, RETIRED_INDEXES) == {}
+    with engine.connect() as conn:
+        sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE name = 'idx_solutions_live_priority_created_id'"
+        ).scalar()
+    assert sql.endswith("WHERE deleted_at IS NULL")
+
+    with Session(engine) as session:
+        report = query_plan_report(session)
+    assert [row["query"] for row in report if not row["ok"]] == []
+
+    test_user.role = "admin"
+    resp = await client.get("/api/admin/query-plans")
+    assert resp.status_code == 200, resp.text
+    assert all(row["ok"] and not row["sorts"] for row in resp.json())
@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+
+from backend.app import instrumentation
+from backend.app.models import Phase
+
+
+def seed_phases(SessionLocal, count):
+    with SessionLocal() as session:
+        session.add_all(
+            [
+                Phase(phase_id=f"phase_{idx}", phase_group="Group", phase_name=f"Phase {idx}", sequence=idx)
+                for idx in range(count)
+            ]
+        )
+        session.commit()
+
+
+@pytest.fixture
+def profile_buffer():
+    instrumentation.set_profile_buffer_size(10)
+    try:
+        yield
+    finally:
+        instrumentation.set_profile_buffer_size(0)
+
+
+def test_statement_shape_collapses_whitespace_and_in_lists():
+    shape = instrumentation.statement_shape("SELECT *\n  FROM t WHERE id IN (?, ?,  ?) AND x = ?")
+    assert shape == "SELECT * FROM t WHERE id IN (?) AND x = ?"
+
+
+@pytest.mark.anyio
+async def test_server_timing_header_counts_queries(client):
+    resp = await client.get("/api/projects")
+    assert resp.status_code == 200
+    timing = resp.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert '"2 queries"' in timing  # ETag version lookup + list
+
+
+@pytest.mark.anyio
+async def test_repeated_statements_are_flagged_and_buffered(
+    client, db_sessionmaker, test_user, profile_buffer, monkeypatch, caplog
+):
+    monkeypatch.setattr(instrumentation, "N_PLUS_ONE_THRESHOLD", 3)
+    seed_phases(db_sessionmaker, 5)
+    project = (
+        await client.post(
+            "/api/projects/",
+            json={"project_name": "Data Platform", "name_abbreviation": "DPLT", "sponsor": "CFO Office"},
+        )
+    ).json()
+
+    with caplog.at_level(logging.WARNING, logger=instrumentation.logger.name):
+        resp = await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={"solution_name": "Access Controls", "version": "0.1.0", "owner": "Solution Owner"},
+        )
+    assert resp.status_code == 201
+    assert any("Possible N+1 in POST" in record.getMessage() for record in caplog.records)
+
+    forbidden = await client.get("/api/admin/profiles")
+    assert forbidden.status_code == 403
+
+    test_user.role = "admin"
+    listing = await client.get("/api/admin/profiles")
+    assert listing.status_code == 200
+    body = listing.json()
+    assert body["capacity"] == 10
+    paths = [p["path"] for p in body["profiles"]]
+    assert paths[0] == "/api/admin/profiles"
+    created = next(p for p in body["profiles"] if p["method"] == "POST" and p["path"].endswith("/solutions"))
+    assert created["statement_count"] > 5
+    assert created["top_statements"][0]["count"] >= 5
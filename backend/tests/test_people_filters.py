@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import event
+
+
+async def create_project(client):
+    resp = await client.post(
+        "/api/projects/",
+        json={
+            "project_name": "Data Platform",
+            "name_abbreviation": "DPLT",
+            "description": "Modernize data stack",
+            "sponsor": "CFO Office",
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.anyio
+async def test_people_filters_use_normalized_indexed_columns(client, db_sessionmaker):
+    project = await create_project(client)
+    solution = (
+        await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={"solution_name": "Billing", "version": "1.0", "owner": "  Jörg Straße ", "assignee": "ANA"},
+        )
+    ).json()
+    await client.post(
+        f"/api/solutions/{solution['solution_id']}/subcomponents",
+        json={"subcomponent_name": "Invoices", "assignee": "Ana "},
+    )
+    await client.patch(f"/api/projects/{project['project_id']}", json={"sponsor": "Cfo OFFICE"})
+
+    engine = db_sessionmaker.kw["bind"]
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "_norm = " in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        checks = [
+            ("/api/solutions", {"owner": "jörg strasse"}, "idx_solutions_owner_norm_live_priority_created_id"),
+            ("/api/solutions", {"assignee": "ana"}, "idx_solutions_assignee_norm_live_priority_created_id"),
+            ("/api/subcomponents", {"assignee": " ANA"}, "idx_subcomponents_assignee_norm_live_priority_created_id"),
+            ("/api/projects/", {"sponsor": "cfo office"}, "idx_projects_sponsor_norm_live_created_id"),
+        ]
+        for path, params, _ in checks:
+            resp = await client.get(path, params=params)
+            assert len(resp.json()) == 1, (path, params)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == len(checks)
+    with engine.connect() as conn:
+        for (statement, parameters), (_, _, index) in zip(statements, checks):
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+            # The old func.lower(column) = ? filter could only scan the live-rows index.
+            assert f"USING INDEX {index}" in plan, plan
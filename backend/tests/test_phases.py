@@ -52,6 +52,7 @@ async def create_project_and_solution(client):
 
 
 @pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
 async def test_list_phases(client, db_sessionmaker):
     seed_phases(db_sessionmaker)
     resp = await client.get("/api/phases")
@@ -2,6 +2,7 @@ import pytest
 
 
 @pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
 async def test_create_and_list_projects(client):
     resp = await client.post(
         "/api/projects/",
@@ -94,3 +95,39 @@ async def test_delete_project_soft_deletes(client):
     list_resp = await client.get("/api/projects/")
     assert list_resp.status_code == 200
     assert list_resp.json() == []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
+async def test_project_list_and_detail_honor_if_none_match(client):
+    project = (
+        await client.post(
+            "/api/projects/",
+            json={"project_name": "Billing", "name_abbreviation": "BILL", "sponsor": "CFO Office"},
+        )
+    ).json()
+    detail_url = f"/api/projects/{project['project_id']}"
+
+    list_resp = await client.get("/api/projects/", params={"status_filter": "not_started"})
+    list_etag = list_resp.headers["ETag"]
+    detail_etag = (await client.get(detail_url)).headers["ETag"]
+
+    resp = await client.get(
+        "/api/projects/", params={"status_filter": "not_started"}, headers={"If-None-Match": list_etag}
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert '"1 queries"' in resp.headers["Server-Timing"]  # version lookup only, no row loading
+    other = await client.get("/api/projects/", headers={"If-None-Match": list_etag})
+    assert other.status_code == 200  # different filters, different ETag
+    assert (await client.get(detail_url, headers={"If-None-Match": detail_etag})).status_code == 304
+
+    assert (await client.patch(detail_url, json={"description": "Invoices"})).status_code == 200
+    resp = await client.get(
+        "/api/projects/", params={"status_filter": "not_started"}, headers={"If-None-Match": list_etag}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != list_etag
+    resp = await client.get(detail_url, headers={"If-None-Match": detail_etag})
+    assert resp.status_code == 200
+    assert resp.json()["description"] == "Invoices"
@@ -0,0 +1,433 @@
+import asyncio
+import threading
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from backend.app import realtime
+from backend.app.main import app as fastapi_app
+
+
+USER = SimpleNamespace(user_id="test-user", soeid="ab12345", display_name="Ana")
+
+
+class FakeSocket:
+    def __init__(self, blocked=False):
+        self.sent = []
+        self.closed_with = None
+        self.unblock = asyncio.Event()
+        if not blocked:
+            self.unblock.set()
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        await self.unblock.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def settle():
+    await asyncio.sleep(realtime.COALESCE_WINDOW_MS / 1000 + 0.1)
+
+
+def without_seq(messages):
+    return [{key: value for key, value in message.items() if key != "seq"} for message in messages]
+
+
+@pytest.fixture
+async def fake_socket():
+    ws = FakeSocket()
+    await realtime.register(ws, user=USER)
+    try:
+        yield ws
+    finally:
+        realtime.unregister(ws)
+
+
+@pytest.mark.anyio
+async def test_broadcasts_from_threads_are_coalesced_into_one_message(client, fake_socket):
+    def import_rows():
+        for _ in range(50):
+            realtime.schedule_broadcast("solutions")
+            realtime.schedule_broadcast("subcomponents")
+
+    worker = threading.Thread(target=import_rows)
+    worker.start()
+    worker.join()
+    await settle()
+
+    assert without_seq(fake_socket.sent) == [
+        {"type": "refresh", "entity": "all", "entities": ["solutions", "subcomponents"]}
+    ]
+
+
+@pytest.mark.anyio
+async def test_write_route_broadcasts_its_entity(client, fake_socket):
+    resp = await client.post(
+        "/api/projects/",
+        json={"project_name": "Billing", "name_abbreviation": "BILL", "sponsor": "CFO Office"},
+    )
+    assert resp.status_code == 201
+    await settle()
+
+    assert without_seq(fake_socket.sent) == [{"type": "refresh", "entity": "projects", "entities": ["projects"]}]
+
+
+@pytest.mark.anyio
+async def test_multi_row_import_publishes_one_event(client, fake_socket, monkeypatch):
+    await client.post(
+        "/api/projects/",
+        json={"project_name": "Billing", "name_abbreviation": "BILL", "sponsor": "CFO Office"},
+    )
+    await settle()
+    fake_socket.sent.clear()
+    published = []
+    original = realtime.publish_changes
+    monkeypatch.setattr(realtime, "publish_changes", lambda changes: (published.append(changes), original(changes)))
+
+    csv_rows = ["project_name,solution_name,version,owner"] + [f"Billing,Module {i},1.0,Ana" for i in range(4)]
+    resp = await client.post(
+        "/api/solutions/import", content="\n".join(csv_rows).encode(), headers={"Content-Type": "text/csv"}
+    )
+    assert resp.json()["created"] == 4, resp.text
+    await settle()
+
+    # Each row commits on its own, but the import is announced once with every row in it.
+    assert len(published) == 1
+    solution_ids = {c["id"] for c in published[0] if c["kind"] == "solutions"}
+    assert len(solution_ids) == 4
+    assert len(fake_socket.sent) == 1
+
+
+@pytest.mark.anyio
+async def test_slow_client_does_not_delay_others_and_collapses_on_overflow(client, fake_socket, monkeypatch):
+    monkeypatch.setattr(realtime, "SEND_QUEUE_SIZE", 2)
+    slow = FakeSocket(blocked=True)
+    slow_client = await realtime.register(slow, user=USER)
+    try:
+        for entity in ("projects", "solutions", "subcomponents", "phases"):
+            realtime.broadcast_refresh(entity)
+        await asyncio.sleep(0.05)
+
+        assert [m["entity"] for m in fake_socket.sent] == ["projects", "solutions", "subcomponents", "phases"]
+        assert slow.sent == []
+        assert slow_client.dropped >= 1
+
+        slow.unblock.set()
+        await asyncio.sleep(0.05)
+        # The backlog that overflowed was replaced by a single full-refresh message.
+        assert {**realtime.refresh_message("all"), "reason": "overflow"} in without_seq(slow.sent)
+        assert len(slow.sent) < 4
+    finally:
+        realtime.unregister(slow)
+
+
+def test_server_pings_and_reaps_idle_sockets(override_dependencies, monkeypatch):
+    monkeypatch.setattr(realtime, "PING_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(realtime, "IDLE_TIMEOUT_SECONDS", 0.2)
+    with TestClient(fastapi_app) as test_client:
+        with test_client.websocket_connect("/api/ws") as ws:
+            assert ws.receive_json() == {"type": "ping"}
+            ws.send_json({"type": "pong"})
+            assert ws.receive_json() == {"type": "ping"}
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                while True:
+                    ws.receive_json()
+            assert exc_info.value.code == 1001
+        assert realtime.connections == {}
+
+
+def test_socket_requires_an_active_unlocked_user(override_dependencies, db_sessionmaker):
+    from datetime import datetime, timedelta, timezone
+
+    from backend.app.auth import create_token
+    from backend.app.auth_cache import user_cache
+    from backend.app.deps import socket_user
+    from backend.app.models import User
+
+    fastapi_app.dependency_overrides.pop(socket_user)
+    with db_sessionmaker() as session:
+        active = User(soeid="ab12345", email="ab12345@citi.com", display_name="Ana", password_hash="x")
+        locked = User(
+            soeid="cd67890",
+            email="cd67890@citi.com",
+            display_name="Cy",
+            password_hash="x",
+            locked_until=datetime.now(timezone.utc) + timedelta(minutes=5),
+        )
+        session.add_all([active, locked])
+        session.commit()
+        tokens = {user.soeid: create_token(user.user_id, "user", "access") for user in (active, locked)}
+    user_cache.clear()
+    with TestClient(fastapi_app) as test_client:
+        for cookie in (None, "not-a-token", tokens["cd67890"]):
+            test_client.cookies.clear()
+            if cookie:
+                test_client.cookies.set("access_token", cookie)
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                with test_client.websocket_connect("/api/ws?format=delta") as ws:
+                    ws.receive_json()
+            assert exc_info.value.code == 1008
+        assert realtime.connections == {}
+
+        test_client.cookies.set("access_token", tokens["ab12345"])
+        with test_client.websocket_connect("/api/ws?format=delta") as ws:
+            ws.send_json({"type": "ping"})
+            assert ws.receive_json() == {"type": "pong"}
+            [client] = realtime.connections.values()
+            assert client.user.soeid == "ab12345"
+    user_cache.clear()
+
+
+@pytest.mark.anyio
+async def test_sqlite_backend_relays_events_to_every_worker_in_order(tmp_path):
+    from sqlalchemy import create_engine
+
+    from backend.app.realtime_backends import SQLiteEventBackend
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    received = {"a": [], "b": []}
+    workers = {name: SQLiteEventBackend(engine, poll_interval=0.01) for name in received}
+    for name, backend in workers.items():
+        await backend.start(received[name].append)
+    try:
+        await workers["a"].publish({"entities": ["projects"]})
+        await workers["b"].publish({"entities": ["solutions", "subcomponents"]})
+        for backend in workers.values():
+            await backend.poll_once()
+
+        expected = [
+            {"entities": ["projects"], "seq": 1},
+            {"entities": ["solutions", "subcomponents"], "seq": 2},
+        ]
+        assert received["a"] == expected
+        assert received["b"] == expected
+    finally:
+        for backend in workers.values():
+            await backend.stop()
+        engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_user_invalidations_reach_every_worker_outside_the_event_stream(tmp_path):
+    from sqlalchemy import create_engine
+
+    from backend.app.auth_cache import cache_user, invalidate_user, user_cache
+    from backend.app.models import User
+    from backend.app.realtime_backends import SQLiteEventBackend
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    this_worker = SQLiteEventBackend(engine, poll_interval=0.01)
+    other_worker = SQLiteEventBackend(engine, poll_interval=0.01)
+    events, dropped = [], []
+    await realtime.start(this_worker)
+    await other_worker.start(events.append, dropped.append)
+    ws = FakeSocket()
+    await realtime.register(ws, user=USER)
+    try:
+        for _ in range(3):
+            invalidate_user("locked-here")
+        await settle()
+        await other_worker.poll_once()
+        assert dropped == ["locked-here"]
+        assert events == []
+
+        # A login failure handled by the other worker drops this worker's cached copy too.
+        cache_user(User(user_id="locked-there", soeid="ab12345", is_active=True))
+        await other_worker.publish_invalidations(["locked-there"])
+        await this_worker.poll_once()
+        assert user_cache.get("locked-there") is None
+        await settle()
+        # No seq taken, nothing kept for replay, nothing sent to sockets.
+        assert realtime._last_seq == 0
+        assert not realtime._history
+        assert ws.sent == []
+    finally:
+        user_cache.clear()
+        await realtime.stop()
+        await other_worker.stop()
+        engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_in_process_backend_publishes_no_user_invalidations(client, fake_socket, monkeypatch):
+    from backend.app.auth_cache import cache_user, invalidate_user, user_cache
+    from backend.app.models import User
+
+    published = []
+    monkeypatch.setattr(realtime._backend, "publish", lambda event: published.append(event))
+    cache_user(User(user_id="locked", soeid="ab12345", is_active=True))
+    invalidate_user("locked")
+    await settle()
+    assert user_cache.get("locked") is None
+    assert published == []
+    assert fake_socket.sent == []
+    user_cache.clear()
+
+
+def test_incomplete_backend_fails_on_construction():
+    from backend.app.realtime_backends import BroadcastBackend
+
+    class StartOnly(BroadcastBackend):
+        async def start(self, deliver):
+            pass
+
+    with pytest.raises(TypeError, match="publish"):
+        StartOnly()
+
+
+@pytest.mark.anyio
+async def test_topic_subscribers_only_get_matching_changes(client, fake_socket):
+    async def create(name, abbreviation):
+        resp = await client.post(
+            "/api/projects/",
+            json={"project_name": name, "name_abbreviation": abbreviation, "sponsor": "CFO Office"},
+        )
+        return resp.json()["project_id"]
+
+    watched, other = await create("Billing", "BILL"), await create("Payroll", "PAYR")
+    await settle()
+    scoped = FakeSocket()
+    scoped_client = await realtime.register(scoped, user=USER)
+    try:
+        realtime.handle_client_message(scoped_client, {"type": "unsubscribe", "topics": ["*"]})
+        realtime.handle_client_message(scoped_client, {"type": "subscribe", "topics": [f"project:{watched}"]})
+        realtime.handle_client_message(scoped_client, {"type": "subscribe", "topics": ["kind:nope"]})
+        # Only your own assignments: `me` is resolved from the socket's user, other names are refused.
+        realtime.handle_client_message(scoped_client, {"type": "subscribe", "topics": ["assignee:bob"]})
+        realtime.handle_client_message(scoped_client, {"type": "subscribe", "topics": ["assignee:me"]})
+        realtime.handle_client_message(scoped_client, {"type": "unsubscribe", "topics": ["assignee:me"]})
+        await settle()
+        assert scoped.sent == [
+            {"type": "subscribed", "topics": []},
+            {"type": "subscribed", "topics": [f"project:{watched}"]},
+            {"type": "error", "detail": "Invalid topic: kind:nope"},
+            {"type": "error", "detail": "Invalid topic: assignee:bob"},
+            {"type": "subscribed", "topics": ["assignee:ana", f"project:{watched}"]},
+            {"type": "subscribed", "topics": [f"project:{watched}"]},
+        ]
+        scoped.sent.clear()
+        fake_socket.sent.clear()
+
+        await client.patch(f"/api/projects/{other}", json={"description": "not watched"})
+        await settle()
+        assert scoped.sent == []
+        assert without_seq(fake_socket.sent) == [realtime.refresh_message("projects")]
+
+        await client.patch(f"/api/projects/{watched}", json={"description": "watched"})
+        await settle()
+        assert without_seq(scoped.sent) == [realtime.refresh_message("projects")]
+    finally:
+        realtime.unregister(scoped)
+    assert all(scoped_client not in clients for clients in realtime.subscriptions.values())
+
+
+@pytest.mark.anyio
+async def test_delta_clients_get_rows_and_tombstones(client, fake_socket):
+    delta = FakeSocket()
+    await realtime.register(delta, deltas=True, user=USER)
+    try:
+        resp = await client.post(
+            "/api/projects/",
+            json={"project_name": "Billing", "name_abbreviation": "BILL", "sponsor": "CFO Office"},
+        )
+        project = resp.json()
+        await settle()
+        assert without_seq(fake_socket.sent) == [realtime.refresh_message("projects")]
+        [message] = without_seq(delta.sent)
+        assert message["type"] == "delta"
+        assert message["entities"] == ["projects"]
+        [change] = message["changes"]
+        assert change["kind"] == "projects"
+        assert change["id"] == project["project_id"]
+        assert change["version"] >= 1
+        assert change["row"] == project
+        delta.sent.clear()
+
+        await client.delete(f"/api/projects/{project['project_id']}")
+        await settle()
+        assert delta.sent[-1]["changes"][-1] == {
+            "kind": "projects",
+            "id": project["project_id"],
+            "version": change["version"] + 1,
+            "deleted": True,
+        }
+    finally:
+        realtime.unregister(delta)
+
+
+@pytest.mark.anyio
+async def test_resume_replays_missed_events_or_asks_for_resync(client, fake_socket, monkeypatch):
+    monkeypatch.setattr(realtime, "_history", deque(maxlen=2))
+    for name, abbreviation in (("Billing", "BILL"), ("Payroll", "PAYR"), ("Ledger", "LEDG")):
+        await client.post(
+            "/api/projects/",
+            json={"project_name": name, "name_abbreviation": abbreviation, "sponsor": "CFO Office"},
+        )
+        await settle()
+    seqs = [message["seq"] for message in fake_socket.sent]
+    assert len(seqs) == 3
+
+    ws = FakeSocket()
+    resumed = await realtime.register(ws, user=USER)
+    try:
+        realtime.handle_client_message(resumed, {"type": "resume"})
+        await settle()
+        [hello] = ws.sent
+        assert hello["type"] == "resumed"
+        assert hello["seq"] == seqs[-1]
+        stream = hello["stream"]
+        ws.sent.clear()
+
+        realtime.handle_client_message(resumed, {"type": "resume", "stream": stream, "last_seq": seqs[0]})
+        await settle()
+        assert ws.sent == fake_socket.sent[1:] + [
+            {"type": "resumed", "stream": stream, "seq": seqs[-1], "replayed": 2}
+        ]
+        ws.sent.clear()
+
+        # seqs[0] itself has already left the two-event buffer.
+        realtime.handle_client_message(resumed, {"type": "resume", "stream": stream, "last_seq": seqs[0] - 1})
+        realtime.handle_client_message(resumed, {"type": "resume", "stream": "restarted", "last_seq": seqs[-1]})
+        await settle()
+        assert ws.sent == [
+            {"type": "resync", "stream": stream, "seq": seqs[-1], "reason": "gap"},
+            {"type": "resync", "stream": stream, "seq": seqs[-1], "reason": "stream"},
+        ]
+    finally:
+        realtime.unregister(ws)
+
+
+@pytest.mark.anyio
+async def test_anonymous_socket_gets_neither_deltas_nor_replay(client, fake_socket):
+    await client.post(
+        "/api/projects/",
+        json={
+            "project_name": "Billing",
+            "name_abbreviation": "BILL",
+            "sponsor": "CFO Office",
+            "description": "Confidential",
+        },
+    )
+    await settle()
+    assert realtime._history
+
+    anonymous = FakeSocket()
+    anonymous_client = await realtime.register(anonymous, deltas=True)
+    try:
+        realtime.handle_client_message(anonymous_client, {"type": "resume", "last_seq": 0})
+        realtime.handle_client_message(anonymous_client, {"type": "subscribe", "topics": ["assignee:me"]})
+        await client.post("/api/projects/", json={"project_name": "Payroll", "name_abbreviation": "PAYR", "sponsor": "CFO Office"})
+        await settle()
+        assert anonymous.sent[:2] == [{"type": "error", "detail": "Not authenticated"}] * 2
+        assert [message["type"] for message in anonymous.sent[2:]] == ["refresh"]
+        assert "Confidential" not in str(anonymous.sent)
+    finally:
+        realtime.unregister(anonymous)
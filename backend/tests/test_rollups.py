@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+
+import pytest
+
+from backend.app.models import Phase, ProjectRollup, SolutionRollup
+from backend.app.rollups import rebuild_rollups
+
+
+def seed_phases(SessionLocal):
+    with SessionLocal() as session:
+        session.add_all(
+            [
+                Phase(
+                    phase_id="backlog",
+                    phase_group="Backlog",
+                    phase_name="Backlog",
+                    sequence=1,
+                ),
+                Phase(
+                    phase_id="requirements",
+                    phase_group="Planning",
+                    phase_name="Requirements",
+                    sequence=2,
+                ),
+            ]
+        )
+        session.commit()
+
+
+async def create_project_solution(client):
+    project = (
+        await client.post(
+        "/api/projects/",
+        json={
+            "project_name": "Data Platform",
+            "name_abbreviation": "DPLT",
+            "description": "Modernize data stack",
+            "sponsor": "CFO Office",
+        },
+        )
+    ).json()
+    solution = (
+        await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={"solution_name": "Access Controls", "version": "0.1.0", "owner": "Solution Owner"},
+        )
+    ).json()
+    return project, solution
+
+
+@pytest.mark.anyio
+async def test_rollups_follow_every_write_and_rebuild(client, db_sessionmaker):
+    seed_phases(db_sessionmaker)
+    project, solution = await create_project_solution(client)
+    sid = solution["solution_id"]
+    today = date.today()
+    tasks = {}
+    for name, status, due in (
+        ("Late", "in_progress", today - timedelta(days=2)),
+        ("Soon", "to_do", today + timedelta(days=5)),
+        ("Done", "complete", today - timedelta(days=9)),
+    ):
+        resp = await client.post(
+            f"/api/solutions/{sid}/subcomponents",
+            json={"subcomponent_name": name, "status": status, "due_date": due.isoformat(), "assignee": "A"},
+        )
+        assert resp.status_code == 201, resp.text
+        tasks[name] = resp.json()["subcomponent_id"]
+
+    health = (await client.get(f"/api/solutions/{sid}/health")).json()
+    assert health["subcomponent_count"] == 3
+    assert (health["to_do_count"], health["in_progress_count"], health["complete_count"]) == (1, 1, 1)
+    assert health["overdue_count"] == 1
+    assert health["next_due_date"] == (today + timedelta(days=5)).isoformat()
+
+    project_health = (await client.get(f"/api/projects/{project['project_id']}/health")).json()
+    assert project_health["rag_status"] == "amber"
+    assert (project_health["solution_count"], project_health["overdue_count"]) == (1, 1)
+
+    await client.patch(f"/api/subcomponents/{tasks['Late']}", json={"status": "complete"})
+    await client.delete(f"/api/subcomponents/{tasks['Soon']}")
+    await client.patch(f"/api/solutions/{sid}", json={"rag_status": "red", "rag_reason": "Vendor slipped"})
+    with db_sessionmaker() as session:
+        stored = session.get(SolutionRollup, sid)
+        assert (stored.subcomponent_count, stored.complete_count, stored.overdue_count) == (2, 2, 0)
+        assert stored.next_due_date is None
+        assert session.get(ProjectRollup, project["project_id"]).rag_status.value == "red"
+
+        session.query(SolutionRollup).delete()
+        session.commit()
+        assert rebuild_rollups(session) == {"solutions": 1, "projects": 1}
+        assert session.get(SolutionRollup, sid).complete_count == 2
+
+    portfolio = (await client.get("/api/dashboard/health")).json()
+    assert [row["project_id"] for row in portfolio] == [project["project_id"]]
+
+    await client.delete(f"/api/solutions/{sid}")
+    assert (await client.get(f"/api/solutions/{sid}/health")).status_code == 404
+    project_health = (await client.get(f"/api/projects/{project['project_id']}/health")).json()
+    assert (project_health["solution_count"], project_health["rag_status"]) == (0, None)
@@ -0,0 +1,72 @@
+import pytest
+
+from backend.app.search import rebuild_search_index
+
+
+@pytest.mark.anyio
+async def test_search_ranks_prefix_matches_and_follows_writes(client, db_sessionmaker):
+    project = (
+        await client.post(
+            "/api/projects/",
+            json={
+                "project_name": "Warehouse Revamp",
+                "name_abbreviation": "WHRV",
+                "description": "Move reporting off the legacy warehouse",
+                "sponsor": "CFO Office",
+            },
+        )
+    ).json()
+    base = f"/api/projects/{project['project_id']}/solutions"
+    solution = (
+        await client.post(
+            base,
+            json={"solution_name": "Access Controls", "version": "1.0", "owner": "Ana", "blockers": "Waiting on vendor"},
+        )
+    ).json()
+    other = (
+        await client.post(
+            base,
+            json={"solution_name": "Vendor Onboarding", "version": "1.0", "owner": "Ana", "risks": "Warehouse quota"},
+        )
+    ).json()
+    task = (
+        await client.post(
+            f"/api/solutions/{solution['solution_id']}/subcomponents",
+            json={"subcomponent_name": "Define RBAC roles", "assignee": "Raj"},
+        )
+    ).json()
+
+    hits = (await client.get("/api/search", params={"q": "vend"})).json()
+    # A name match outranks the same word in blockers.
+    assert [(hit["kind"], hit["id"]) for hit in hits] == [
+        ("solutions", other["solution_id"]),
+        ("solutions", solution["solution_id"]),
+    ]
+    assert "[vendor]" in hits[1]["snippet"].lower()
+
+    hits = (await client.get("/api/search", params={"q": "rbac rol"})).json()
+    assert [(hit["kind"], hit["id"], hit["solution_id"]) for hit in hits] == [
+        ("subcomponents", task["subcomponent_id"], solution["solution_id"])
+    ]
+
+    first = await client.get("/api/search", params={"q": "warehouse", "limit": 1})
+    second = await client.get(
+        "/api/search", params={"q": "warehouse", "limit": 1, "cursor": first.headers["X-Next-Cursor"]}
+    )
+    assert first.json()[0]["kind"] == "projects"
+    assert second.json()[0]["id"] == other["solution_id"]
+    assert "X-Next-Cursor" not in second.headers
+    only = (await client.get("/api/search", params={"q": "warehouse", "kind": "solutions"})).json()
+    assert [hit["id"] for hit in only] == [other["solution_id"]]
+
+    await client.patch(f"/api/solutions/{other['solution_id']}", json={"solution_name": "Supplier Onboarding"})
+    await client.delete(f"/api/solutions/{solution['solution_id']}")
+    assert (await client.get("/api/search", params={"q": "vend"})).json() == []
+    assert len((await client.get("/api/search", params={"q": "supplier"})).json()) == 1
+
+    with db_sessionmaker() as session:
+        assert rebuild_search_index(session) == {"projects": 1, "solutions": 1, "subcomponents": 1}
+    assert len((await client.get("/api/search", params={"q": "supplier"})).json()) == 1
+
+    assert (await client.get("/api/search", params={"q": 'NEAR("x'})).status_code == 200
+    assert (await client.get("/api/search", params={"q": "***"})).status_code == 400
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, timedelta
 
 import pytest
@@ -18,6 +19,7 @@ async def create_project(client):
 
 
 @pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
 async def test_create_and_list_solutions(client):
     project = await create_project(client)
 
@@ -206,3 +208,135 @@ async def test_solution_rag_manual_override_and_reset(client):
     assert reset["rag_source"] == "auto"
     assert reset["rag_status"] == "red"
     assert reset["rag_reason"] is None
+
+
+@pytest.mark.anyio
+async def test_list_fast_path_matches_the_read_schema(client, monkeypatch):
+    from backend.app import serialization
+
+    project = await create_project(client)
+    solution = (
+        await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={
+                "solution_name": "Access Controls",
+                "version": "0.1.0",
+                "owner": "Solution Owner",
+                "assignee": "Ana",
+                "due_date": str(date.today() + timedelta(days=3)),
+                "blockers": "Waiting on IAM — “quoted”",
+            },
+        )
+    ).json()
+    await client.patch(f"/api/solutions/{solution['solution_id']}", json={"status": "complete"})
+    detail = (await client.get(f"/api/solutions/{solution['solution_id']}")).json()
+    assert detail["completed_at"] is not None
+
+    scoped = await client.get(f"/api/projects/{project['project_id']}/solutions")
+    assert scoped.json() == [detail]
+    listed = await client.get("/api/solutions")
+    assert listed.json() == [detail]
+
+    # Without orjson the stdlib encoder produces the same document.
+    monkeypatch.setattr(serialization, "orjson", None)
+    fallback = await client.get(f"/api/projects/{project['project_id']}/solutions")
+    assert fallback.json() == [detail]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
+async def test_list_fields_and_summary_view_skip_unrequested_columns(client, db_sessionmaker):
+    from sqlalchemy import event
+
+    project = await create_project(client)
+    await client.post(
+        f"/api/projects/{project['project_id']}/solutions",
+        json={"solution_name": "Access Controls", "version": "0.1.0", "owner": "Owner", "risks": "Long text"},
+    )
+    statements = []
+    engine = db_sessionmaker.kw["bind"]
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM solutions" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        summary = (await client.get("/api/solutions", params={"view": "summary"})).json()
+        sparse = (
+            await client.get(
+                f"/api/projects/{project['project_id']}/solutions",
+                params={"fields": "solution_name, status"},
+            )
+        ).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert "risks" not in summary[0] and "description" not in summary[0]
+    assert summary[0]["owner"] == "Owner"
+    assert sparse == [
+        {"solution_id": summary[0]["solution_id"], "solution_name": "Access Controls", "status": "not_started"}
+    ]
+    assert statements and not any("risks" in sql or "description" in sql for sql in statements)
+
+    resp = await client.get("/api/solutions", params={"fields": "solution_name,secret"})
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Unknown field(s): secret"
+
+
+@pytest.mark.anyio
+async def test_auto_rag_scheduler_turns_passed_due_dates_red(client, db_sessionmaker, monkeypatch):
+    from backend.app.rag_scheduler import AUTO_RAG_USER_ID, apply_auto_rag, scheduler
+
+    project = await create_project(client)
+    today = date.today()
+    clock = [today]
+    monkeypatch.setattr(scheduler, "today", lambda: clock[0])
+
+    async def create(name, due, **extra):
+        resp = await client.post(
+            f"/api/projects/{project['project_id']}/solutions",
+            json={"solution_name": name, "version": "1.0", "owner": "Ana", "due_date": due.isoformat(), **extra},
+        )
+        assert resp.json()["rag_status"] == "amber"
+        return resp.json()["solution_id"]
+
+    stale = await create("Billing", today + timedelta(days=1))
+    await create("Manual", today + timedelta(days=1), rag_status="amber", rag_reason="Agreed slip")
+    version = (await client.get("/api/changes", params={"since": 0})).json()["version"]
+
+    clock[0] = today + timedelta(days=3)
+    await scheduler.start(db_sessionmaker)  # startup recompute catches the one that went stale
+    try:
+        assert (await client.get(f"/api/solutions/{stale}")).json()["rag_status"] == "red"
+        audit = (await client.get("/api/audit", params={"entity_id": stale, "user_id": AUTO_RAG_USER_ID})).json()
+        assert [(row["field"], row["old_value"], row["new_value"]) for row in audit] == [("rag_status", "amber", "red")]
+        assert (await client.get("/api/changes", params={"since": version})).json()["solutions"][0][
+            "solution_id"
+        ] == stale
+        assert (await client.get(f"/api/projects/{project['project_id']}/health")).json()["rag_status"] == "red"
+
+        later = await create("Ledger", today + timedelta(days=5))
+        await asyncio.sleep(0)  # the commit hook queues the due date on the loop
+        assert scheduler.stats()["next_due_date"] == (today + timedelta(days=5)).isoformat()
+        assert await scheduler.run_due() == 0
+
+        clock[0] = today + timedelta(days=6)
+
+        def locked(day):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(scheduler, "_apply", locked)
+        with pytest.raises(RuntimeError):
+            await scheduler.run_due()
+        # A failed pass keeps its dates queued, so the retry still applies them.
+        assert scheduler.stats()["next_due_date"] == (today + timedelta(days=5)).isoformat()
+        monkeypatch.undo()
+        monkeypatch.setattr(scheduler, "today", lambda: clock[0])
+        assert await scheduler.run_due() == 1
+        assert (await client.get(f"/api/solutions/{later}")).json()["rag_status"] == "red"
+        assert scheduler.stats()["queued_dates"] == 0
+        with db_sessionmaker() as session:
+            assert apply_auto_rag(session, clock[0], full=True) == 0
+    finally:
+        await scheduler.stop()
@@ -61,6 +61,7 @@ async def enable_phases(client, solution_id: str):
 
 
 @pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
 async def test_create_and_list_subcomponents(client, db_sessionmaker):
     seed_phases(db_sessionmaker)
     _, solution = await create_project_solution(client)
@@ -88,6 +89,7 @@ async def test_create_and_list_subcomponents(client, db_sessionmaker):
 
 
 @pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
 async def test_list_all_subcomponents_filter_by_assignee(client, db_sessionmaker):
     seed_phases(db_sessionmaker)
     _, solution = await create_project_solution(client)
@@ -139,3 +141,42 @@ async def test_subcomponent_uniqueness_and_soft_delete(client, db_sessionmaker):
     list_resp = await client.get(f"/api/solutions/{solution['solution_id']}/subcomponents")
     assert list_resp.status_code == 200
     assert list_resp.json() == []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_session", ["threaded", "async"], indirect=True)
+async def test_list_subcomponents_keyset_pagination(client, db_sessionmaker):
+    seed_phases(db_sessionmaker)
+    _, solution = await create_project_solution(client)
+    for idx, priority in enumerate([3, 1, 3, 2, 1]):
+        resp = await client.post(
+            f"/api/solutions/{solution['solution_id']}/subcomponents",
+            json={"subcomponent_name": f"Task {idx}", "priority": priority, "assignee": "Engineer A"},
+        )
+        assert resp.status_code == 201, resp.text
+
+    for path in ("/api/subcomponents", f"/api/solutions/{solution['solution_id']}/subcomponents"):
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            resp = await client.get(path, params=params)
+            assert resp.status_code == 200, resp.text
+            seen.extend(resp.json())
+            pages += 1
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        assert pages == 3
+        assert [item["priority"] for item in seen] == [1, 1, 2, 3, 3]
+        assert len({item["subcomponent_id"] for item in seen}) == 5
+
+    everything = await client.get("/api/subcomponents", params={"limit": 2, "paginate": "false"})
+    assert len(everything.json()) == 5
+    assert "X-Next-Cursor" not in everything.headers
+
+    bad = await client.get("/api/subcomponents", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
@@ -61,6 +61,7 @@ const state = {
   theme: "dark",
   loading: false,
   pendingRefresh: false,
+  dataVersion: null, // server data version the lists above reflect; null until the first full load
 };
 
 let liveSyncStarted = false;
@@ -92,30 +93,32 @@ async function refreshFromServer(entity = "all") {
 
   refreshInFlight = true;
   try {
-    if (ent === "projects") {
-      state.projects = await api("/projects");
+    let target = ent;
+    if (ent !== "phases" && state.dataVersion !== null) {
+      target = (await applyServerChanges()) ? "delta" : "all";
+    }
+    if (target === "delta") {
+      populateSelects();
+    } else if (target === "projects") {
+      state.projects = await apiList("/projects");
       populateSelects();
-    } else if (ent === "solutions") {
-      state.solutions = await api("/solutions");
+    } else if (target === "solutions") {
+      state.solutions = await apiList("/solutions");
       populateSelects();
-    } else if (ent === "subcomponents") {
-      state.subcomponents = await api("/subcomponents");
-    } else if (ent === "phases") {
+    } else if (target === "subcomponents") {
+      state.subcomponents = await apiList("/subcomponents");
+    } else if (target === "phases") {
       state.phases = await api("/phases");
       state.solutionPhases = {};
       populateSelects();
     } else {
-      const [phases, projects, solutions, subcomponents] = await Promise.all([
-        api("/phases"),
-        api("/projects"),
-        api("/solutions"),
-        api("/subcomponents"),
-      ]);
+      const { version, phases, projects, solutions, subcomponents } = await api("/bootstrap");
       state.phases = phases;
       state.projects = projects;
       state.solutions = solutions;
       state.subcomponents = subcomponents;
       state.solutionPhases = {};
+      state.dataVersion = version;
       populateSelects();
     }
 
@@ -188,7 +191,7 @@ function showAuthError(message) {
   }
 }
 
-async function api(path, options = {}) {
+async function apiResponse(path, options = {}) {
   const headers = { ...(options.headers || {}) };
   const isFormData = options.body instanceof FormData;
   if (!isFormData && options.body && !headers["Content-Type"]) {
@@ -211,7 +214,25 @@ async function api(path, options = {}) {
     err.status = res.status;
     throw err;
   }
-  return data;
+  return { data, headers: res.headers };
+}
+
+async function api(path, options = {}) {
+  return (await apiResponse(path, options)).data;
+}
+
+// List endpoints are keyset-paginated; follow X-Next-Cursor until the last page.
+async function apiList(path) {
+  const items = [];
+  let cursor = null;
+  do {
+    const sep = path.includes("?") ? "&" : "?";
+    const url = cursor ? `${path}${sep}cursor=${encodeURIComponent(cursor)}` : path;
+    const { data, headers } = await apiResponse(url);
+    items.push(...(data || []));
+    cursor = headers.get("X-Next-Cursor");
+  } while (cursor);
+  return items;
 }
 
 function handleAuthError(err) {
@@ -337,18 +358,15 @@ async function loadData() {
   state.loading = true;
   try {
     setStatus("Loading...", "warn");
-    const [phases, projects, solutions, subcomponents] = await Promise.all([
-      api("/phases"),
-      api("/projects"),
-      api("/solutions"),
-      api("/subcomponents"),
-    ]);
+    // One consistent snapshot of every list plus the data version it reflects.
+    const { version, phases, projects, solutions, subcomponents } = await api("/bootstrap");
 
     state.phases = phases;
     state.projects = projects;
     state.solutions = solutions;
     state.subcomponents = subcomponents;
     state.solutionPhases = {};
+    state.dataVersion = version;
     populateSelects();
 
     if (!state.projects.length && !state.solutions.length) {
@@ -427,6 +445,65 @@ function upsertById(list, item, idKey) {
   else list[idx] = item;
 }
 
+function removeByIds(list, ids, idKey) {
+  if (!ids || !ids.length) return list;
+  const gone = new Set(ids);
+  return list.filter((row) => !gone.has(row[idKey]));
+}
+
+// Pull rows changed since `state.dataVersion` and patch state in place.
+// Returns false when the server asks for a full reload instead.
+async function applyServerChanges() {
+  const changes = await api(`/changes?since=${state.dataVersion}`);
+  if (changes.resync_required) return false;
+  changes.projects.forEach((item) => upsertById(state.projects, item, "project_id"));
+  changes.solutions.forEach((item) => upsertById(state.solutions, item, "solution_id"));
+  changes.subcomponents.forEach((item) => upsertById(state.subcomponents, item, "subcomponent_id"));
+  state.projects = removeByIds(state.projects, changes.deleted.projects, "project_id");
+  state.solutions = removeByIds(state.solutions, changes.deleted.solutions, "solution_id");
+  state.subcomponents = removeByIds(state.subcomponents, changes.deleted.subcomponents, "subcomponent_id");
+  changes.solution_phases.forEach((item) => {
+    delete state.solutionPhases[item.solution_id];
+  });
+  state.dataVersion = changes.version;
+  return true;
+}
+
+const DELTA_KEYS = {
+  projects: "project_id",
+  solutions: "solution_id",
+  subcomponents: "subcomponent_id",
+};
+
+// Patch state from a live-sync delta message (rows and tombstones pushed by the server).
+function applyLiveDelta(msg) {
+  if (!state.authed) return;
+  // Our own saves come back as deltas too (idempotent upserts), not as the refresh they were marked for.
+  (msg.entities || []).forEach((ent) => ignoreNextRefresh.delete(ent));
+  if (state.loading || refreshInFlight) {
+    // A reload is reading lists right now; let it catch up through /changes afterwards.
+    (msg.entities || ["all"]).forEach((ent) => pendingRefreshEntities.add(ent));
+    return;
+  }
+  const selectedProjectId = els.projectForm?.querySelector('[name="project_id"]')?.value || "";
+  const selectedSolutionId = els.solutionForm?.querySelector('[name="solution_id"]')?.value || "";
+  const selectedSubcomponentId = els.subcomponentForm?.querySelector('[name="subcomponent_id"]')?.value || "";
+  (msg.changes || []).forEach((change) => {
+    if (change.kind === "solution_phases") {
+      if (change.row) delete state.solutionPhases[change.row.solution_id];
+      else state.solutionPhases = {};
+      return;
+    }
+    const idKey = DELTA_KEYS[change.kind];
+    if (!idKey) return;
+    if (change.deleted) state[change.kind] = removeByIds(state[change.kind], [change.id], idKey);
+    else upsertById(state[change.kind], change.row, idKey);
+  });
+  populateSelects();
+  renderActiveView();
+  restoreSelections(selectedProjectId, selectedSolutionId, selectedSubcomponentId);
+}
+
 function renderActiveView() {
   switch (state.currentView) {
     case "master":
@@ -459,12 +536,15 @@ function renderActiveView() {
 
 function liveUrl() {
   const protocol = location.protocol === "https:" ? "wss" : "ws";
-  return `${protocol}://${location.host}/api/ws`;
+  return `${protocol}://${location.host}/api/ws?format=delta`;
 }
 
 function initLiveSync() {
   let socket;
   let backoff = 1000;
+  // Position in the server's event stream, so a reconnect can resume instead of reloading.
+  let stream = null;
+  let lastSeq = null;
 
   const connect = () => {
     socket = new WebSocket(liveUrl());
@@ -472,13 +552,24 @@ function initLiveSync() {
     socket.addEventListener("open", () => {
       backoff = 1000;
       setStatus("Online", "positive");
+      const resume = lastSeq === null ? { type: "resume" } : { type: "resume", stream, last_seq: lastSeq };
+      socket.send(JSON.stringify(resume));
     });
 
     socket.addEventListener("message", (event) => {
       try {
         const msg = JSON.parse(event.data);
-        if (msg.type === "refresh") {
+        if (typeof msg.seq === "number") lastSeq = msg.seq;
+        if (msg.type === "resumed" || msg.type === "resync") stream = msg.stream;
+        if (msg.type === "ping") {
+          socket.send(JSON.stringify({ type: "pong" }));
+        } else if (msg.type === "delta") {
+          applyLiveDelta(msg);
+        } else if (msg.type === "refresh") {
           refreshFromServer(msg.entity || "all");
+        } else if (msg.type === "resync") {
+          // Missed more than the server kept (or it restarted): catch up via /changes or a full load.
+          refreshFromServer("all");
         }
       } catch (err) {
         console.warn("Live message parse failed", err);
@@ -743,31 +834,61 @@ function renderMasterTable() {
   els.masterTable.innerHTML = html;
 }
 
-function renderDashboard() {
-  if (!els.dashboardCards) return;
-  const solutions = filteredSolutions();
-  const overdue = solutions.filter((s) => s.due_date && new Date(s.due_date) < new Date() && s.status !== "complete");
-  const active = solutions.filter((s) => s.status === "active").length;
-  const complete = solutions.filter((s) => s.status === "complete").length;
-  const onHold = solutions.filter((s) => s.status === "on_hold").length;
-  const noDue = solutions.filter((s) => !s.due_date).length;
-  const avgPriority = solutions.length
-    ? (solutions.reduce((acc, s) => acc + (s.priority ?? 0), 0) / solutions.length).toFixed(1)
-    : "–";
+// Filters GET /dashboard/summary understands; priority (≤) and text search only narrow the tables.
+function dashboardQuery() {
+  const f = state.filters || {};
+  const params = new URLSearchParams();
+  if (f.status) params.set("status", f.status);
+  if (f.project_id) params.set("project_id", f.project_id);
+  if (f.owner) params.set("owner", f.owner);
+  if (f.assignee) params.set("assignee", f.assignee);
+  if (f.current_phase) params.set("phase", f.current_phase);
+  const query = params.toString();
+  return query ? `?${query}` : "";
+}
+
+function countFor(entries, value) {
+  return (entries || []).find((e) => e.value === value)?.count || 0;
+}
+
+// Counts come from the server (SQL GROUP BY, cached per data version, revalidated by ETag) instead of
+// binning every loaded row; a response that arrives after a newer render started is dropped.
+let dashboardRequest = 0;
+
+async function renderDashboardCards() {
+  const request = ++dashboardRequest;
+  let summary;
+  try {
+    summary = await api(`/dashboard/summary${dashboardQuery()}`);
+  } catch (err) {
+    if (!handleAuthError(err)) console.warn("Dashboard summary failed", err);
+    return;
+  }
+  if (request !== dashboardRequest || !els.dashboardCards) return;
+  const sol = summary.solutions;
   const cards = [
-    { title: "Projects", value: state.projects.length },
-    { title: "Solutions", value: state.solutions.length },
-    { title: "Subcomponents", value: state.subcomponents.length },
-    { title: "Overdue", value: overdue.length, meta: "Due date past" },
-    { title: "Active", value: active },
-    { title: "Complete", value: complete },
-    { title: "On Hold", value: onHold },
-    { title: "No Due Date", value: noDue },
-    { title: "Avg Priority", value: avgPriority },
+    { title: "Projects", value: summary.projects.total },
+    { title: "Solutions", value: sol.total },
+    { title: "Subcomponents", value: summary.subcomponents.total },
+    { title: "Overdue", value: sol.overdue, meta: "Due date past" },
+    { title: "Active", value: countFor(sol.by_status, "active") },
+    { title: "Complete", value: countFor(sol.by_status, "complete") },
+    { title: "On Hold", value: countFor(sol.by_status, "on_hold") },
+    { title: "No Due Date", value: sol.no_due_date },
+    { title: "Avg Priority", value: sol.avg_priority === null ? "–" : sol.avg_priority.toFixed(1) },
   ];
   els.dashboardCards.innerHTML = cards
     .map((c) => `<div class="card"><h3>${c.title}</h3><div class="value">${c.value}</div><div class="meta">${c.meta || ""}</div></div>`)
     .join("");
+}
+
+function renderDashboard() {
+  if (!els.dashboardCards) return;
+  renderDashboardCards();
+  const solutions = filteredSolutions();
+  const overdue = solutions.filter(
+    (s) => s.due_date && new Date(s.due_date) < new Date() && !["complete", "abandoned"].includes(s.status)
+  );
   if (els.projectsSummary) {
     if (!state.projects.length) {
       els.projectsSummary.innerHTML = "<h3>Projects</h3><p class='muted'>No data</p>";
@@ -1290,26 +1411,51 @@ function renderSolutionCards(cards) {
     .join("");
 }
 
-function renderCalendar() {
+// GET /calendar buckets due dates server-side; the view shows CALENDAR_DAYS days from a little in the past
+// (the endpoint's default limit is 400). Phase, priority and search filters are not sent: it has none.
+const CALENDAR_PAST_DAYS = 30;
+const CALENDAR_DAYS = 400;
+const CALENDAR_TOP = 50;
+let calendarRequest = 0;
+
+function isoDay(date) {
+  const pad = (n) => String(n).padStart(2, "0");
+  return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())}`;
+}
+
+async function renderCalendar() {
   if (!els.calendarGrid) return;
-  const byDay = {};
-  filteredSolutions().forEach((s) => {
-    if (!s.due_date) return;
-    byDay[s.due_date] = byDay[s.due_date] || [];
-    byDay[s.due_date].push(s);
-  });
-  const entries = Object.entries(byDay).sort(([a], [b]) => new Date(a) - new Date(b));
-  if (!entries.length) {
+  const request = ++calendarRequest;
+  const f = state.filters || {};
+  const start = new Date();
+  start.setDate(start.getDate() - CALENDAR_PAST_DAYS);
+  const end = new Date(start);
+  end.setDate(end.getDate() + CALENDAR_DAYS - 1);
+  const params = new URLSearchParams({ from: isoDay(start), to: isoDay(end), kind: "solutions", top: CALENDAR_TOP });
+  if (f.status) params.set("status", f.status);
+  if (f.project_id) params.set("project_id", f.project_id);
+  if (f.owner) params.set("owner", f.owner);
+  if (f.assignee) params.set("assignee", f.assignee);
+  let calendar;
+  try {
+    calendar = await api(`/calendar?${params}`);
+  } catch (err) {
+    if (!handleAuthError(err)) console.warn("Calendar load failed", err);
+    return;
+  }
+  if (request !== calendarRequest) return;
+  if (!calendar.buckets.length) {
     els.calendarGrid.innerHTML = "<p class='muted'>No due dates</p>";
     return;
   }
-  let html = "";
-  entries.forEach(([day, items]) => {
-    html += `<div class="calendar-day"><strong>${day}</strong>${items
-      .map((i) => `<div>${i.solution_name} (${formatStatus(i.status)}) • Owner ${i.owner || "—"} • Assignee ${i.assignee || "—"}</div>`)
-      .join("")}</div>`;
-  });
-  els.calendarGrid.innerHTML = html;
+  els.calendarGrid.innerHTML = calendar.buckets
+    .map(({ start: day, solutions }) => {
+      const more = solutions.count - solutions.items.length;
+      return `<div class="calendar-day"><strong>${day}</strong>${solutions.items
+        .map((i) => `<div>${i.solution_name} (${formatStatus(i.status)}) • Owner ${i.owner || "—"} • Assignee ${i.assignee || "—"}</div>`)
+        .join("")}${more > 0 ? `<div class="muted">+${more} more</div>` : ""}</div>`;
+    })
+    .join("");
 }
 
 async function downloadCsv(kind, filename, resultEl) {